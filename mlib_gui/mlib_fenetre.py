@@ -29,6 +29,11 @@ from mlib_raycast import *
 from mlib_structure_plus import *
 # Importer time_ns pour le calcul du delta time
 from time import time_ns
+# Importer NumPy si possible, pour accéder aux images en mode sans affichage
+try:
+    import numpy
+except ImportError:
+    numpy = 0
 
 #******************
 #
@@ -39,12 +44,16 @@ from time import time_ns
 class Fenetre(Structure_Plus) :
     """Classe représentant une fenêtre MLib"""
     
-    def __init__(self, largeur: int, hauteur: int) -> None:
+    def __init__(self, largeur: int, hauteur: int, sans_affichage: bool = False) -> None:
         """Constructeur de "Fenetre"
 
+        En mode sans affichage, le rendu est fait dans une surface hors écran (avec le pilote vidéo "dummy" de SDL),
+        sans ouvrir de fenêtre, et chaque image peut être lue avec "image_numpy".
+
         Arguments:
             largeur (int): Largeur de la fenêtre
             hauteur (int): Hauteur de la fenêtre
+            sans_affichage (bool, optional): si la fenêtre est rendue sans affichage. Defaults to False.
         """
         super().__init__()
 
@@ -57,12 +66,20 @@ class Fenetre(Structure_Plus) :
         self.__enfants = []
         self.__evenements = 0
         self.__frame_depuis_dernier_fps = 0
+        self.__image = 0
         self.__largeur = largeur
+        self.__rendu_complet = True
+        self.__sans_affichage = sans_affichage
         self.__temps_depuis_dernier_fps = 0
 
         # Mise en place de Pygame
-        pygame.init()
-        self.__ecran = pygame.display.set_mode((largeur, hauteur))
+        initialiser_pygame(sans_affichage)
+        if not sans_affichage: self.__ecran = pygame.display.set_mode((largeur, hauteur))
+        elif numpy != 0:
+            # Rendre directement dans un tableau NumPy, lu sans copie par "image_numpy"
+            self.__image = numpy.zeros((hauteur, largeur, 4), dtype=numpy.uint8)
+            self.__ecran = pygame.image.frombuffer(self.__image, (largeur, hauteur), "RGBX")
+        else: self.__ecran = pygame.Surface((largeur, hauteur), 0, 32)
 
     def __del__(self) -> None:
         """Destructeur de "Fenetre"""
@@ -136,20 +153,68 @@ class Fenetre(Structure_Plus) :
             elif evenement.type == pygame.QUIT:
                 # On repère l'évènement pour quitter le programme
                 self.__continue = False
+            elif evenement.type == pygame.VIDEOEXPOSE or evenement.type == pygame.WINDOWEXPOSED:
+                # La fenêtre doit être entièrement redessinée
+                self.__rendu_complet = True
+
+    # Retourne les zones de l'écran à redessiner
+    def __zones_a_redessiner(self) -> list:
+        """Retourne les zones de l'écran à redessiner, sans zones qui se touchent
+
+        Une zone est ajoutée pour l'ancienne et la nouvelle position de chaque enfant modifié.
+
+        Returns:
+            list: zones de l'écran à redessiner (pygame.Rect)
+        """
+        ecran = self.__ecran.get_rect()
+        if self.__rendu_complet: return [ecran]
 
-        # Appliquer les évènements graphiques de base
-        self.__ecran.fill(self.__couleur_arriere_plan)
+        zones = []
+        for enfant in self.__enfants:
+            if not enfant.a_redessiner(): continue
+            for zone in (enfant.rectangle_dernier_rendu(), enfant.rectangle()):
+                if zone == 0: continue
+                zone = zone.clip(ecran)
+                if zone.width <= 0 or zone.height <= 0: continue
 
+                # Fusionner la zone avec les zones qu'elle touche
+                indice = zone.collidelist(zones)
+                while indice != -1:
+                    zone = zone.union(zones.pop(indice))
+                    indice = zone.collidelist(zones)
+                zones.append(zone)
+        return zones
     # Gérer le rendu
     def maj_rendu(self) -> None:
-        """Fonction exécutée pour mettre la fenêtre graphique à jour"""
+        """Fonction exécutée pour mettre la fenêtre graphique à jour
 
-        # Ajoute chaque enfants sur la surface
-        for enfant in self.__enfants:
-            enfant.maj_rendu(self.__ecran)
+        Seules les zones des enfants modifiés depuis la dernière frame sont redessinées et affichées.
+        """
+
+        # Redessiner chaque zone, avec les enfants qui la touchent
+        zones = self.__zones_a_redessiner()
+        for zone in zones:
+            self.__ecran.set_clip(zone)
+            self.__ecran.fill(self.__couleur_arriere_plan)
+            for enfant in self.__enfants:
+                if zone.colliderect(enfant.rectangle()): enfant.maj_rendu(self.__ecran)
+        self.__ecran.set_clip(None)
+        for enfant in self.__enfants: enfant.set_a_redessiner(False)
+        self.__rendu_complet = False
+
+        # On affiche les zones redessinées de l'écran
+        if len(zones) > 0 and not self.__sans_affichage: pygame.display.update(zones)
+
+    # Simule l'appui ou le relâchement d'une touche
+    def injecter_touche(self, touche: str, pressee: bool = True) -> None:
+        """Simule l'appui ou le relâchement d'une touche, comme si elle venait du clavier (utile en mode sans affichage)
 
-        # On affiche l'écran
-        pygame.display.flip()
+        Args:
+            touche (str): touche à simuler (avec les mêmes noms que "touche_pressee")
+            pressee (bool, optional): si la touche est pressée ou relâchée. Defaults to True.
+        """
+        if pressee: self.touches_etats()[touche] = 1
+        else: self.touches_etats().pop(touche, None)
 
     def nouvel_enfant_createur(self, nom: str, type: str) -> Objet:
         """Crée l'enfant, avec le type nécessaire selon "type
@@ -205,4 +270,28 @@ class Fenetre(Structure_Plus) :
     # Getters et setters
     def continuer(self) -> bool:
         """Retourne si la classe continue de marcher"""
-        return self.__continue
\ No newline at end of file
+        return self.__continue
+    def ecran(self) -> pygame.Surface:
+        """Retourne la surface de l'écran de la fenêtre
+
+        Returns:
+            pygame.Surface: surface de l'écran de la fenêtre
+        """
+        return self.__ecran
+    def image_numpy(self) -> "numpy.ndarray":
+        """Retourne la dernière image rendue en mode sans affichage, sans copie
+
+        Le tableau est mis à jour à chaque "maj_rendu" : il doit être copié pour garder une image.
+
+        Returns:
+            numpy.ndarray: image de forme (hauteur, largeur, 3) en RGB (ou 0 sans mode sans affichage ou sans NumPy)
+        """
+        if not self.__sans_affichage or numpy == 0: return 0
+        return self.__image[:, :, :3]
+    def sans_affichage(self) -> bool:
+        """Retourne si la fenêtre est rendue sans affichage
+
+        Returns:
+            bool: si la fenêtre est rendue sans affichage
+        """
+        return self.__sans_affichage
\ No newline at end of file
@@ -49,36 +49,56 @@ class Objet:
         """
         
         # Définition des attributs de base
+        self.__a_redessiner = True
         self.__arriere_plan_texture = 0
         self.__arriere_plan_texture_alignement_horizontal = 1
         self.__arriere_plan_texture_alignement_vertical = 1
         self.__bordure_couleur = (0, 0, 0)
         self.__bordure_largeur = (0, 0, 0, 0)
+        self.__cache_surface = True
         self.__couleur_arriere_plan = (255, 255, 255, 0)
         self.__hauteur = hauteur
         self.__largeur = largeur
         self.__nom = nom
+        self.__rectangle_dernier_rendu = 0
         self.__structure_plus = structure_plus
         self.__surface = 0
+        self.__surface_valide = False
         self.__texture_rotation = 0
         self.__x = x
         self.__y = y
 
+    # Indique que la surface de l'objet doit être recalculée
+    def invalider_surface(self) -> None:
+        """Indique que la surface de l'objet doit être recalculée au prochain rendu
+
+        Doit être appelée à chaque changement d'un état utilisé par "rendu" (les setters de l'objet le font déjà).
+        """
+        self.__surface_valide = False
+        self.__a_redessiner = True
+
     def maj_rendu(self, surface_ecran: pygame.Surface) -> None:
         """Fonction exécutée pour mettre la fenêtre graphique à jour, en y appliquant le rendu de l'objet
 
+        La surface de l'objet est gardée entre les frames, et recalculée seulement si elle a été invalidée
+        (ou à chaque frame si le cache de surface est désactivé).
+
         Args:
             surface_ecran (pygame.Surface): Fenêtre graphique, où le rendu doit être fait
         """
 
-        # Création de la surface de l'objet
-        self.__surface = pygame.Surface((self.__largeur, self.__hauteur), pygame.SRCALPHA)
-        self.__surface.fill(self.__couleur_arriere_plan)
-        # Applique le rendu nécessaire
-        self.rendu(self.__surface)
+        if not self.__cache_surface or not self.__surface_valide:
+            # Création de la surface de l'objet (seulement si sa taille a changé)
+            if self.__surface == 0 or self.__surface.get_size() != (self.__largeur, self.__hauteur):
+                self.__surface = pygame.Surface((self.__largeur, self.__hauteur), pygame.SRCALPHA)
+            self.__surface.fill(self.__couleur_arriere_plan)
+            # Applique le rendu nécessaire
+            self.rendu(self.__surface)
+            self.__surface_valide = True
 
         # Application de la surface sur l'écran pricipal
         surface_ecran.blit(self.__surface, (self.__x, self.__y))
+        self.__rectangle_dernier_rendu = self.rectangle()
 
     def rendu(self, surface_objet: pygame.Surface) -> None:
         """Applique le rendu nécessaire à la surface de l'objet
@@ -95,11 +115,8 @@ class Objet:
 
         # Appliquer la texture d'arrière plan
         if self.arriere_plan_texture() != 0:
-            surface_actuelle = self.arriere_plan_texture().surface()
-
-            # Calcul de la rotation
-            if self.texture_rotation() != 0:
-                surface_actuelle = pygame.transform.rotate(surface_actuelle, self.texture_rotation())
+            # Calcul de la rotation (depuis le cache des rotations de la texture)
+            surface_actuelle = self.arriere_plan_texture().surface_tournee(self.texture_rotation())
             # Calcul des coordonnées
             x_texture = 0
             y_texture = 0
@@ -111,6 +128,13 @@ class Objet:
             surface_objet.blit(surface_actuelle, (x_texture, y_texture, surface_actuelle.get_width(), surface_actuelle.get_height()))
 
     # Getters et setters
+    def a_redessiner(self) -> bool:
+        """Retourne si l'objet a changé depuis son dernier rendu sur l'écran
+
+        Returns:
+            bool: si l'objet a changé depuis son dernier rendu sur l'écran
+        """
+        return self.__a_redessiner
     def arriere_plan_texture(self) -> Texture:
         """Retourne la texture d'arrière plan de l'objet
 
@@ -146,6 +170,13 @@ class Objet:
             tuple: largeur de la bordure
         """
         return self.__bordure_largeur
+    def cache_surface(self) -> bool:
+        """Retourne si la surface de l'objet est gardée entre les frames
+
+        Returns:
+            bool: si la surface de l'objet est gardée entre les frames
+        """
+        return self.__cache_surface
     def hauteur(self) -> int:
         """Retourne la hauteur de l'objet
 
@@ -160,6 +191,27 @@ class Objet:
             int: largeur de l'objet
         """
         return self.__largeur
+    def rectangle(self) -> pygame.Rect:
+        """Retourne le rectangle occupé par l'objet sur l'écran
+
+        Returns:
+            pygame.Rect: rectangle occupé par l'objet sur l'écran
+        """
+        return pygame.Rect(self.__x, self.__y, self.__largeur, self.__hauteur)
+    def rectangle_dernier_rendu(self) -> pygame.Rect:
+        """Retourne le rectangle occupé par l'objet lors de son dernier rendu sur l'écran
+
+        Returns:
+            pygame.Rect: rectangle occupé par l'objet lors de son dernier rendu sur l'écran (ou 0 s'il n'a jamais été rendu)
+        """
+        return self.__rectangle_dernier_rendu
+    def set_a_redessiner(self, nouveau_a_redessiner: bool) -> None:
+        """Modifie si l'objet a changé depuis son dernier rendu sur l'écran
+
+        Args:
+            nouveau_a_redessiner (bool): si l'objet a changé depuis son dernier rendu sur l'écran
+        """
+        self.__a_redessiner = nouveau_a_redessiner
     def set_bordure_couleur(self, nouvelle_bordure_couleur: tuple) -> None:
         """Modifie la couleur de la bordure
 
@@ -168,6 +220,7 @@ class Objet:
         """
         if self.__bordure_couleur != nouvelle_bordure_couleur:
             self.__bordure_couleur = nouvelle_bordure_couleur
+            self.invalider_surface()
     def set_bordure_largeur(self, nouvelle_bordure_largeur: tuple) -> None:
         """Modifie la largeur de la bordure
 
@@ -176,6 +229,7 @@ class Objet:
         """
         if self.__bordure_largeur != nouvelle_bordure_largeur:
             self.__bordure_largeur = nouvelle_bordure_largeur
+            self.invalider_surface()
     def set_bordure_largeur_entier(self, nouvelle_bordure_largeur: int) -> None:
         """Modifie la largeur de la bordure
 
@@ -183,34 +237,52 @@ class Objet:
             nouvelle_bordure_largeur (int) : nouvelle largeur de la bordure
         """
         self.set_bordure_largeur((nouvelle_bordure_largeur, nouvelle_bordure_largeur, nouvelle_bordure_largeur, nouvelle_bordure_largeur))
+    def set_cache_surface(self, nouveau_cache_surface: bool) -> None:
+        """Modifie si la surface de l'objet est gardée entre les frames
+
+        Un objet dont le rendu change sans passer par ses setters (comme un rendu de raycast) doit le désactiver.
+
+        Args:
+            nouveau_cache_surface (bool): si la surface de l'objet est gardée entre les frames
+        """
+        self.__cache_surface = nouveau_cache_surface
     def set_couleur_arriere_plan(self, nouvel_couleur_arriere_plan: tuple) -> None:
         """Modifie la valeur de la couleur d'arrière plan
 
         Argument:
             nouvel_hauteur (int): Nouvelle couleur d'arrière plan
         """
-        self.__couleur_arriere_plan = nouvel_couleur_arriere_plan
+        if self.__couleur_arriere_plan != nouvel_couleur_arriere_plan:
+            self.__couleur_arriere_plan = nouvel_couleur_arriere_plan
+            self.invalider_surface()
     def set_hauteur(self, nouvel_hauteur: int) -> None:
         """Modifie la valeur de hauteur
 
         Argument:
             nouvel_hauteur (int): Nouvelle valeur de hauteur
         """
-        self.__hauteur = nouvel_hauteur
+        if self.__hauteur != nouvel_hauteur:
+            self.__hauteur = nouvel_hauteur
+            self.invalider_surface()
     def set_largeur(self, nouvel_largeur: int) -> None:
         """Modifie la valeur de largeur
 
         Argument:
             nouvel_largeur (int): Nouvelle valeur de largeur
         """
-        self.__largeur = nouvel_largeur
+        if self.__largeur != nouvel_largeur:
+            self.__largeur = nouvel_largeur
+            self.invalider_surface()
     def set_arriere_plan_texture_par_nom(self, texture_nom: str) -> None:
         """Change la texture de l'objet par une texture d'un certain nom
 
         Args:
             texture_nom (str): nom de la nouvelle texture
         """
-        self.__arriere_plan_texture = self.structure_plus().texture_nom(texture_nom)
+        texture = self.structure_plus().texture_nom(texture_nom)
+        if self.__arriere_plan_texture != texture:
+            self.__arriere_plan_texture = texture
+            self.invalider_surface()
     def set_texture_rotation(self, nouvelle_texture_rotation: float) -> None:
         """Change la rotation de la texture
 
@@ -218,6 +290,9 @@ class Objet:
             nouvelle_texture_rotation (float): nouvelle rotation de la texture
         """
         if self.texture_rotation() != nouvelle_texture_rotation:
+            # Le rendu ne change que si la rotation arrondie de la texture change
+            texture = self.arriere_plan_texture()
+            if texture == 0 or texture.rotation_arrondie(self.__texture_rotation) != texture.rotation_arrondie(nouvelle_texture_rotation): self.invalider_surface()
             self.__texture_rotation = nouvelle_texture_rotation
     def set_x(self, nouvel_x: int) -> None:
         """Modifie la valeur de x
@@ -225,14 +300,18 @@ class Objet:
         Argument:
             nouvel_x (int): Nouvelle valeur de x
         """
-        self.__x = nouvel_x
+        if self.__x != nouvel_x:
+            self.__x = nouvel_x
+            self.__a_redessiner = True
     def set_y(self, nouvel_y: int) -> None:
         """Modifie la valeur de y
 
         Argument:
             nouvel_y (int): Nouvelle valeur de y
         """
-        self.__y = nouvel_y
+        if self.__y != nouvel_y:
+            self.__y = nouvel_y
+            self.__a_redessiner = True
     def structure_plus(self) -> Structure_Plus:
         """Retourne la Structure plus du logiciel
 
@@ -271,17 +350,12 @@ class Texte(Objet) :
         super().__init__(structure_plus, nom, x, y, largeur, hauteur)
 
         # Définition des attributes
-        self.__police = 0
         self.__police_taille = -1
         self.__texte = ""
         self.__texte_alignement_horizontal = 1
         self.__texte_alignement_vertical = 1
         self.__texte_couleur = (0, 0, 0)
 
-    def __maj_police(self) -> None:
-        """Met la police du texte à jour"""
-        self.__police = pygame.font.SysFont(pygame.font.get_default_font(), self.__police_taille)
-    
     def rendu(self, surface_objet: pygame.Surface) -> None:
         """Applique le rendu nécessaire à la surface de l'objet
 
@@ -292,9 +366,9 @@ class Texte(Objet) :
         # Création de la bordure
         super().rendu(surface_objet)
         
-        if self.__police != 0:
-            # Création du texte nécessaire
-            surface_texte = self.__police.render(self.__texte, True, self.__texte_couleur)
+        if self.__police_taille >= 0:
+            # Création du texte nécessaire (ou réutilisation depuis le cache des textes)
+            surface_texte = self.structure_plus().rendu_texte(pygame.font.get_default_font(), self.__police_taille, self.__texte, self.__texte_couleur)
 
             # Calcul des coordonnées du texte
             texte_x = 0
@@ -316,7 +390,7 @@ class Texte(Objet) :
         """
         if self.__police_taille != nouvelle_police_taille:
             self.__police_taille = nouvelle_police_taille
-            self.__maj_police()
+            self.invalider_surface()
     def set_texte(self, nouveau_texte: str) -> None:
         """Change le texte de l'objet
 
@@ -325,6 +399,7 @@ class Texte(Objet) :
         """
         if self.__texte != nouveau_texte:
             self.__texte = nouveau_texte
+            self.invalider_surface()
     def set_texte_alignement_horizontal(self, nouveau_texte_alignement_horizontal: int) -> None:
         """Change l'alignement horizontal texte de l'objet
 
@@ -333,6 +408,7 @@ class Texte(Objet) :
         """
         if self.__texte_alignement_horizontal != nouveau_texte_alignement_horizontal:
             self.__texte_alignement_horizontal = nouveau_texte_alignement_horizontal
+            self.invalider_surface()
     def set_texte_alignement_vertical(self, nouveau_texte_alignement_vertical: int) -> None:
         """Change l'alignement vertical texte de l'objet
 
@@ -340,4 +416,5 @@ class Texte(Objet) :
             nouveau_texte_alignement_vertical (str): Nouveau alignement vertical du texte de l'objet
         """
         if self.__texte_alignement_vertical != nouveau_texte_alignement_vertical:
-            self.__texte_alignement_vertical = nouveau_texte_alignement_vertical
\ No newline at end of file
+            self.__texte_alignement_vertical = nouveau_texte_alignement_vertical
+            self.invalider_surface()
\ No newline at end of file
@@ -21,12 +21,16 @@
 # You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
 #
 
+# Importer les threads pour le rendu parallèle
+import concurrent.futures
 # Importer pygame pour utiliser Pygame
 import pygame
 # Importer la base des GUIs avec MLib
 from mlib_objet import *
 # Importer la base du Raycast avec MLib
 from raycast.mlib_raycast_moteur import *
+# Importer le rendu 3D hors ligne avec MLib
+from raycast.mlib_raycast_hors_ligne import Raycast_Hors_Ligne
 
 #******************
 #
@@ -52,7 +56,71 @@ class Raycast_Fenetre(Objet):
         super().__init__(structure_plus, nom, x, y, largeur, hauteur)
 
         # Définition des attributs
+        self.__budget_frame = 0
+        self.__camera = 0
+        self.__durees_frames = []
+        self.__executeur_rendu = 0
+        self.__largeur_ecran_maximum = 0
+        self.__largeur_ecran_minimum = 64
+        self.__nombre_frames_resolution = 10
+        self.__nombre_rayons_camera = 0
+        self.__nombre_rayons_maximum = 0
         self.__raycast_moteur = 0
+        self.__rendu_parallele = False
+        self.__surface_rendu = 0
+        self.__tache_rendu = 0
+        self.set_cache_surface(False)
+
+    # Adapte la résolution du rendu 3D selon la durée des dernières frames
+    def __maj_resolution_dynamique(self) -> None:
+        """Adapte la largeur du rendu 3D et le nombre de rayons selon la durée moyenne des dernières frames
+
+        La largeur diminue de 20% si la moyenne dépasse le budget, et augmente de 25% si elle est sous 70% du budget.
+        Comme 0.7 * 1.25 < 1, une augmentation ne devrait pas dépasser le budget, ce qui évite les oscillations.
+        La largeur est arrondie à un multiple de 16, entre la largeur minimum et la largeur de la caméra à l'activation.
+        """
+        moteur = self.raycast_moteur()
+        if self.__budget_frame <= 0 or moteur == 0: return
+        camera = self.camera_rendue()
+        if self.__largeur_ecran_maximum == 0:
+            # Garder la résolution maximum, celle de la caméra avant l'activation
+            self.__largeur_ecran_maximum = camera.largeur_ecran()
+            self.__nombre_rayons_camera = camera.nombre_rayons()
+            self.__nombre_rayons_maximum = camera.nombre_rayons() if camera.nombre_rayons() > 0 else moteur.nombre_rayons()
+
+        # Attendre assez de frames depuis le dernier changement
+        if self.structure_plus().delta_time() <= 0: return
+        self.__durees_frames.append(self.structure_plus().delta_time())
+        if len(self.__durees_frames) < self.__nombre_frames_resolution: return
+        duree_moyenne = sum(self.__durees_frames) / len(self.__durees_frames)
+        self.__durees_frames.clear()
+
+        # Calculer la nouvelle largeur
+        largeur = camera.largeur_ecran()
+        if duree_moyenne > self.__budget_frame: nouvelle_largeur = min(largeur - 16, round(largeur * 0.8 / 16) * 16)
+        elif duree_moyenne < self.__budget_frame * 0.7: nouvelle_largeur = max(largeur + 16, round(largeur * 1.25 / 16) * 16)
+        else: return
+        nouvelle_largeur = max(min(self.__largeur_ecran_minimum, self.__largeur_ecran_maximum), min(self.__largeur_ecran_maximum, nouvelle_largeur))
+        if nouvelle_largeur != largeur: self.__appliquer_largeur_ecran(nouvelle_largeur)
+    # Applique une largeur de rendu 3D, avec un nombre de rayons proportionnel
+    def __appliquer_largeur_ecran(self, largeur: int) -> None:
+        """Applique une largeur de rendu 3D, avec un nombre de rayons proportionnel
+
+        Le nombre de rayons est celui de la caméra rendue : les autres vues du même moteur ne sont pas modifiées.
+
+        Args:
+            largeur (int): nouvelle largeur du rendu 3D
+        """
+        self.camera_rendue().set_largeur_ecran(largeur)
+        self.camera_rendue().set_nombre_rayons(max(1, round(self.__nombre_rayons_maximum * largeur / self.__largeur_ecran_maximum)))
+    # Remet la résolution maximum du rendu 3D
+    def __reinitialiser_resolution_dynamique(self) -> None:
+        """Remet la résolution du rendu 3D d'avant l'activation de la résolution dynamique"""
+        if self.__largeur_ecran_maximum != 0 and self.raycast_moteur() != 0:
+            self.camera_rendue().set_largeur_ecran(self.__largeur_ecran_maximum)
+            self.camera_rendue().set_nombre_rayons(self.__nombre_rayons_camera)
+        self.__durees_frames.clear()
+        self.__largeur_ecran_maximum = 0
 
     # Applique le rendu du raycast sur la texture
     def rendu(self, surface_objet: pygame.Surface) -> None:
@@ -64,12 +132,77 @@ class Raycast_Fenetre(Objet):
         if self.arriere_plan_texture() != "": self.set_arriere_plan_texture_par_nom("")
         super().rendu(surface_objet)
 
-        # Applique le rendu 3D
-        surface_actuelle = self.raycast_moteur().rendu_3d()
-        surface_actuelle = pygame.transform.scale(surface_actuelle, (surface_objet.get_width(), surface_objet.get_height()))
+        # Applique le rendu 3D, redimensionné (au plus proche voisin) dans une surface gardée entre les frames si nécessaire
+        self.__maj_resolution_dynamique()
+        surface_actuelle = self.__rendu_3d()
+        if surface_actuelle.get_size() != surface_objet.get_size():
+            if self.__surface_rendu == 0 or self.__surface_rendu.get_size() != surface_objet.get_size():
+                self.__surface_rendu = pygame.Surface(surface_objet.get_size(), 0, surface_actuelle)
+            surface_actuelle = pygame.transform.scale(surface_actuelle, surface_objet.get_size(), self.__surface_rendu)
         surface_objet.blit(surface_actuelle, (0, 0, surface_objet.get_width(), surface_objet.get_height()))
 
+        # Lancer le rendu de la frame suivante, pendant que la simulation continue
+        if self.__rendu_parallele: self.__lancer_rendu_parallele()
+    # Lance le rendu parallèle d'un instantané de l'état actuel
+    def __lancer_rendu_parallele(self) -> None:
+        """Lance le rendu 3D d'un instantané de la caméra rendue et des objets dynamiques, dans le thread du rendu parallèle"""
+        moteur = self.raycast_moteur()
+        self.__tache_rendu = self.__executeur_rendu.submit(moteur.rendu_3d_instantane, moteur.instantane(self.__camera))
+    # Retourne le rendu 3D à afficher
+    def __rendu_3d(self) -> pygame.Surface:
+        """Retourne le rendu 3D à afficher, en attendant le rendu parallèle lancé à la frame précédente si nécessaire
+
+        Returns:
+            pygame.Surface: rendu 3D à afficher
+        """
+        if not self.__rendu_parallele: return self.raycast_moteur().rendu_3d_camera(self.__camera)
+        if self.__tache_rendu == 0: self.__lancer_rendu_parallele()
+        surface = self.__tache_rendu.result()
+        self.__tache_rendu = 0
+        return surface
+    # Attend la fin du rendu parallèle en cours
+    def __terminer_rendu_parallele(self) -> None:
+        """Attend la fin du rendu parallèle en cours, sans l'afficher"""
+        if self.__tache_rendu != 0: self.__tache_rendu.result()
+        self.__tache_rendu = 0
+
     # Getters et setters
+    def a_redessiner(self) -> bool:
+        """Retourne si l'objet a changé depuis son dernier rendu sur l'écran, toujours vrai pour un rendu de raycast
+
+        Returns:
+            bool: si l'objet a changé depuis son dernier rendu sur l'écran
+        """
+        return True
+    def budget_frame(self) -> float:
+        """Retourne le budget de temps d'une frame pour la résolution dynamique
+
+        Returns:
+            float: budget de temps d'une frame en secondes (0 si la résolution dynamique est désactivée)
+        """
+        return self.__budget_frame
+    def camera(self) -> Raycast_Camera:
+        """Retourne la caméra rendue par la fenêtre, si ce n'est pas la caméra principale du moteur
+
+        Returns:
+            Raycast_Camera: caméra rendue par la fenêtre (0 pour la caméra principale du moteur)
+        """
+        return self.__camera
+    def camera_rendue(self) -> Raycast_Camera:
+        """Retourne la caméra réellement rendue par la fenêtre (sa caméra, ou la caméra principale du moteur)
+
+        Returns:
+            Raycast_Camera: caméra réellement rendue par la fenêtre
+        """
+        if self.__camera != 0: return self.__camera
+        return self.raycast_moteur().camera()
+    def largeur_ecran_minimum(self) -> int:
+        """Retourne la largeur minimum du rendu 3D avec la résolution dynamique
+
+        Returns:
+            int: largeur minimum du rendu 3D en pixel
+        """
+        return self.__largeur_ecran_minimum
     def raycast_moteur(self) -> Raycast_Moteur:
         """Retourne le moteur de raycast utilisé
 
@@ -77,10 +210,66 @@ class Raycast_Fenetre(Objet):
             Raycast_Moteur: moteur de raycast utilisé
         """
         return self.__raycast_moteur
+    def rendu_parallele(self) -> bool:
+        """Retourne si le rendu 3D est fait dans un thread séparé, pendant la simulation de la frame suivante
+
+        Returns:
+            bool: si le rendu 3D est fait dans un thread séparé
+        """
+        return self.__rendu_parallele
+    def set_budget_frame(self, nouveau_budget_frame: float) -> None:
+        """Change le budget de temps d'une frame, et active la résolution dynamique
+
+        La largeur du rendu 3D et le nombre de rayons sont baissés quand les frames dépassent le budget,
+        sans dépasser ceux de la caméra au moment de l'activation.
+
+        Args:
+            nouveau_budget_frame (float): nouveau budget de temps d'une frame en secondes (0 pour désactiver la résolution dynamique)
+        """
+        if nouveau_budget_frame <= 0: self.__reinitialiser_resolution_dynamique()
+        self.__budget_frame = nouveau_budget_frame
+    def set_camera(self, nouvelle_camera: Raycast_Camera) -> None:
+        """Change la caméra rendue par la fenêtre, pour un écran partagé ou un rétroviseur par exemple
+
+        La caméra doit venir du moteur de la fenêtre (avec "nouvelle_camera"), et n'être rendue que par cette fenêtre.
+
+        Args:
+            nouvelle_camera (Raycast_Camera): nouvelle caméra rendue par la fenêtre (0 pour la caméra principale du moteur)
+        """
+        self.__terminer_rendu_parallele()
+        self.__reinitialiser_resolution_dynamique()
+        self.__camera = nouvelle_camera
+    def set_largeur_ecran_minimum(self, nouvelle_largeur_ecran_minimum: int) -> None:
+        """Change la largeur minimum du rendu 3D avec la résolution dynamique
+
+        Args:
+            nouvelle_largeur_ecran_minimum (int): nouvelle largeur minimum du rendu 3D en pixel
+        """
+        self.__largeur_ecran_minimum = nouvelle_largeur_ecran_minimum
     def set_raycast_moteur(self, moteur: Raycast_Moteur) -> None:
         """Change le moteur de raycast utilisé
 
         Args:
             moteur (Raycast_Moteur): nouveau moteur de raycast utilisé
         """
-        self.__raycast_moteur = moteur
\ No newline at end of file
+        self.__terminer_rendu_parallele()
+        self.__reinitialiser_resolution_dynamique()
+        self.__raycast_moteur = moteur
+    def set_rendu_parallele(self, nouveau_rendu_parallele: bool) -> None:
+        """Change si le rendu 3D est fait dans un thread séparé, pendant la simulation de la frame suivante
+
+        Chaque "maj_rendu" affiche le rendu lancé au "maj_rendu" précédent (depuis un instantané de la caméra et des objets dynamiques),
+        puis lance le rendu de l'état actuel : l'image a une frame de retard.
+        Les calculs de Pygame et NumPy (et l'attente des processus du mode "lot") se font en même temps que la simulation.
+        La map ne doit pas être modifiée entre deux "maj_rendu".
+
+        Args:
+            nouveau_rendu_parallele (bool): si le rendu 3D est fait dans un thread séparé
+        """
+        if self.__rendu_parallele == nouveau_rendu_parallele: return
+        if nouveau_rendu_parallele: self.__executeur_rendu = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        else:
+            self.__terminer_rendu_parallele()
+            self.__executeur_rendu.shutdown()
+            self.__executeur_rendu = 0
+        self.__rendu_parallele = nouveau_rendu_parallele
\ No newline at end of file
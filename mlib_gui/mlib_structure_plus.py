@@ -8,7 +8,7 @@
 # MLib Super est la dernière version du projet "MLib".
 # Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
 #
-# Ce fichier contient la classe "Structure_Plus", et tout le nécessaire pour l'utiliser.
+# Ce fichier contient la classe "Structure_Plus", et tout le nécessaire pour l'utiliser (textures, polices, cache LRU).
 #
 #******************
 #
@@ -21,10 +21,169 @@
 # You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
 #
 
+# Importer un dictionnaire ordonné pour le cache LRU
+from collections import OrderedDict
 # Importer des données sur les chemin d'accés
 import os.path
 # Importer pygame pour utiliser Pygame
 import pygame
+# Importer un verrou pour utiliser le cache LRU depuis plusieurs threads
+import threading
+
+#******************
+#
+# L'initialisation de Pygame
+#
+#******************
+
+def initialiser_pygame(sans_affichage: bool = False) -> None:
+    """Initialise Pygame, avec le pilote vidéo "dummy" de SDL pour un rendu sans affichage
+
+    Le pilote "dummy" n'est choisi que le temps de l'initialisation, et seulement si aucun pilote n'est déjà demandé :
+    "SDL_VIDEODRIVER" n'est pas laissé dans l'environnement, ni hérité par les processus lancés ensuite.
+
+    Args:
+        sans_affichage (bool, optional): si Pygame est initialisé sans affichage. Defaults to False.
+    """
+    pilote_dummy = sans_affichage and "SDL_VIDEODRIVER" not in os.environ
+    if pilote_dummy: os.environ["SDL_VIDEODRIVER"] = "dummy"
+    try: pygame.init()
+    finally:
+        if pilote_dummy: del os.environ["SDL_VIDEODRIVER"]
+
+#******************
+#
+# La classe "Cache_LRU"
+#
+#******************
+
+class Cache_LRU:
+    """Classe représentant un cache limité en mémoire, qui supprime les éléments les moins récemment utilisés
+
+    Le cache peut être utilisé depuis plusieurs threads en même temps (par exemple, plusieurs vues d'un moteur raycast).
+    """
+
+    # Constructeur de "Cache_LRU"
+    def __init__(self, taille_maximum: int = 0) -> None:
+        """Constructeur d'un cache LRU
+
+        Args:
+            taille_maximum (int): taille maximum du cache en octets (0 pour ne pas avoir de limite)
+        """
+
+        # Définition des attributs de base
+        self.__elements = OrderedDict()
+        self.__taille = 0
+        self.__taille_maximum = taille_maximum
+        self.__verrou = threading.RLock()
+
+    # Ajoute un élément dans le cache
+    def ajouter(self, cle, valeur, taille: int) -> bool:
+        """Ajoute un élément dans le cache, en supprimant les éléments les moins récemment utilisés si nécessaire
+
+        Args:
+            cle: clé de l'élément
+            valeur: valeur de l'élément
+            taille (int): taille de l'élément en octets
+
+        Returns:
+            bool: si l'élément a été ajouté (un élément plus grand que la taille maximum n'est pas ajouté)
+        """
+        with self.__verrou:
+            self.supprimer(cle)
+            if self.__taille_maximum > 0 and taille > self.__taille_maximum: return False
+            self.__elements[cle] = (valeur, taille)
+            self.__taille += taille
+            self.__liberer()
+            return True
+    # Retourne un élément du cache
+    def element(self, cle):
+        """Retourne un élément du cache, en le marquant comme le plus récemment utilisé
+
+        Args:
+            cle: clé de l'élément
+
+        Returns:
+            valeur de l'élément (ou 0 si l'élément n'est pas dans le cache)
+        """
+        with self.__verrou:
+            element = self.__elements.get(cle)
+            if element is None: return 0
+            self.__elements.move_to_end(cle)
+            return element[0]
+    # Supprime les éléments les moins récemment utilisés jusqu'à respecter la taille maximum
+    def __liberer(self) -> None:
+        """Supprime les éléments les moins récemment utilisés jusqu'à respecter la taille maximum"""
+        if self.__taille_maximum <= 0: return
+        while self.__taille > self.__taille_maximum:
+            self.__taille -= self.__elements.popitem(last=False)[1][1]
+    # Supprime un élément du cache
+    def supprimer(self, cle) -> None:
+        """Supprime un élément du cache
+
+        Args:
+            cle: clé de l'élément
+        """
+        with self.__verrou:
+            element = self.__elements.pop(cle, None)
+            if element is not None: self.__taille -= element[1]
+    # Vide le cache
+    def vider(self) -> None:
+        """Vide le cache"""
+        with self.__verrou:
+            self.__elements.clear()
+            self.__taille = 0
+
+    # Getters et setters
+    def nombre_elements(self) -> int:
+        """Retourne le nombre d'éléments dans le cache
+
+        Returns:
+            int: nombre d'éléments dans le cache
+        """
+        return len(self.__elements)
+    def set_taille_maximum(self, nouvelle_taille_maximum: int) -> None:
+        """Modifie la taille maximum du cache en octets
+
+        Args:
+            nouvelle_taille_maximum (int): nouvelle taille maximum du cache en octets (0 pour ne pas avoir de limite)
+        """
+        with self.__verrou:
+            self.__taille_maximum = nouvelle_taille_maximum
+            self.__liberer()
+    def taille(self) -> int:
+        """Retourne la taille actuelle du cache en octets
+
+        Returns:
+            int: taille actuelle du cache en octets
+        """
+        return self.__taille
+    def taille_maximum(self) -> int:
+        """Retourne la taille maximum du cache en octets
+
+        Returns:
+            int: taille maximum du cache en octets (0 pour ne pas avoir de limite)
+        """
+        return self.__taille_maximum
+
+# Cache des polices, partagé par toutes les structures du processus (une police n'est ouverte qu'une fois par chemin d'accés et taille)
+cache_polices = Cache_LRU()
+
+def police_chemin_acces(chemin_acces: str, taille: int) -> pygame.font.Font:
+    """Retourne une police selon le chemin d'accés de son fichier et sa taille, ouverte seulement à la première demande dans le processus
+
+    Args:
+        chemin_acces (str): chemin d'accés du fichier de la police (None pour la police par défaut de Pygame)
+        taille (int): taille de la police
+
+    Returns:
+        pygame.font.Font: police demandée
+    """
+    police = cache_polices.element((chemin_acces, taille))
+    if police == 0:
+        police = pygame.font.Font(chemin_acces, taille)
+        cache_polices.ajouter((chemin_acces, taille), police, 0)
+    return police
 
 #******************
 #
@@ -45,8 +204,11 @@ class Texture:
         """
 
         # Définition des attributs de base
+        self.__cache_rotations = Cache_LRU(8 * 1024 * 1024)
         self.__chemin_acces = texture_chemin_acces
         self.__nom = nom
+        self.__pas_rotation = 1
+        self.__rotation_lisse = False
         self.__surface = 0
 
         # Charger la texture (si elle utilise un chemin d'accés)
@@ -56,7 +218,59 @@ class Texture:
             else:
                 print("MLib Texture : le chemin d'accés \"" + texture_chemin_acces + "\" pour la texture \"" + nom + "\" n'existe pas.")
     
+    # Retourne une rotation arrondie au pas de rotation
+    def rotation_arrondie(self, rotation: float) -> float:
+        """Retourne une rotation arrondie au pas de rotation de la texture, entre 0 et 360 degrés
+
+        Args:
+            rotation (float): rotation en degrés
+
+        Returns:
+            float: rotation arrondie en degrés (la rotation exacte si le pas est 0)
+        """
+        if self.__pas_rotation <= 0: return rotation
+        return (round(rotation / self.__pas_rotation) * self.__pas_rotation) % 360
+    # Retourne la surface de la texture tournée
+    def surface_tournee(self, rotation: float) -> pygame.Surface:
+        """Retourne la surface de la texture tournée, arrondie au pas de rotation et gardée dans le cache des rotations
+
+        Args:
+            rotation (float): rotation de la texture en degrés
+
+        Returns:
+            pygame.Surface: surface de la texture tournée (à ne pas modifier)
+        """
+        rotation = self.rotation_arrondie(rotation)
+        if rotation == 0 or self.__surface == 0: return self.__surface
+        if self.__pas_rotation <= 0: return self.__tourner(rotation)
+
+        # Tourner la texture seulement si cette rotation n'est pas dans le cache
+        surface = self.__cache_rotations.element(rotation)
+        if surface == 0:
+            surface = self.__tourner(rotation)
+            self.__cache_rotations.ajouter(rotation, surface, surface.get_pitch() * surface.get_height())
+        return surface
+    # Tourne la surface de la texture
+    def __tourner(self, rotation: float) -> pygame.Surface:
+        """Tourne la surface de la texture, avec ou sans lissage
+
+        Args:
+            rotation (float): rotation en degrés
+
+        Returns:
+            pygame.Surface: surface tournée
+        """
+        if self.__rotation_lisse: return pygame.transform.rotozoom(self.__surface, rotation, 1)
+        return pygame.transform.rotate(self.__surface, rotation)
+
     # Getters et setters
+    def cache_rotations(self) -> Cache_LRU:
+        """Retourne le cache des rotations de la texture (8 Mo par défaut)
+
+        Returns:
+            Cache_LRU: cache des rotations de la texture
+        """
+        return self.__cache_rotations
     def nom(self) -> str:
         """Retourne le nom de la texture
 
@@ -64,6 +278,38 @@ class Texture:
             str: nom de la texture
         """
         return self.__nom
+    def pas_rotation(self) -> float:
+        """Retourne le pas des rotations gardées dans le cache
+
+        Returns:
+            float: pas des rotations en degrés (0 pour des rotations exactes, sans cache)
+        """
+        return self.__pas_rotation
+    def rotation_lisse(self) -> bool:
+        """Retourne si les rotations sont lissées (avec "pygame.transform.rotozoom")
+
+        Returns:
+            bool: si les rotations sont lissées
+        """
+        return self.__rotation_lisse
+    def set_pas_rotation(self, nouveau_pas_rotation: float) -> None:
+        """Change le pas des rotations gardées dans le cache
+
+        Args:
+            nouveau_pas_rotation (float): nouveau pas des rotations en degrés (0 pour des rotations exactes, sans cache)
+        """
+        if self.__pas_rotation != nouveau_pas_rotation:
+            self.__pas_rotation = nouveau_pas_rotation
+            self.__cache_rotations.vider()
+    def set_rotation_lisse(self, nouvelle_rotation_lisse: bool) -> None:
+        """Change si les rotations sont lissées (avec "pygame.transform.rotozoom", plus lent)
+
+        Args:
+            nouvelle_rotation_lisse (bool): si les rotations sont lissées
+        """
+        if self.__rotation_lisse != nouvelle_rotation_lisse:
+            self.__rotation_lisse = nouvelle_rotation_lisse
+            self.__cache_rotations.vider()
     def surface(self) -> pygame.Surface:
         """Retourne la surface de la texture
 
@@ -87,6 +333,7 @@ class Structure_Plus :
         """
 
         # Définition des attributes de bases
+        self.__cache_textes = Cache_LRU(8 * 1024 * 1024)
         self.__delta_time = 0
         self.__dernier_delta_time = 0
         self.__numero_frame = 0
@@ -130,12 +377,52 @@ class Structure_Plus :
                 return t
         return 0
 
+    # Retourne une police, créée une seule fois pour tout le processus
+    def police(self, nom: str, taille: int) -> pygame.font.Font:
+        """Retourne une police système selon son nom et sa taille, depuis le cache des polices partagé par toutes les structures
+
+        Args:
+            nom (str): nom de la police
+            taille (int): taille de la police
+
+        Returns:
+            pygame.font.Font: police demandée
+        """
+        return police_chemin_acces(pygame.font.match_font(nom), taille)
+    # Retourne le rendu d'un texte, depuis le cache si possible
+    def rendu_texte(self, nom_police: str, taille: int, texte: str, couleur: tuple, antialias: bool = True) -> pygame.Surface:
+        """Retourne le rendu d'un texte, gardé dans le cache des textes (à ne pas modifier)
+
+        Args:
+            nom_police (str): nom de la police
+            taille (int): taille de la police
+            texte (str): texte à rendre
+            couleur (tuple): couleur du texte
+            antialias (bool, optional): si le texte est lissé. Defaults to True.
+
+        Returns:
+            pygame.Surface: rendu du texte
+        """
+        cle = (nom_police, taille, texte, tuple(couleur), antialias)
+        surface = self.__cache_textes.element(cle)
+        if surface == 0:
+            surface = self.police(nom_police, taille).render(texte, antialias, couleur)
+            self.__cache_textes.ajouter(cle, surface, surface.get_pitch() * surface.get_height())
+        return surface
+
     # Gérer les évènements
     def maj_evenements(self) -> None :
         """Fonction exécutée avant chaque mise à jour de la fenêtre, pour gérer les évènements"""
         self.__numero_frame += 1
 
     # Getters et setters
+    def cache_textes(self) -> Cache_LRU:
+        """Retourne le cache des rendus de textes (8 Mo par défaut)
+
+        Returns:
+            Cache_LRU: cache des rendus de textes
+        """
+        return self.__cache_textes
     def delta_time(self) -> int:
         """Retourne le delta time entre deux exécution du software
 
@@ -0,0 +1,218 @@
+#******************
+#
+# mlib_raycast_hors_ligne.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier contient le nécessaire au rendu 3D hors ligne (sans fenêtre) de nombreuses poses de caméra, dans plusieurs processus.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+# Importer des outils de multi processus
+import concurrent.futures
+# Importer des outils mathématiques
+from math import ceil
+# Importer des outils pour gérer les fichiers
+import os
+# Importer pygame pour utiliser Pygame
+import pygame
+# Importer la base du Raycast avec MLib
+from raycast.mlib_raycast_moteur import *
+
+#******************
+#
+# Les fonctions des processus du rendu hors ligne
+#
+#******************
+
+# Moteur de raycast du processus, préparé une seule fois par "initialiser_processus_hors_ligne"
+moteur_hors_ligne = 0
+
+def initialiser_processus_hors_ligne(preparation, texte_map: str) -> None:
+    """Prépare le moteur de raycast d'un processus du rendu hors ligne
+
+    Le processus n'a pas de fenêtre : un affichage "dummy" de 1 * 1 pixel est créé avant la préparation,
+    pour que les textures (sol, plafond...) puissent être chargées et converties comme dans une fenêtre.
+
+    Args:
+        preparation (function): fonction appelée avec le moteur pour le préparer (textures, matériaux, caméra...), ou 0
+        texte_map (str): texte d'où générer la map après la préparation (ou "" pour ne pas générer de map)
+    """
+    global moteur_hors_ligne
+
+    # Mise en place de Pygame sans affichage
+    initialiser_pygame(True)
+    pygame.display.set_mode((1, 1))
+
+    moteur_hors_ligne = Raycast_Moteur(Structure_Plus())
+    if preparation != 0: preparation(moteur_hors_ligne)
+    if texte_map != "": moteur_hors_ligne.generer_map_depuis_texte(texte_map)
+
+    # Chaque processus a déjà son propre cœur : pas de processus supplémentaires pour le raycast
+    moteur_hors_ligne.set_nombre_processus(0)
+
+def rendu_pose_hors_ligne(pose: tuple) -> pygame.Surface:
+    """Place la caméra du moteur du processus à une pose, et retourne son rendu 3D
+
+    Args:
+        pose (tuple): pose (x, y, z, rotation x, rotation y) de la caméra
+
+    Returns:
+        pygame.Surface: rendu 3D de la pose
+    """
+    camera = moteur_hors_ligne.camera()
+    camera.set_x(pose[0])
+    camera.set_y(pose[1])
+    camera.set_z(pose[2])
+    camera.set_rotation_x(pose[3])
+    camera.set_rotation_y(pose[4])
+    return moteur_hors_ligne.rendu_3d()
+
+def rendu_poses_hors_ligne(poses: list) -> list:
+    """Effectue le rendu 3D d'un lot de poses, dans un processus du rendu hors ligne
+
+    Args:
+        poses (list): poses (x, y, z, rotation x, rotation y) de la caméra
+
+    Returns:
+        list: image (hauteur, largeur, 3) de chaque pose
+    """
+    images = []
+    for pose in poses:
+        surface = rendu_pose_hors_ligne(pose)
+        images.append(numpy.frombuffer(pygame.image.tobytes(surface, "RGB"), dtype=numpy.uint8).reshape(surface.get_height(), surface.get_width(), 3))
+    return images
+
+def rendu_poses_hors_ligne_dossier(poses: list, indice_debut: int, dossier: str, format: str) -> list:
+    """Effectue le rendu 3D d'un lot de poses et l'écrit dans un dossier, dans un processus du rendu hors ligne
+
+    Args:
+        poses (list): poses (x, y, z, rotation x, rotation y) de la caméra
+        indice_debut (int): indice de la première pose du lot, utilisé dans le nom des images
+        dossier (str): dossier où écrire les images
+        format (str): extension des images (par exemple "png")
+
+    Returns:
+        list: chemin d'accés de l'image de chaque pose
+    """
+    chemins_acces = []
+    for i, pose in enumerate(poses):
+        chemin_acces = os.path.join(dossier, "rendu_" + str(indice_debut + i).zfill(6) + "." + format)
+        pygame.image.save(rendu_pose_hors_ligne(pose), chemin_acces)
+        chemins_acces.append(chemin_acces)
+    return chemins_acces
+
+#******************
+#
+# La classe "Raycast_Hors_Ligne"
+#
+#******************
+
+class Raycast_Hors_Ligne:
+    """Classe représentant un groupe de processus effectuant le rendu 3D hors ligne (sans fenêtre) de nombreuses poses de caméra
+
+    Chaque processus prépare son propre moteur une seule fois à son lancement :
+    ensuite, seules les poses et les images passent d'un processus à l'autre.
+    La fonction de préparation doit être définie au niveau d'un module (pas de lambda), pour être envoyée aux processus,
+    et le programme principal doit être protégé par un "if __name__ == "__main__":".
+    """
+
+    # Constructeur de "Raycast_Hors_Ligne"
+    def __init__(self, preparation = 0, texte_map: str = "", nombre_processus: int = 0) -> None:
+        """Constructeur de "Raycast_Hors_Ligne"
+
+        Args:
+            preparation (function, optional): fonction appelée avec le moteur de chaque processus pour le préparer (textures, matériaux, caméra...), ou 0. Defaults to 0.
+            texte_map (str, optional): texte d'où générer la map de chaque processus, après la préparation (ou "" si la préparation génère la map). Defaults to "".
+            nombre_processus (int, optional): nombre de processus utilisés (0 pour un processus par cœur). Defaults to 0.
+        """
+
+        # Définition des attributs
+        self.__executeur = 0
+        if nombre_processus <= 0: nombre_processus = os.cpu_count() or 1
+        self.__executeur = concurrent.futures.ProcessPoolExecutor(nombre_processus, initializer=initialiser_processus_hors_ligne, initargs=(preparation, texte_map))
+        self.__nombre_processus = nombre_processus
+
+    def __del__(self) -> None:
+        """Destructeur de "Raycast_Hors_Ligne"""
+        self.fermer()
+
+    # Ferme le groupe de processus
+    def fermer(self) -> None:
+        """Arrête les processus"""
+        if self.__executeur != 0:
+            self.__executeur.shutdown(wait=True)
+            self.__executeur = 0
+
+    # Découpe des poses en lots
+    def __lots(self, poses: list, taille_lot: int) -> list:
+        """Découpe des poses en lots, pour limiter les échanges entre les processus
+
+        Args:
+            poses (list): poses (x, y, z, rotation x, rotation y) de la caméra
+            taille_lot (int): nombre de poses par lot (0 pour environ 4 lots par processus, de 16 poses au plus)
+
+        Returns:
+            list: lots de poses, sous la forme (indice de la première pose, poses)
+        """
+        poses = [tuple(pose) for pose in poses]
+        if taille_lot <= 0: taille_lot = max(1, min(16, ceil(len(poses) / (4 * self.__nombre_processus))))
+        return [(i, poses[i:i + taille_lot]) for i in range(0, len(poses), taille_lot)]
+
+    # Effectue le rendu de poses
+    def rendu(self, poses: list, taille_lot: int = 0):
+        """Effectue le rendu 3D de poses dans les processus, et retourne chaque image dès qu'elle est prête, dans l'ordre des poses (nécessite NumPy)
+
+        Args:
+            poses (list): poses (x, y, z, rotation x, rotation y) de la caméra
+            taille_lot (int, optional): nombre de poses envoyées à la fois à un processus (0 pour le choisir automatiquement). Defaults to 0.
+
+        Yields:
+            numpy.ndarray: image (hauteur, largeur, 3) de chaque pose
+        """
+        if numpy == 0:
+            print("MLib Raycast hors ligne : le rendu en tableaux nécessite NumPy, qui n'est pas installé.")
+            return
+        lots = [lot for indice_debut, lot in self.__lots(poses, taille_lot)]
+        for images in self.__executeur.map(rendu_poses_hors_ligne, lots):
+            yield from images
+    # Effectue le rendu de poses dans un dossier
+    def rendu_dossier(self, poses: list, dossier: str, format: str = "png", taille_lot: int = 0) -> list:
+        """Effectue le rendu 3D de poses dans les processus, qui écrivent directement les images "rendu_<indice>.<format>" dans un dossier
+
+        Args:
+            poses (list): poses (x, y, z, rotation x, rotation y) de la caméra
+            dossier (str): dossier où écrire les images (créé si il n'existe pas)
+            format (str, optional): extension des images. Defaults to "png".
+            taille_lot (int, optional): nombre de poses envoyées à la fois à un processus (0 pour le choisir automatiquement). Defaults to 0.
+
+        Returns:
+            list: chemin d'accés de l'image de chaque pose
+        """
+        os.makedirs(dossier, exist_ok=True)
+        taches = [self.__executeur.submit(rendu_poses_hors_ligne_dossier, lot, indice_debut, dossier, format) for indice_debut, lot in self.__lots(poses, taille_lot)]
+        chemins_acces = []
+        for tache in taches: chemins_acces.extend(tache.result())
+        return chemins_acces
+
+    # Getters et setters
+    def nombre_processus(self) -> int:
+        """Retourne le nombre de processus utilisés
+
+        Returns:
+            int: nombre de processus utilisés
+        """
+        return self.__nombre_processus
\ No newline at end of file
@@ -0,0 +1,663 @@
+#******************
+#
+# mlib_raycast_lot.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier contient le nécessaire au raycast par lot (toutes les colonnes de l'écran en même temps), avec NumPy.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+# Importer des outils de multi processus
+import concurrent.futures
+from multiprocessing import shared_memory
+# Importer NumPy pour les calculs par lot (si il est installé)
+try:
+    import numpy
+except ImportError:
+    numpy = 0
+
+#******************
+#
+# La classe "Raycast_Lot"
+#
+#******************
+
+class Raycast_Lot:
+    """Classe représentant le résultat d'un raycast par lot (un rayon par colonne de l'écran)
+
+    Les collisions de chaque colonne sont rangées par couches : la couche 0 contient la collision la plus proche,
+    la couche 1 la suivante, etc... Une couche sans collision a une distance infinie et une case à -1.
+    """
+
+    # Constructeur de "Raycast_Lot"
+    def __init__(self, largeur_ecran: int, nombre_couches: int, tampon = 0) -> None:
+        """Constructeur de "Raycast_Lot"
+
+        Args:
+            largeur_ecran (int): nombre de colonnes (et donc de rayons) du raycast
+            nombre_couches (int): nombre maximum de collisions par colonne
+            tampon (optional): mémoire où ranger les tableaux, d'au moins "taille_tampon_raycast_lot" octets, dont le contenu est conservé (ou 0 pour allouer une nouvelle mémoire vide). Defaults to 0.
+        """
+
+        # Définition des attributs
+        nouveau_tampon = tampon == 0
+        if nouveau_tampon: tampon = bytearray(taille_tampon_raycast_lot(largeur_ecran, nombre_couches))
+        taille_couches = nombre_couches * largeur_ecran
+        forme = (nombre_couches, largeur_ecran)
+        self.__distances = numpy.ndarray(forme, dtype=numpy.float64, buffer=tampon, offset=0)
+        self.__distances_sortie = numpy.ndarray(forme, dtype=numpy.float64, buffer=tampon, offset=taille_couches * 8)
+        self.__x_textures = numpy.ndarray(forme, dtype=numpy.float64, buffer=tampon, offset=taille_couches * 16)
+        self.__x_cases = numpy.ndarray(forme, dtype=numpy.int32, buffer=tampon, offset=taille_couches * 24)
+        self.__y_cases = numpy.ndarray(forme, dtype=numpy.int32, buffer=tampon, offset=taille_couches * 28)
+        self.__nombre_collisions = numpy.ndarray((largeur_ecran,), dtype=numpy.int32, buffer=tampon, offset=taille_couches * 32)
+        self.__faces = numpy.ndarray(forme, dtype=numpy.int8, buffer=tampon, offset=taille_couches * 32 + largeur_ecran * 4)
+        if nouveau_tampon: self.vider()
+
+    # Vide le résultat du raycast
+    def vider(self) -> None:
+        """Vide le résultat du raycast, sans réallouer ses tableaux"""
+        self.__distances.fill(numpy.inf)
+        self.__distances_sortie.fill(numpy.inf)
+        self.__faces.fill(0)
+        self.__nombre_collisions.fill(0)
+        self.__x_cases.fill(-1)
+        self.__x_textures.fill(0)
+        self.__y_cases.fill(-1)
+
+    # Getters et setters
+    def distances(self) -> "numpy.ndarray":
+        """Retourne les distances d'entrée dans les cases touchées (couche, colonne)
+
+        Returns:
+            numpy.ndarray: distances d'entrée dans les cases touchées
+        """
+        return self.__distances
+    def distances_sortie(self) -> "numpy.ndarray":
+        """Retourne les distances de sortie des cases touchées (couche, colonne)
+
+        Returns:
+            numpy.ndarray: distances de sortie des cases touchées
+        """
+        return self.__distances_sortie
+    def faces(self) -> "numpy.ndarray":
+        """Retourne les faces touchées (0 = face à X constant, 1 = face à Y constant)
+
+        Returns:
+            numpy.ndarray: faces touchées
+        """
+        return self.__faces
+    def largeur_ecran(self) -> int:
+        """Retourne le nombre de colonnes du raycast
+
+        Returns:
+            int: nombre de colonnes du raycast
+        """
+        return self.__nombre_collisions.shape[0]
+    def nombre_collisions(self) -> "numpy.ndarray":
+        """Retourne le nombre de collisions de chaque colonne
+
+        Returns:
+            numpy.ndarray: nombre de collisions de chaque colonne
+        """
+        return self.__nombre_collisions
+    def nombre_couches(self) -> int:
+        """Retourne le nombre maximum de collisions par colonne
+
+        Returns:
+            int: nombre maximum de collisions par colonne
+        """
+        return self.__distances.shape[0]
+    def x_cases(self) -> "numpy.ndarray":
+        """Retourne les X des cases touchées (couche, colonne)
+
+        Returns:
+            numpy.ndarray: X des cases touchées
+        """
+        return self.__x_cases
+    def x_textures(self) -> "numpy.ndarray":
+        """Retourne les positions X sur la texture des faces touchées, entre 0 et 1 (couche, colonne)
+
+        Returns:
+            numpy.ndarray: positions X sur la texture des faces touchées
+        """
+        return self.__x_textures
+    def y_cases(self) -> "numpy.ndarray":
+        """Retourne les Y des cases touchées (couche, colonne)
+
+        Returns:
+            numpy.ndarray: Y des cases touchées
+        """
+        return self.__y_cases
+
+def taille_tampon_raycast_lot(largeur_ecran: int, nombre_couches: int) -> int:
+    """Retourne la taille en octets de la mémoire nécessaire à un "Raycast_Lot"
+
+    Args:
+        largeur_ecran (int): nombre de colonnes du raycast
+        nombre_couches (int): nombre maximum de collisions par colonne
+
+    Returns:
+        int: taille en octets de la mémoire nécessaire
+    """
+    return nombre_couches * largeur_ecran * 33 + largeur_ecran * 4
+
+#******************
+#
+# Le raycast par lot
+#
+#******************
+
+def raycast_lot_colonnes(resultat: Raycast_Lot, map_materiaux: "numpy.ndarray", map_hauteurs: "numpy.ndarray", point_de_depart: tuple, angles: "numpy.ndarray", colonne_debut: int = 0, distance_maximum: float = 0) -> None:
+    """Effectue un raycast par DDA pour plusieurs colonnes en même temps
+
+    Tous les rayons avancent ensemble, case par case, et un rayon s'arrête quand il sort de la map,
+    touche une case opaque (plus haute que le point de départ), remplit toutes ses couches ou dépasse la distance maximum.
+
+    Args:
+        resultat (Raycast_Lot): résultat où écrire les collisions
+        map_materiaux (numpy.ndarray): id des matériaux de chaque case de la map (0 pour une case vide), indexés par [y, x]
+        map_hauteurs (numpy.ndarray): hauteur de chaque case de la map, indexées par [y, x]
+        point_de_depart (tuple): point de départ (x, y, z) des rayons
+        angles (numpy.ndarray): angle absolu de chaque rayon
+        colonne_debut (int, optional): colonne du résultat où écrire le premier rayon. Defaults to 0.
+        distance_maximum (float, optional): distance au delà de laquelle les rayons s'arrêtent (0 pour ne pas avoir de limite). Defaults to 0.
+    """
+
+    # Préparation des rayons
+    x_depart, y_depart, z_depart = point_de_depart
+    hauteur_map, largeur_map = map_materiaux.shape
+    nombre_couches = resultat.nombre_couches()
+    colonnes = numpy.arange(colonne_debut, colonne_debut + angles.shape[0])
+    avant_x, avant_y = numpy.cos(angles), numpy.sin(angles)
+    ajout_x = numpy.sign(avant_x).astype(numpy.int64)
+    ajout_y = numpy.sign(avant_y).astype(numpy.int64)
+    x_case = numpy.full(colonnes.shape[0], int(numpy.floor(x_depart)), dtype=numpy.int64)
+    y_case = numpy.full(colonnes.shape[0], int(numpy.floor(y_depart)), dtype=numpy.int64)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        distance_delta_x = numpy.abs(1.0 / avant_x)
+        distance_delta_y = numpy.abs(1.0 / avant_y)
+        distance_x = numpy.where(ajout_x > 0, x_case + 1 - x_depart, x_depart - x_case) * distance_delta_x
+        distance_y = numpy.where(ajout_y > 0, y_case + 1 - y_depart, y_depart - y_case) * distance_delta_y
+    distance_x[ajout_x == 0] = numpy.inf
+    distance_y[ajout_y == 0] = numpy.inf
+    couche = numpy.zeros(colonnes.shape[0], dtype=numpy.int64)
+
+    # Envoie des rayons
+    z_carre = z_depart * z_depart
+    distance_plane_maximum = numpy.inf
+    if distance_maximum > 0: distance_plane_maximum = numpy.sqrt(max(0, distance_maximum * distance_maximum - z_carre))
+    while colonnes.shape[0] > 0:
+        # Passer à la prochaine ligne de la grille la plus proche
+        pas_x = distance_x < distance_y
+        distance_entree = numpy.where(pas_x, distance_x, distance_y)
+        x_case += numpy.where(pas_x, ajout_x, 0)
+        y_case += numpy.where(pas_x, 0, ajout_y)
+        distance_x += numpy.where(pas_x, distance_delta_x, 0)
+        distance_y += numpy.where(pas_x, 0, distance_delta_y)
+
+        # Gérer les cases touchées
+        dans_map = (x_case >= 0) & (y_case >= 0) & (x_case < largeur_map) & (y_case < hauteur_map)
+        x_map, y_map = numpy.clip(x_case, 0, largeur_map - 1), numpy.clip(y_case, 0, hauteur_map - 1)
+        trop_loin = distance_entree > distance_plane_maximum
+        touche = dans_map & (map_materiaux[y_map, x_map] != 0) & ~trop_loin
+        arret = trop_loin
+        if touche.any():
+            # Écrire les collisions dans leur couche
+            t, c = numpy.nonzero(touche)[0], couche[touche]
+            colonnes_touchees = colonnes[t]
+            distance_sortie = numpy.minimum(distance_x[t], distance_y[t])
+            x_point = x_depart + avant_x[t] * distance_entree[t]
+            y_point = y_depart + avant_y[t] * distance_entree[t]
+            resultat.distances()[c, colonnes_touchees] = numpy.sqrt(distance_entree[t] * distance_entree[t] + z_carre)
+            resultat.distances_sortie()[c, colonnes_touchees] = numpy.sqrt(distance_sortie * distance_sortie + z_carre)
+            resultat.faces()[c, colonnes_touchees] = numpy.where(pas_x[t], 0, 1)
+            resultat.x_cases()[c, colonnes_touchees] = x_case[t]
+            resultat.x_textures()[c, colonnes_touchees] = numpy.where(pas_x[t], y_point - numpy.floor(y_point), x_point - numpy.floor(x_point))
+            resultat.y_cases()[c, colonnes_touchees] = y_case[t]
+            couche[t] += 1
+            resultat.nombre_collisions()[colonnes_touchees] = couche[t]
+
+            # Arrêter les rayons ayant touché une case opaque ou ayant rempli leurs couches
+            arret[t] = (z_depart <= map_hauteurs[y_case[t], x_case[t]]) | (couche[t] >= nombre_couches)
+
+        # Arrêter les rayons sortis de la map
+        arret |= ((x_case < 0) & (ajout_x <= 0)) | ((x_case >= largeur_map) & (ajout_x >= 0))
+        arret |= ((y_case < 0) & (ajout_y <= 0)) | ((y_case >= hauteur_map) & (ajout_y >= 0))
+        if arret.any():
+            garde = ~arret
+            colonnes, couche = colonnes[garde], couche[garde]
+            avant_x, avant_y, ajout_x, ajout_y = avant_x[garde], avant_y[garde], ajout_x[garde], ajout_y[garde]
+            x_case, y_case = x_case[garde], y_case[garde]
+            distance_delta_x, distance_delta_y = distance_delta_x[garde], distance_delta_y[garde]
+            distance_x, distance_y = distance_x[garde], distance_y[garde]
+
+def raycast_lot_couper_polygones(polygones: "numpy.ndarray", nombres_sommets: "numpy.ndarray", a: "numpy.ndarray", b: "numpy.ndarray", c: "numpy.ndarray") -> tuple:
+    """Coupe des polygones convexes par des demi-plans "a * x + b * y <= c" (un demi-plan par polygone)
+
+    Args:
+        polygones (numpy.ndarray): sommets de chaque polygone, de forme (nombre de polygones, nombre maximum de sommets, 2)
+        nombres_sommets (numpy.ndarray): nombre de sommets utilisés de chaque polygone
+        a (numpy.ndarray): coefficient des X de chaque demi-plan
+        b (numpy.ndarray): coefficient des Y de chaque demi-plan
+        c (numpy.ndarray): constante de chaque demi-plan
+
+    Returns:
+        tuple: polygones coupés et leur nombre de sommets (un polygone ayant trop de sommets est remplacé par le rectangle qui le contient)
+    """
+
+    # Ne couper que les polygones ayant au moins un sommet hors du demi-plan
+    sommets_maximum = polygones.shape[1]
+    indices = numpy.arange(sommets_maximum)[None, :]
+    utilises = indices < nombres_sommets[:, None]
+    ecarts = a[:, None] * polygones[:, :, 0] + b[:, None] * polygones[:, :, 1] - c[:, None]
+    coupes = numpy.flatnonzero(((ecarts > 0) & utilises).any(axis=1))
+    if coupes.shape[0] <= 0: return (polygones, nombres_sommets)
+    polygones, nombres_sommets = polygones.copy(), nombres_sommets.copy()
+    morceaux, ecarts, utilises = polygones[coupes], ecarts[coupes], utilises[coupes]
+
+    # Tester chaque sommet, et son suivant dans le polygone
+    suivants = (indices + 1) % numpy.maximum(1, nombres_sommets[coupes])[:, None]
+    lignes = numpy.arange(coupes.shape[0])[:, None]
+    morceaux_suivants, ecarts_suivants = morceaux[lignes, suivants], ecarts[lignes, suivants]
+    dedans, suivants_dedans = ecarts <= 0, ecarts_suivants <= 0
+
+    # Garder les sommets dans le demi-plan, et ajouter l'intersection de chaque côté qui traverse sa limite
+    traverses = (dedans != suivants_dedans) & utilises
+    t = numpy.zeros(ecarts.shape)
+    t[traverses] = ecarts[traverses] / (ecarts[traverses] - ecarts_suivants[traverses])
+    sorties = numpy.empty((coupes.shape[0], 2 * sommets_maximum, 2))
+    sorties[:, 0::2] = morceaux
+    sorties[:, 1::2] = morceaux + t[:, :, None] * (morceaux_suivants - morceaux)
+    gardes = numpy.empty((coupes.shape[0], 2 * sommets_maximum), dtype=bool)
+    gardes[:, 0::2] = dedans & utilises
+    gardes[:, 1::2] = traverses
+    nombres = gardes.sum(axis=1)
+
+    # Ranger les sommets gardés au début de chaque polygone
+    trop = nombres > sommets_maximum
+    positions = numpy.cumsum(gardes, axis=1) - 1
+    ranges = gardes & ~trop[:, None]
+    morceaux = numpy.zeros((coupes.shape[0], sommets_maximum, 2))
+    morceaux[numpy.nonzero(ranges)[0], positions[ranges]] = sorties[ranges]
+
+    # Remplacer les polygones ayant trop de sommets par le rectangle qui les contient
+    if trop.any():
+        minimums = numpy.where(gardes[trop][:, :, None], sorties[trop], numpy.inf).min(axis=1)
+        maximums = numpy.where(gardes[trop][:, :, None], sorties[trop], -numpy.inf).max(axis=1)
+        rectangles = numpy.zeros((minimums.shape[0], sommets_maximum, 2))
+        rectangles[:, 0], rectangles[:, 2] = minimums, maximums
+        rectangles[:, 1, 0], rectangles[:, 1, 1] = maximums[:, 0], minimums[:, 1]
+        rectangles[:, 3, 0], rectangles[:, 3, 1] = minimums[:, 0], maximums[:, 1]
+        morceaux[trop] = rectangles
+        nombres[trop] = 4
+    polygones[coupes], nombres_sommets[coupes] = morceaux, nombres
+    return (polygones, nombres_sommets)
+def raycast_lot_faisceaux_pvs(cases_bloquantes: "numpy.ndarray", x_sources: "numpy.ndarray", y_sources: "numpy.ndarray", largeurs_sources: "numpy.ndarray", hauteurs_sources: "numpy.ndarray") -> tuple:
+    """Retourne toutes les cases que peuvent atteindre, après le bord droit de leur source, les droites traversant des rectangles sources vers les X croissants (pente entre -1 et 1)
+
+    Une droite "y = v + s * (x - x source - 1)" est représentée par le point (v, s) :
+    traverser une colonne entre deux cases bloquantes revient alors à respecter quatre inégalités linéaires en (v, s).
+    Un faisceau de droites est donc un polygone convexe, coupé exactement dans chaque colonne par les suites de cases libres qu'il traverse,
+    sans échantillonner de rayons : une case atteinte par une droite fait toujours partie du résultat.
+    Les cases entre la source et son bord droit n'arrêtent pas les droites, et ne font pas partie du résultat.
+
+    Args:
+        cases_bloquantes (numpy.ndarray): si chaque case arrête les droites, indexées par [y, x]
+        x_sources (numpy.ndarray): X de la première case de chaque source
+        y_sources (numpy.ndarray): Y de la première case de chaque source
+        largeurs_sources (numpy.ndarray): nombre de cases en X de chaque source
+        hauteurs_sources (numpy.ndarray): nombre de cases en Y de chaque source
+
+    Returns:
+        tuple: indice de la source, X et Y de chaque case atteinte (avec des doublons)
+    """
+
+    # Numéroter les suites de cases libres de chaque colonne, dans l'ordre (les lignes -1 et "hauteur de la map" sont bloquantes)
+    hauteur_map, largeur_map = cases_bloquantes.shape
+    libres = numpy.zeros((largeur_map, hauteur_map + 2), dtype=bool)
+    libres[:, 1:-1] = ~cases_bloquantes.T
+    debuts_suites = libres[:, 1:] & ~libres[:, :-1]
+    numeros_suites = numpy.cumsum(debuts_suites.ravel()).reshape(debuts_suites.shape) - 1
+    lignes = numpy.broadcast_to(numpy.arange(hauteur_map + 1), debuts_suites.shape)
+    debuts_lignes = lignes[debuts_suites].astype(numpy.float64)
+    fins_lignes = lignes[libres[:, :-1] & ~libres[:, 1:]].astype(numpy.float64) - 1
+
+    # Première ligne libre et première ligne bloquante au dessus / en dessous de chaque ligne (indexées par ligne + 1)
+    libre_haut = numpy.full((largeur_map, hauteur_map + 2), hauteur_map + 1, dtype=numpy.int64)
+    libre_bas = numpy.full((largeur_map, hauteur_map + 2), -2, dtype=numpy.int64)
+    bloquante_haut = numpy.full((largeur_map, hauteur_map + 2), hauteur_map, dtype=numpy.int64)
+    bloquante_bas = numpy.full((largeur_map, hauteur_map + 2), -1, dtype=numpy.int64)
+    for ligne in range(hauteur_map - 1, -1, -1):
+        libre_haut[:, ligne + 1] = numpy.where(libres[:, ligne + 1], ligne, libre_haut[:, ligne + 2])
+        bloquante_haut[:, ligne + 1] = numpy.where(libres[:, ligne + 1], bloquante_haut[:, ligne + 2], ligne)
+    libre_haut[:, 0] = libre_haut[:, 1]
+    for ligne in range(hauteur_map):
+        libre_bas[:, ligne + 1] = numpy.where(libres[:, ligne + 1], ligne, libre_bas[:, ligne])
+        bloquante_bas[:, ligne + 1] = numpy.where(libres[:, ligne + 1], bloquante_bas[:, ligne], ligne)
+    libre_bas[:, hauteur_map + 1] = libre_bas[:, hauteur_map]
+    bloquante_haut[:, 0], bloquante_bas[:, hauteur_map + 1] = -1, hauteur_map
+
+    # Droites traversant chaque source de largeur l et de hauteur h, à son bord droit : "-l * s <= v <= h" pour une pente négative, "0 <= v <= h + l * s" pour une pente positive
+    nombre_sources = x_sources.shape[0]
+    sommets_maximum = 12
+    sources = numpy.repeat(numpy.arange(nombre_sources), 2)
+    largeurs, hauteurs = largeurs_sources.astype(numpy.float64), hauteurs_sources.astype(numpy.float64)
+    zeros = numpy.zeros(nombre_sources)
+    polygones = numpy.zeros((sources.shape[0], sommets_maximum, 2))
+    polygones[0::2, :4, 0] = numpy.stack((-largeurs, hauteurs, hauteurs, zeros), axis=1)
+    polygones[0::2, :4, 1] = numpy.array([-1, -1, 0, 0], dtype=numpy.float64)
+    polygones[1::2, :4, 0] = numpy.stack((zeros, hauteurs, hauteurs + largeurs, zeros), axis=1)
+    polygones[1::2, :4, 1] = numpy.array([0, 0, 1, 1], dtype=numpy.float64)
+    polygones[:, :4, 0] += y_sources[sources, None]
+    nombres_sommets = numpy.full(sources.shape[0], 4)
+    x_depart = (x_sources + largeurs_sources)[sources].astype(numpy.int64)
+    colonnes = x_depart.copy()
+    atteintes_sources, atteintes_x, atteintes_y = [], [], []
+
+    # Avancer tous les faisceaux d'une colonne à la fois, en oubliant les faisceaux vides (ou réduits à une droite passant entre deux coins)
+    while sources.shape[0] > 0:
+        suivants = (numpy.arange(sommets_maximum)[None, :] + 1) % numpy.maximum(1, nombres_sommets)[:, None]
+        polygones_suivants = numpy.take_along_axis(polygones, suivants[:, :, None], axis=1)
+        aires = numpy.abs((polygones[:, :, 0] * polygones_suivants[:, :, 1] - polygones_suivants[:, :, 0] * polygones[:, :, 1]).sum(axis=1))
+        garde = (colonnes < largeur_map) & (nombres_sommets >= 3) & (aires > 0.000000001)
+        sources, x_depart, colonnes = sources[garde], x_depart[garde], colonnes[garde]
+        polygones, nombres_sommets = polygones[garde], nombres_sommets[garde]
+        if sources.shape[0] <= 0: break
+
+        # Calculer les lignes dont l'intérieur est traversé par chaque faisceau dans sa colonne
+        ecarts_debut = (colonnes - x_depart).astype(numpy.float64)
+        ecarts_fin = ecarts_debut + 1
+        utilises = numpy.arange(sommets_maximum)[None, :] < nombres_sommets[:, None]
+        y_debut = polygones[:, :, 0] + polygones[:, :, 1] * ecarts_debut[:, None]
+        y_fin = polygones[:, :, 0] + polygones[:, :, 1] * ecarts_fin[:, None]
+        y_bas = numpy.where(utilises, numpy.minimum(y_debut, y_fin), numpy.inf).min(axis=1)
+        y_haut = numpy.where(utilises, numpy.maximum(y_debut, y_fin), -numpy.inf).max(axis=1)
+        ligne_debut = numpy.floor(y_bas).astype(numpy.int64)
+        ligne_fin = numpy.maximum(ligne_debut, numpy.ceil(y_haut).astype(numpy.int64) - 1)
+
+        # Noter ces lignes, sans dépasser les premières cases bloquantes au dessus et en dessous de l'entrée du faisceau dans la colonne
+        entree_bas = numpy.floor(numpy.where(utilises, y_debut, numpy.inf).min(axis=1)).astype(numpy.int64)
+        entree_haut = numpy.maximum(entree_bas, numpy.ceil(numpy.where(utilises, y_debut, -numpy.inf).max(axis=1)).astype(numpy.int64) - 1)
+        ligne_debut_map = numpy.maximum(ligne_debut, bloquante_bas[colonnes, numpy.clip(entree_bas, -1, hauteur_map) + 1])
+        ligne_fin_map = numpy.minimum(ligne_fin, bloquante_haut[colonnes, numpy.clip(entree_haut, -1, hauteur_map) + 1])
+        ligne_debut_map, ligne_fin_map = numpy.clip(ligne_debut_map, 0, hauteur_map), numpy.clip(ligne_fin_map + 1, 0, hauteur_map)
+        nombres = numpy.maximum(0, ligne_fin_map - ligne_debut_map)
+        repetes = numpy.repeat(numpy.arange(sources.shape[0]), nombres)
+        atteintes_sources.append(sources[repetes])
+        atteintes_x.append(colonnes[repetes])
+        atteintes_y.append(ligne_debut_map[repetes] + numpy.arange(repetes.shape[0]) - numpy.repeat(numpy.cumsum(nombres) - nombres, nombres))
+
+        # Trouver les suites de cases libres couvertes par chaque faisceau, et le dupliquer pour chacune d'elles
+        premieres = libre_haut[colonnes, numpy.clip(ligne_debut, -1, hauteur_map) + 1]
+        dernieres = libre_bas[colonnes, numpy.clip(ligne_fin, -1, hauteur_map) + 1]
+        premieres_suites = numeros_suites[colonnes, numpy.clip(premieres, 0, hauteur_map)]
+        nombres = numpy.where(premieres <= dernieres, numeros_suites[colonnes, numpy.clip(dernieres, 0, hauteur_map)] - premieres_suites + 1, 0)
+        repetes = numpy.repeat(numpy.arange(sources.shape[0]), nombres)
+        suites = premieres_suites[repetes] + numpy.arange(repetes.shape[0]) - numpy.repeat(numpy.cumsum(nombres) - nombres, nombres)
+        sources, x_depart, colonnes = sources[repetes], x_depart[repetes], colonnes[repetes]
+        polygones, nombres_sommets = polygones[repetes], nombres_sommets[repetes]
+        ecarts_debut, ecarts_fin = ecarts_debut[repetes], ecarts_fin[repetes]
+
+        # Garder les droites qui traversent toute la colonne dans leur suite de cases libres
+        uns = numpy.ones(sources.shape[0])
+        bas, haut = debuts_lignes[suites], fins_lignes[suites] + 1
+        for ecarts in (ecarts_debut, ecarts_fin):
+            polygones, nombres_sommets = raycast_lot_couper_polygones(polygones, nombres_sommets, -uns, -ecarts, -bas)
+            polygones, nombres_sommets = raycast_lot_couper_polygones(polygones, nombres_sommets, uns, ecarts, haut)
+        colonnes = colonnes + 1
+    return (numpy.concatenate(atteintes_sources), numpy.concatenate(atteintes_x), numpy.concatenate(atteintes_y))
+def raycast_lot_pvs(map_materiaux: "numpy.ndarray", map_hauteurs: "numpy.ndarray", blocs: "numpy.ndarray", taille_bloc: int, hauteur_opaque: float) -> "numpy.ndarray":
+    """Retourne toutes les cases visibles depuis un point quelconque de blocs de cases, pour calculer le PVS (ensemble potentiellement visible) de la map
+
+    Toutes les droites traversant chaque bloc sont suivies par faisceaux (voir "raycast_lot_faisceaux_pvs"), dans les quatre directions principales,
+    jusqu'à ce qu'elles sortent de la map ou touchent une case au moins aussi haute que "hauteur_opaque".
+    Les cases à moins de "taille_bloc" cases du bloc, que les droites traversent avant d'atteindre le bord du bloc, sont toujours visibles.
+    Le résultat est conservatif : une case visible depuis un point du bloc en fait toujours partie.
+    Les cases visibles sont retournées sous la forme "bloc * taille de la map + indice de la case", triées et sans doublon.
+
+    Args:
+        map_materiaux (numpy.ndarray): id des matériaux de chaque case de la map (0 pour une case vide), indexés par [y, x]
+        map_hauteurs (numpy.ndarray): hauteur de chaque case de la map, indexées par [y, x]
+        blocs (numpy.ndarray): indice (y * nombre de blocs en X + x) de chaque bloc source, trié
+        taille_bloc (int): nombre de cases de côté d'un bloc (les blocs du bord de la map peuvent être plus petits)
+        hauteur_opaque (float): hauteur à partir de laquelle une case arrête les droites
+
+    Returns:
+        numpy.ndarray: cases visibles depuis les blocs, associées à leur bloc
+    """
+
+    # Préparation des blocs
+    hauteur_map, largeur_map = map_materiaux.shape
+    taille_map = hauteur_map * largeur_map
+    cases_bloquantes = (map_materiaux != 0) & (map_hauteurs >= hauteur_opaque)
+    blocs = blocs.astype(numpy.int64)
+    largeur_blocs = -(-largeur_map // taille_bloc)
+    x_blocs, y_blocs = (blocs % largeur_blocs) * taille_bloc, (blocs // largeur_blocs) * taille_bloc
+    largeurs_blocs, hauteurs_blocs = numpy.minimum(taille_bloc, largeur_map - x_blocs), numpy.minimum(taille_bloc, hauteur_map - y_blocs)
+
+    # Les cases autour de chaque bloc sont toujours visibles (les faisceaux partent du bord du bloc)
+    numeros = numpy.arange(blocs.shape[0])
+    visibles = numpy.zeros((blocs.shape[0], hauteur_map, largeur_map), dtype=bool)
+    for ajout_x in range(-taille_bloc, 2 * taille_bloc):
+        for ajout_y in range(-taille_bloc, 2 * taille_bloc):
+            x_cases, y_cases = x_blocs + ajout_x, y_blocs + ajout_y
+            dans_map = (x_cases >= 0) & (y_cases >= 0) & (x_cases < largeur_map) & (y_cases < hauteur_map)
+            visibles[numeros[dans_map], y_cases[dans_map], x_cases[dans_map]] = True
+
+    # Suivre les faisceaux vers les X croissants dans la map retournée et / ou transposée, pour couvrir les quatre directions
+    for transposer in (False, True):
+        for retourner in (False, True):
+            grille, x_grille, y_grille, largeurs, hauteurs = cases_bloquantes, x_blocs, y_blocs, largeurs_blocs, hauteurs_blocs
+            if transposer: grille, x_grille, y_grille, largeurs, hauteurs = grille.T, y_grille, x_grille, hauteurs, largeurs
+            if retourner: grille, x_grille = grille[:, ::-1], grille.shape[1] - x_grille - largeurs
+            indices, x_cases, y_cases = raycast_lot_faisceaux_pvs(grille, x_grille, y_grille, largeurs, hauteurs)
+            if retourner: x_cases = grille.shape[1] - 1 - x_cases
+            if transposer: x_cases, y_cases = y_cases, x_cases
+            visibles[indices, y_cases, x_cases] = True
+
+    # Numéroter les cases visibles avec leur bloc
+    visibles = numpy.flatnonzero(visibles)
+    return blocs[visibles // taille_map] * taille_map + visibles % taille_map
+
+#******************
+#
+# Le raycast par lot dans plusieurs processus
+#
+#******************
+
+# Mémoires partagées déjà ouvertes dans ce processus (par nom)
+memoires_partagees_ouvertes = {}
+
+def ouvrir_memoires_partagees(noms: tuple) -> list:
+    """Ouvre (ou retourne si elles sont déjà ouvertes) des mémoires partagées créées par un autre processus, et ferme les autres
+
+    Les mémoires ouvertes dont le nom n'est pas dans "noms" ont été remplacées par le processus principal (map modifiée, autre largeur d'écran, autre groupe) :
+    elles sont fermées, pour que ce processus ne les garde pas jusqu'à sa fin. Une mémoire encore utilisée par un tableau est fermée à un prochain appel.
+
+    Args:
+        noms (tuple): noms des mémoires partagées utilisées actuellement
+
+    Returns:
+        list: mémoires partagées ouvertes, dans l'ordre de "noms"
+    """
+
+    # Fermer les mémoires qui ne sont plus utilisées
+    for nom in list(memoires_partagees_ouvertes):
+        if nom in noms: continue
+        try:
+            memoires_partagees_ouvertes[nom].close()
+        except BufferError:
+            continue
+        del memoires_partagees_ouvertes[nom]
+
+    # Ouvrir les nouvelles mémoires
+    for nom in noms:
+        if nom not in memoires_partagees_ouvertes: memoires_partagees_ouvertes[nom] = shared_memory.SharedMemory(name=nom)
+    return [memoires_partagees_ouvertes[nom] for nom in noms]
+
+def raycast_lot_bande(nom_map: str, forme_map: tuple, nom_resultat: str, largeur_ecran: int, nombre_couches: int, point_de_depart: tuple, angles: "numpy.ndarray", colonne_debut: int, distance_maximum: float = 0) -> None:
+    """Effectue le raycast par lot d'une bande de colonnes, dans un processus secondaire
+
+    La map est lue et le résultat est écrit directement dans des mémoires partagées.
+
+    Args:
+        nom_map (str): nom de la mémoire partagée contenant la map
+        forme_map (tuple): forme (hauteur, largeur) de la map
+        nom_resultat (str): nom de la mémoire partagée contenant le résultat
+        largeur_ecran (int): nombre total de colonnes du résultat
+        nombre_couches (int): nombre maximum de collisions par colonne
+        point_de_depart (tuple): point de départ (x, y, z) des rayons
+        angles (numpy.ndarray): angle absolu de chaque rayon de la bande
+        colonne_debut (int): première colonne de la bande
+        distance_maximum (float, optional): distance au delà de laquelle les rayons s'arrêtent (0 pour ne pas avoir de limite). Defaults to 0.
+    """
+
+    # Effectuer le raycast de la bande
+    memoire_map, memoire_resultat = ouvrir_memoires_partagees((nom_map, nom_resultat))
+    map_hauteurs = numpy.ndarray(forme_map, dtype=numpy.float64, buffer=memoire_map.buf)
+    map_materiaux = numpy.ndarray(forme_map, dtype=numpy.uint16, buffer=memoire_map.buf, offset=map_hauteurs.nbytes)
+    resultat = Raycast_Lot(largeur_ecran, nombre_couches, memoire_resultat.buf)
+    raycast_lot_colonnes(resultat, map_materiaux, map_hauteurs, point_de_depart, angles, colonne_debut, distance_maximum)
+
+class Raycast_Lot_Processus:
+    """Classe représentant un groupe de processus effectuant des raycasts par lot, chacun sur une bande de colonnes
+
+    La map et le résultat sont partagés avec les processus grâce à des mémoires partagées :
+    chaque processus écrit uniquement les colonnes de sa bande, donc le résultat ne dépend pas de l'ordre d'exécution.
+    """
+
+    # Constructeur de "Raycast_Lot_Processus"
+    def __init__(self, nombre_processus: int) -> None:
+        """Constructeur de "Raycast_Lot_Processus"
+
+        Args:
+            nombre_processus (int): nombre de processus utilisés
+        """
+
+        # Définition des attributs
+        self.__executeur = concurrent.futures.ProcessPoolExecutor(nombre_processus)
+        self.__forme_map = (0, 0)
+        self.__map_source = 0
+        self.__memoire_map = 0
+        self.__memoire_resultat = 0
+        self.__nombre_processus = nombre_processus
+        self.__resultat = 0
+
+    def __del__(self) -> None:
+        """Destructeur de "Raycast_Lot_Processus"""
+        self.fermer()
+
+    # Ferme une mémoire partagée créée par ce groupe
+    def __fermer_memoire(self, memoire: shared_memory.SharedMemory) -> None:
+        """Ferme et supprime une mémoire partagée créée par ce groupe
+
+        Args:
+            memoire (shared_memory.SharedMemory): mémoire à fermer
+        """
+        if memoire == 0: return
+        try:
+            memoire.close()
+        except BufferError:
+            # Des tableaux utilisent encore la mémoire, qui sera libérée avec eux
+            pass
+        memoire.unlink()
+    # Ferme le groupe de processus
+    def fermer(self) -> None:
+        """Arrête les processus et supprime les mémoires partagées"""
+        if self.__executeur != 0:
+            self.__executeur.shutdown(wait=True)
+            self.__executeur = 0
+        self.__resultat = 0
+        self.__fermer_memoire(self.__memoire_map)
+        self.__fermer_memoire(self.__memoire_resultat)
+        self.__memoire_map = 0
+        self.__memoire_resultat = 0
+
+    # Prépare la map dans la mémoire partagée
+    def __preparer_map(self, map_materiaux: "numpy.ndarray", map_hauteurs: "numpy.ndarray") -> None:
+        """Copie la map dans une mémoire partagée, si elle a changé
+
+        Args:
+            map_materiaux (numpy.ndarray): id des matériaux de chaque case de la map
+            map_hauteurs (numpy.ndarray): hauteur de chaque case de la map
+        """
+        if self.__map_source != 0 and self.__map_source[0] is map_materiaux and self.__map_source[1] is map_hauteurs: return
+
+        # Créer la nouvelle mémoire
+        self.__fermer_memoire(self.__memoire_map)
+        self.__forme_map = map_materiaux.shape
+        self.__memoire_map = shared_memory.SharedMemory(create=True, size=max(1, map_hauteurs.size * 8 + map_materiaux.size * 2))
+        hauteurs = numpy.ndarray(self.__forme_map, dtype=numpy.float64, buffer=self.__memoire_map.buf)
+        hauteurs[:] = map_hauteurs
+        materiaux = numpy.ndarray(self.__forme_map, dtype=numpy.uint16, buffer=self.__memoire_map.buf, offset=hauteurs.nbytes)
+        materiaux[:] = map_materiaux
+        del hauteurs, materiaux
+        self.__map_source = (map_materiaux, map_hauteurs)
+    # Prépare le résultat dans la mémoire partagée
+    def __preparer_resultat(self, largeur_ecran: int, nombre_couches: int) -> None:
+        """Prépare un résultat vide dans une mémoire partagée, réallouée seulement si sa taille change
+
+        Args:
+            largeur_ecran (int): nombre de colonnes du raycast
+            nombre_couches (int): nombre maximum de collisions par colonne
+        """
+        if self.__resultat == 0 or self.__resultat.largeur_ecran() != largeur_ecran or self.__resultat.nombre_couches() != nombre_couches:
+            # Créer la nouvelle mémoire
+            self.__resultat = 0
+            self.__fermer_memoire(self.__memoire_resultat)
+            self.__memoire_resultat = shared_memory.SharedMemory(create=True, size=taille_tampon_raycast_lot(largeur_ecran, nombre_couches))
+            self.__resultat = Raycast_Lot(largeur_ecran, nombre_couches, self.__memoire_resultat.buf)
+        self.__resultat.vider()
+
+    # Effectue un raycast par lot
+    def raycast(self, map_materiaux: "numpy.ndarray", map_hauteurs: "numpy.ndarray", point_de_depart: tuple, angles: "numpy.ndarray", nombre_couches: int, distance_maximum: float = 0) -> Raycast_Lot:
+        """Effectue un raycast par lot, en découpant les colonnes en une bande par processus
+
+        Args:
+            map_materiaux (numpy.ndarray): id des matériaux de chaque case de la map (0 pour une case vide), indexés par [y, x]
+            map_hauteurs (numpy.ndarray): hauteur de chaque case de la map, indexées par [y, x]
+            point_de_depart (tuple): point de départ (x, y, z) des rayons
+            angles (numpy.ndarray): angle absolu de chaque rayon
+            nombre_couches (int): nombre maximum de collisions par colonne
+            distance_maximum (float, optional): distance au delà de laquelle les rayons s'arrêtent (0 pour ne pas avoir de limite). Defaults to 0.
+
+        Returns:
+            Raycast_Lot: résultat du raycast (valable jusqu'au prochain raycast de ce groupe)
+        """
+
+        # Préparer les mémoires partagées
+        largeur_ecran = angles.shape[0]
+        self.__preparer_map(map_materiaux, map_hauteurs)
+        self.__preparer_resultat(largeur_ecran, nombre_couches)
+
+        # Envoyer une bande de colonnes à chaque processus, et attendre la fin de toutes les bandes
+        taches = []
+        for bande in numpy.array_split(numpy.arange(largeur_ecran), self.__nombre_processus):
+            if bande.shape[0] <= 0: continue
+            debut, fin = int(bande[0]), int(bande[-1]) + 1
+            taches.append(self.__executeur.submit(raycast_lot_bande, self.__memoire_map.name, self.__forme_map, self.__memoire_resultat.name, largeur_ecran, nombre_couches, point_de_depart, angles[debut:fin], debut, distance_maximum))
+        for tache in taches: tache.result()
+        return self.__resultat
+
+    # Getters et setters
+    def nombre_processus(self) -> int:
+        """Retourne le nombre de processus utilisés
+
+        Returns:
+            int: nombre de processus utilisés
+        """
+        return self.__nombre_processus
@@ -22,17 +22,27 @@
 #
 
 # Importer des fonctions mathématiques nécessaires
-from math import ceil, floor, pow, sqrt
+from math import atan2, ceil, cos, floor, inf, pi, pow, sin, sqrt
 # Importer pygame pour utiliser Pygame
 import pygame
 # Importer des données sur les chemin d'accés
 import os.path
+# Importer le CRC32 pour reconnaître la map d'un PVS sauvegardé
+from zlib import crc32
+# Importer des tableaux compacts pour stocker la map
+from array import array
+# Importer la recherche dichotomique pour ranger les collisions
+from bisect import bisect_right
+# Importer la copie, les données par thread et les verrous pour les instantanés et les rendus en même temps
+from contextlib import nullcontext
+from copy import copy
+import threading
 # Importer les données mathématiques nécessaire pour le raycast
 from mlib_math.mlib_math_transformation import *
 # Importer les données basique sur le raycast
 from mlib_raycast_objet import *
-# Importer des outils de multi thread
-import threading
+# Importer le raycast par lot
+from mlib_raycast_lot import *
 
 #******************
 #
@@ -44,15 +54,22 @@ class Raycast_Case:
     """Classe représentant une case de la map d'un moteur raycast"""
 
     # Constructeur de "Raycast_Case"
-    def __init__(self, contenu: Raycast_Materiel, x: int, y: int) -> None:
+    def __init__(self, contenu: Raycast_Materiel, x: int, y: int, hauteur: float = 1) -> None:
         """Constructeur de "Raycast_Case"
+
+        Les cases ne sont créées qu'à leur première utilisation, la map étant stockée dans des tableaux compacts.
+
+        Args:
+            contenu (Raycast_Materiel): contenu de la case (ou 0 si elle est vide)
+            x (int): coordonnée X de la case
+            y (int): coordonnée Y de la case
+            hauteur (float, optional): hauteur du contenu de la case. Defaults to 1.
         """
 
         # Définition des attributs
         self.__contenu = contenu
-        self.__hauteur = 1
+        self.__hauteur = hauteur
         self.__numero_frame_dernier_rendu = 0
-        self.__sous_map = []
         self.__x = x
         self.__y = y
 
@@ -98,6 +115,109 @@ class Raycast_Case:
         """
         return self.__y
 
+#******************
+#
+# La classe "Raycast_Tampons_Rendu"
+#
+#******************
+
+class Raycast_Tampons_Rendu:
+    """Classe représentant les tampons du rendu 3D d'une caméra, gardés entre les frames
+
+    Chaque caméra a ses propres tampons, pour que plusieurs caméras d'un même moteur puissent être rendues en même temps.
+    """
+
+    # Constructeur de "Raycast_Tampons_Rendu"
+    def __init__(self) -> None:
+        """Constructeur de "Raycast_Tampons_Rendu"""
+
+        # Définition des attributs
+        self.__hauts_colonnes = array("l")
+        self.__profondeurs_colonnes = array("d")
+        self.__rayons_2d = 0
+        self.__surface_rendu_3d = 0
+        self.__tampon_collisions = Raycast_Tampon_Collisions()
+        self.__texture_bas = 0
+
+    # Getters et setters
+    def hauts_colonnes(self) -> array:
+        """Retourne le haut dessiné de chaque colonne de l'écran par la collision la plus proche
+
+        Returns:
+            array: haut dessiné de chaque colonne de l'écran
+        """
+        return self.__hauts_colonnes
+    def profondeurs_colonnes(self) -> array:
+        """Retourne la distance de la collision la plus proche de chaque colonne de l'écran (le tampon de profondeur)
+
+        Returns:
+            array: distance de la collision la plus proche de chaque colonne de l'écran
+        """
+        return self.__profondeurs_colonnes
+    def rayons_2d(self) -> tuple:
+        """Retourne les rayons du dernier rendu 3D, gardés pour le rendu 2D
+
+        Returns:
+            tuple: numéro de la frame du rendu, X, Y, Z et rotation Y de la caméra au départ des rayons, X et Y des directions des colonnes de l'écran, colonne et distance de la première collision de chaque rayon (inf si il ne touche rien), ou 0 si aucun rendu 3D n'a été fait
+        """
+        return self.__rayons_2d
+    def set_hauts_colonnes(self, nouveaux_hauts_colonnes: array) -> None:
+        """Change le haut dessiné de chaque colonne de l'écran par la collision la plus proche
+
+        Args:
+            nouveaux_hauts_colonnes (array): nouveau haut dessiné de chaque colonne de l'écran
+        """
+        self.__hauts_colonnes = nouveaux_hauts_colonnes
+    def set_profondeurs_colonnes(self, nouvelles_profondeurs_colonnes: array) -> None:
+        """Change la distance de la collision la plus proche de chaque colonne de l'écran
+
+        Args:
+            nouvelles_profondeurs_colonnes (array): nouvelle distance de la collision la plus proche de chaque colonne de l'écran
+        """
+        self.__profondeurs_colonnes = nouvelles_profondeurs_colonnes
+    def set_rayons_2d(self, nouveaux_rayons_2d: tuple) -> None:
+        """Change les rayons du dernier rendu 3D, gardés pour le rendu 2D
+
+        Args:
+            nouveaux_rayons_2d (tuple): numéro de la frame du rendu, X, Y, Z et rotation Y de la caméra au départ des rayons, X et Y des directions des colonnes de l'écran, colonne et distance de la première collision de chaque rayon (inf si il ne touche rien)
+        """
+        self.__rayons_2d = nouveaux_rayons_2d
+    def set_surface_rendu_3d(self, nouvelle_surface_rendu_3d: pygame.Surface) -> None:
+        """Change la surface du rendu 3D
+
+        Args:
+            nouvelle_surface_rendu_3d (pygame.Surface): nouvelle surface du rendu 3D
+        """
+        self.__surface_rendu_3d = nouvelle_surface_rendu_3d
+    def set_texture_bas(self, nouvelle_texture_bas: pygame.Surface) -> None:
+        """Change la texture en bas du rendu 3D
+
+        Args:
+            nouvelle_texture_bas (pygame.Surface): nouvelle texture en bas du rendu 3D
+        """
+        self.__texture_bas = nouvelle_texture_bas
+    def surface_rendu_3d(self) -> pygame.Surface:
+        """Retourne la surface du rendu 3D (ou 0 si elle n'a pas encore été créée)
+
+        Returns:
+            pygame.Surface: surface du rendu 3D
+        """
+        return self.__surface_rendu_3d
+    def tampon_collisions(self) -> "Raycast_Tampon_Collisions":
+        """Retourne le tampon des collisions du raycast
+
+        Returns:
+            Raycast_Tampon_Collisions: tampon des collisions du raycast
+        """
+        return self.__tampon_collisions
+    def texture_bas(self) -> pygame.Surface:
+        """Retourne la texture en bas du rendu 3D (ou 0 si elle n'a pas encore été créée)
+
+        Returns:
+            pygame.Surface: texture en bas du rendu 3D
+        """
+        return self.__texture_bas
+
 #******************
 #
 # La classe "Raycast_Camera"
@@ -117,12 +237,109 @@ class Raycast_Camera(Transformation_3D):
         super().__init__()
 
         # Définition des attributs
+        self.__brouillard = False
+        self.__directions_tournees = {}
+        self.__distance_brouillard = 0
         self.__distance_ecran = distance_ecran
+        self.__distance_maximum = 0
         self.__fov = 1
         self.__largeur_ecran = largeur_ecran
+        self.__nombre_rayons = 0
         self.__raycast_moteur_structure = raycast_moteur_structure
-    
+        self.__tables_directions = {}
+        self.__tampons_rendu = Raycast_Tampons_Rendu()
+
+    # Copie la caméra
+    def __copy__(self) -> "Raycast_Camera":
+        """Copie la caméra, sans partager ses tables de directions (qui sont remplies pendant le rendu)
+
+        Les tampons de rendu restent partagés avec la caméra copiée.
+
+        Returns:
+            Raycast_Camera: copie de la caméra
+        """
+        copie = Raycast_Camera.__new__(Raycast_Camera)
+        copie.__dict__.update(self.__dict__)
+        copie.__directions_tournees = dict(self.__directions_tournees)
+        copie.__tables_directions = dict(self.__tables_directions)
+        return copie
+    # Retourne la table des directions des colonnes de pixels
+    def table_directions(self, largeur_ecran: int) -> tuple:
+        """Retourne l'angle de chaque colonne de pixels par rapport à l'avant de la caméra, et son vecteur unitaire pour une rotation nulle
+
+        La table contient une colonne de plus que l'écran, pour le bord droit de l'écran.
+        Elle n'est recalculée que si le FOV ou la largeur de l'écran change.
+
+        Args:
+            largeur_ecran (int): nombre de colonnes de pixels de l'écran
+
+        Returns:
+            tuple: angles, X et Y des vecteurs unitaires de chaque colonne
+        """
+        if largeur_ecran not in self.__tables_directions:
+            angles = [self.__fov / 2.0 - (i / largeur_ecran) * self.__fov for i in range(largeur_ecran + 1)]
+            self.__tables_directions[largeur_ecran] = (angles, [cos(angle) for angle in angles], [sin(angle) for angle in angles])
+        return self.__tables_directions[largeur_ecran]
+    # Retourne la direction de chaque colonne de pixels selon la rotation de la caméra
+    def directions(self, largeur_ecran: int) -> tuple:
+        """Retourne le vecteur unitaire de chaque colonne de pixels, tourné selon la rotation Y de la caméra
+
+        La table des directions est tournée avec une seule rotation, recalculée seulement si la caméra a tourné.
+
+        Args:
+            largeur_ecran (int): nombre de colonnes de pixels de l'écran
+
+        Returns:
+            tuple: X et Y des vecteurs unitaires de chaque colonne
+        """
+        directions = self.__directions_tournees.get(largeur_ecran, 0)
+        if directions == 0 or directions[0] != self.rotation_y():
+            # Tourner la table avec la rotation Y de la caméra
+            angles, x_table, y_table = self.table_directions(largeur_ecran)
+            cos_rotation, sin_rotation = cos(self.rotation_y()), sin(self.rotation_y())
+            x_directions = [cos_rotation * x - sin_rotation * y for x, y in zip(x_table, y_table)]
+            y_directions = [sin_rotation * x + cos_rotation * y for x, y in zip(x_table, y_table)]
+            directions = (self.rotation_y(), x_directions, y_directions)
+            self.__directions_tournees[largeur_ecran] = directions
+        return (directions[1], directions[2])
+    # Retourne la force du brouillard à une certaine distance
+    def facteur_brouillard(self, distance: float) -> float:
+        """Retourne la force du brouillard à une certaine distance, qui augmente linéairement entre la distance de début du brouillard et la distance maximum
+
+        Args:
+            distance (float): distance à tester
+
+        Returns:
+            float: force du brouillard, entre 0 (pas de brouillard) et 1 (couleur d'arrière plan)
+        """
+        if not self.__brouillard or self.__distance_maximum <= 0 or distance <= self.__distance_brouillard: return 0
+        if distance >= self.__distance_maximum or self.__distance_maximum <= self.__distance_brouillard: return 1
+        return (distance - self.__distance_brouillard) / (self.__distance_maximum - self.__distance_brouillard)
+    # Retourne la distance maximum dans le plan de la map
+    def distance_plane_maximum(self) -> float:
+        """Retourne la distance maximum projetée dans le plan de la map, selon la hauteur de la caméra
+
+        Returns:
+            float: distance maximum projetée dans le plan de la map (ou inf si elle n'a pas de limite)
+        """
+        if self.__distance_maximum <= 0: return inf
+        return sqrt(max(0, self.__distance_maximum * self.__distance_maximum - self.z() * self.z()))
+
     # Getters et setters
+    def brouillard(self) -> bool:
+        """Retourne si le brouillard est utilisé
+
+        Returns:
+            bool: si le brouillard est utilisé
+        """
+        return self.__brouillard
+    def distance_brouillard(self) -> float:
+        """Retourne la distance à partir de laquelle le brouillard commence
+
+        Returns:
+            float: distance à partir de laquelle le brouillard commence
+        """
+        return self.__distance_brouillard
     def distance_ecran(self) -> float:
         """Retourne la distance de la caméra à l'écran
 
@@ -130,6 +347,13 @@ class Raycast_Camera(Transformation_3D):
             float: distance de la caméra à l'écran
         """
         return self.__distance_ecran
+    def distance_maximum(self) -> float:
+        """Retourne la distance maximum de rendu de la caméra
+
+        Returns:
+            float: distance maximum de rendu de la caméra (0 pour ne pas avoir de limite)
+        """
+        return self.__distance_maximum
     def fov(self) -> float:
         """Retourne le FOV de la caméra
 
@@ -144,6 +368,13 @@ class Raycast_Camera(Transformation_3D):
             int: largeur de l'écran en pixel
         """
         return self.__largeur_ecran
+    def nombre_rayons(self) -> int:
+        """Retourne le nombre de rayons utilisés pour le rendu 3D de la caméra en mode classique
+
+        Returns:
+            int: nombre de rayons utilisés pour le rendu 3D de la caméra (0 pour utiliser celui du moteur)
+        """
+        return self.__nombre_rayons
     def ratio_ecran(self) -> float:
         """Retourne le ratio largeur / hauteur de l'écran
 
@@ -151,6 +382,31 @@ class Raycast_Camera(Transformation_3D):
             float: ratio largeur / hauteur de l'écran
         """
         return 1
+    def set_brouillard(self, nouveau_brouillard: bool) -> None:
+        """Change si le brouillard est utilisé
+
+        Le brouillard mélange les collisions avec la couleur d'arrière plan du moteur, jusqu'à la distance maximum.
+
+        Args:
+            nouveau_brouillard (bool): si le brouillard est utilisé
+        """
+        self.__brouillard = nouveau_brouillard
+    def set_distance_brouillard(self, nouvelle_distance_brouillard: float) -> None:
+        """Change la distance à partir de laquelle le brouillard commence
+
+        Args:
+            nouvelle_distance_brouillard (float): nouvelle distance à partir de laquelle le brouillard commence
+        """
+        self.__distance_brouillard = nouvelle_distance_brouillard
+    def set_distance_maximum(self, nouvelle_distance_maximum: float) -> None:
+        """Change la distance maximum de rendu de la caméra
+
+        Les rayons s'arrêtent et les objets dynamiques ne sont plus dessinés au delà de cette distance.
+
+        Args:
+            nouvelle_distance_maximum (float): nouvelle distance maximum de rendu de la caméra (0 pour ne pas avoir de limite)
+        """
+        self.__distance_maximum = nouvelle_distance_maximum
     def set_fov(self, nouveau_fov: float) -> None:
         """Change le FOV de la caméra
 
@@ -158,6 +414,31 @@ class Raycast_Camera(Transformation_3D):
             nouveau_fov (float): nouveau FOV de la caméra
         """
         self.__fov = nouveau_fov
+        self.__directions_tournees = {}
+        self.__tables_directions = {}
+    def set_largeur_ecran(self, nouvelle_largeur_ecran: int) -> None:
+        """Change la largeur de l'écran en pixel
+
+        Args:
+            nouvelle_largeur_ecran (int): nouvelle largeur de l'écran en pixel
+        """
+        self.__largeur_ecran = nouvelle_largeur_ecran
+    def set_nombre_rayons(self, nouveau_nombre_rayons: int) -> None:
+        """Change le nombre de rayons utilisés pour le rendu 3D de la caméra en mode classique
+
+        Ce nombre est copié dans les instantanés de la caméra : le changer ne modifie pas un rendu en cours.
+
+        Args:
+            nouveau_nombre_rayons (int): nouveau nombre de rayons utilisés pour le rendu 3D de la caméra (0 pour utiliser celui du moteur)
+        """
+        self.__nombre_rayons = nouveau_nombre_rayons
+    def tampons_rendu(self) -> Raycast_Tampons_Rendu:
+        """Retourne les tampons du rendu 3D de la caméra, partagés avec ses instantanés
+
+        Returns:
+            Raycast_Tampons_Rendu: tampons du rendu 3D de la caméra
+        """
+        return self.__tampons_rendu
 
 #******************
 #
@@ -165,159 +446,315 @@ class Raycast_Camera(Transformation_3D):
 #
 #******************
 
-class Raycast_Collision:
-    """Classe représentant une collision dans un raycast"""
+class Raycast_Tampon_Collisions:
+    """Classe représentant les collisions d'un raycast entier, rangées dans des tableaux parallèles
 
-    # Constructeur de "Raycast_Collision"
-    def __init__(self) -> None:
-        """Constructeur de "Raycast_Collision"
+    Les tableaux sont préalloués et seulement vidés entre deux raycasts, pour ne pas créer d'objet par collision.
+    """
 
-        Returns:
-            _type_: _description_
+    # Constructeur de "Raycast_Tampon_Collisions"
+    def __init__(self, capacite: int = 1024) -> None:
+        """Constructeur de "Raycast_Tampon_Collisions"
+
+        Args:
+            capacite (int, optional): nombre de collisions pouvant être stockées avant d'agrandir les tableaux. Defaults to 1024.
         """
 
         # Définition des attributs
-        self.__case_sortie = Point_3D()
-        self.__case_sortie_distance = -1
-        self.__case_touchee = 0
-        self.__entree = Point_3D()
-        self.__entree_distance = -1
-        self.__objet_dynamique_touche = 0
-        self.__offset_x = 0
+        self.__cachables = array("b")
+        self.__capacite = 0
+        self.__cases = []
+        self.__distances = array("d")
+        self.__distances_sortie = array("d")
+        self.__nombre_collisions = 0
+        self.__objets_dynamiques = []
+        self.__offsets_x = array("l")
         self.__point_depart = 0
-        self.__x_texture = 0
+        self.__x_entrees = array("d")
+        self.__x_sorties = array("d")
+        self.__x_textures = array("d")
+        self.__y_entrees = array("d")
+        self.__y_sorties = array("d")
+        self.__agrandir(capacite)
+
+    # Agrandit les tableaux du tampon
+    def __agrandir(self, nouvelle_capacite: int) -> None:
+        """Agrandit les tableaux du tampon
+
+        Args:
+            nouvelle_capacite (int): nouvelle capacité du tampon
+        """
+        ajout = nouvelle_capacite - self.__capacite
+        self.__cachables.extend(array("b", [0]) * ajout)
+        self.__cases.extend([0] * ajout)
+        self.__objets_dynamiques.extend([0] * ajout)
+        self.__offsets_x.extend(array("l", [0]) * ajout)
+        for tableau in (self.__distances, self.__distances_sortie, self.__x_entrees, self.__x_sorties, self.__x_textures, self.__y_entrees, self.__y_sorties):
+            tableau.extend(array("d", [0]) * ajout)
+        self.__capacite = nouvelle_capacite
+    # Ajoute une collision au tampon
+    def ajouter(self, case_touchee: Raycast_Case, objet_dynamique_touche: Raycast_Objet_Dynamique, offset_x: int, x_entree: float, y_entree: float, distance_entree: float, x_sortie: float, y_sortie: float, distance_sortie: float, x_texture: float, cachable: bool = True) -> int:
+        """Ajoute une collision au tampon
+
+        Args:
+            case_touchee (Raycast_Case): case touchée (ou 0)
+            objet_dynamique_touche (Raycast_Objet_Dynamique): objet dynamique touché (ou 0)
+            offset_x (int): offset X de la collision dans son rayon
+            x_entree (float): X du point d'entrée
+            y_entree (float): Y du point d'entrée
+            distance_entree (float): distance du point d'entrée
+            x_sortie (float): X du point de sortie
+            y_sortie (float): Y du point de sortie
+            distance_sortie (float): distance du point de sortie (ou -1 si il n'existe pas)
+            x_texture (float): position X de la collision sur la texture, entre 0 et 1
+            cachable (bool, optional): si la collision est entièrement cachée par une case opaque plus proche dans sa colonne. Defaults to True.
+
+        Returns:
+            int: indice de la collision dans le tampon
+        """
+        indice = self.__nombre_collisions
+        if indice >= self.__capacite: self.__agrandir(self.__capacite * 2)
+        self.__cachables[indice] = cachable
+        self.__cases[indice] = case_touchee
+        self.__distances[indice] = distance_entree
+        self.__distances_sortie[indice] = distance_sortie
+        self.__objets_dynamiques[indice] = objet_dynamique_touche
+        self.__offsets_x[indice] = offset_x
+        self.__x_entrees[indice] = x_entree
+        self.__x_sorties[indice] = x_sortie
+        self.__x_textures[indice] = x_texture
+        self.__y_entrees[indice] = y_entree
+        self.__y_sorties[indice] = y_sortie
+        self.__nombre_collisions += 1
+        return indice
+    # Vide le tampon
+    def vider(self) -> None:
+        """Vide le tampon, sans réallouer ses tableaux"""
+        self.__nombre_collisions = 0
 
     # Getters et setters
-    def case_sortie(self) -> Point_3D:
-        """Retourne la sortie de la case du raycast
+    def cachables(self) -> array:
+        """Retourne si chaque collision est entièrement cachée par une case opaque plus proche dans sa colonne
 
         Returns:
-            Point_3D: sortie de la case du raycast
+            array: si chaque collision est cachable (1) ou pas (0)
         """
-        return self.__case_sortie
-    def case_sortie_distance(self) -> float:
-        """Retourne la distance de la sortie de la case du raycast
+        return self.__cachables
+    def capacite(self) -> int:
+        """Retourne le nombre de collisions pouvant être stockées avant d'agrandir les tableaux
 
         Returns:
-            float: distance de la sortie de la case du raycast
+            int: nombre de collisions pouvant être stockées avant d'agrandir les tableaux
         """
-        return self.__case_sortie_distance
-    def case_touchee(self) -> Raycast_Case:
-        """Retourne la case touchée
+        return self.__capacite
+    def cases(self) -> list:
+        """Retourne la case touchée par chaque collision (ou 0)
 
         Returns:
-            Raycast_Case: case touchée
+            list: case touchée par chaque collision
         """
-        return self.__case_touchee
-    def entree(self) -> Point_3D:
-        """Retourne l'entrée de la case du raycast
+        return self.__cases
+    def distances(self) -> array:
+        """Retourne la distance d'entrée de chaque collision
 
         Returns:
-            Point_3D: entrée de la case du raycast
+            array: distance d'entrée de chaque collision
         """
-        return self.__entree
-    def entree_distance(self) -> float:
-        """Retourne la distance de l'entrée de la case du raycast
+        return self.__distances
+    def distances_sortie(self) -> array:
+        """Retourne la distance de sortie de chaque collision (ou -1)
 
         Returns:
-            float: distance de l'entrée de la case du raycast
+            array: distance de sortie de chaque collision
         """
-        return self.__entree_distance
-    def objet_dynamique_touche(self) -> Raycast_Objet_Dynamique:
-        """Retourne l'objet dynamique touché dans la collision
+        return self.__distances_sortie
+    def nombre_collisions(self) -> int:
+        """Retourne le nombre de collisions dans le tampon
 
         Returns:
-            Raycast_Objet_Dynamique: objet dynamique touché dans la collision
+            int: nombre de collisions dans le tampon
         """
-        return self.__objet_dynamique_touche
-    def offset_x(self) -> int:
-        """Retourne l'offset X de la collision
+        return self.__nombre_collisions
+    def objets_dynamiques(self) -> list:
+        """Retourne l'objet dynamique touché par chaque collision (ou 0)
+
+        Returns:
+            list: objet dynamique touché par chaque collision
+        """
+        return self.__objets_dynamiques
+    def offsets_x(self) -> array:
+        """Retourne l'offset X de chaque collision dans son rayon
 
         Returns:
-            int: offset X de la collision
+            array: offset X de chaque collision dans son rayon
         """
-        return self.__offset_x
+        return self.__offsets_x
     def point_depart(self) -> Point_3D:
-        """Retourne le point de départ du raycast
+        """Retourne le point de départ des collisions
 
         Returns:
-            Point_3D: point de départ du raycast
+            Point_3D: point de départ des collisions
         """
         return self.__point_depart
-    def set_case_sortie(self, nouveau_point: Point_3D, distance: float) -> None:
-        """Change la sortie de la case du raycast
+    def set_point_depart(self, nouveau_point_depart: Point_3D) -> None:
+        """Change le point de départ des collisions
 
-        Argument:
-            nouveau_point (Point_3D): nouvelle sortie de la case du raycast
-            distance (float): distance au point du raycast
+        Args:
+            nouveau_point_depart (Point_3D): nouveau point de départ des collisions
         """
-        self.__case_sortie = nouveau_point
-        self.__case_sortie_distance = distance
-    def set_case_touchee(self, nouvelle_case_touchee: Raycast_Case) -> None:
-        """Change la valeur de la case touché
+        self.__point_depart = nouveau_point_depart
+    def x_entrees(self) -> array:
+        """Retourne le X du point d'entrée de chaque collision
 
-        Args:
-            nouvelle_case_touchee (Raycast_Case): nouvelle valeur de la case touché
+        Returns:
+            array: X du point d'entrée de chaque collision
         """
-        self.__case_touchee = nouvelle_case_touchee
-    def set_entree(self, nouveau_point: Point_3D, distance: float) -> None:
-        """Change l'entrée de la collision du raycast
+        return self.__x_entrees
+    def x_sorties(self) -> array:
+        """Retourne le X du point de sortie de chaque collision
 
-        Argument:
-            nouveau_point (Point_3D): nouvelle entrée de la collision du raycast
-            distance (float): distance au point final du raycast
+        Returns:
+            array: X du point de sortie de chaque collision
         """
-        self.__entree = nouveau_point
-        self.__entree_distance = distance
-    def set_objet_dynamique_touche(self, nouvel_objet_dynamique_touche: Raycast_Objet_Dynamique) -> None:
-        """Modifie l'objet dynamique touché dans la collision
+        return self.__x_sorties
+    def x_textures(self) -> array:
+        """Retourne la position X sur la texture de chaque collision
 
-        Args:
-            noveul_objet_dynamique (Raycast_Objet_Dynamique): nouvel objet dynamique touché dans la collision
+        Returns:
+            array: position X sur la texture de chaque collision
+        """
+        return self.__x_textures
+    def y_entrees(self) -> array:
+        """Retourne le Y du point d'entrée de chaque collision
+
+        Returns:
+            array: Y du point d'entrée de chaque collision
+        """
+        return self.__y_entrees
+    def y_sorties(self) -> array:
+        """Retourne le Y du point de sortie de chaque collision
+
+        Returns:
+            array: Y du point de sortie de chaque collision
         """
-        if self.__objet_dynamique_touche != nouvel_objet_dynamique_touche:
-            self.__objet_dynamique_touche = nouvel_objet_dynamique_touche
-    def set_offset_x(self, nouveau_offset_x: int) -> None:
-        """Change la valeur d'offset de X
+        return self.__y_sorties
+
+class Raycast_Collision:
+    """Classe représentant une collision dans un raycast, sous la forme d'une vue sur une collision d'un tampon de collisions"""
+
+    # Constructeur de "Raycast_Collision"
+    def __init__(self, tampon: Raycast_Tampon_Collisions, indice: int) -> None:
+        """Constructeur de "Raycast_Collision"
 
         Args:
-            nouveau_offset_x (int): nouvelle valeur d'offset de X
+            tampon (Raycast_Tampon_Collisions): tampon contenant la collision
+            indice (int): indice de la collision dans le tampon
         """
-        self.__offset_x = nouveau_offset_x
-    def set_point_depart(self, nouveau_point_depart: Point_3D) -> None:
-        """Change le point de départ du raycast
 
-        Arguments:
-            nouveau_point_depart (Point_3D): nouveau point de départ du raycast
+        # Définition des attributs
+        self.__indice = indice
+        self.__tampon = tampon
+
+    # Getters et setters
+    def case_sortie(self) -> Point_3D:
+        """Retourne le point de sortie de la case touchée
+
+        Returns:
+            Point_3D: point de sortie de la case touchée
         """
-        self.__point_depart = nouveau_point_depart
-    def set_x_texture(self, nouveau_x_texture: float) -> None:
-        """Change la position X de la collision pour la texture
+        point = Point_3D()
+        point.set_x(self.__tampon.x_sorties()[self.__indice])
+        point.set_y(self.__tampon.y_sorties()[self.__indice])
+        return point
+    def case_sortie_distance(self) -> float:
+        """Retourne la distance du point de sortie de la case touchée
+
+        Returns:
+            float: distance du point de sortie de la case touchée (ou -1)
+        """
+        return self.__tampon.distances_sortie()[self.__indice]
+    def case_touchee(self) -> Raycast_Case:
+        """Retourne la case touchée par la collision
+
+        Returns:
+            Raycast_Case: case touchée par la collision (ou 0)
+        """
+        return self.__tampon.cases()[self.__indice]
+    def entree(self) -> Point_3D:
+        """Retourne le point d'entrée de la collision
+
+        Returns:
+            Point_3D: point d'entrée de la collision
+        """
+        point = Point_3D()
+        point.set_x(self.__tampon.x_entrees()[self.__indice])
+        point.set_y(self.__tampon.y_entrees()[self.__indice])
+        return point
+    def entree_distance(self) -> float:
+        """Retourne la distance du point d'entrée de la collision
+
+        Returns:
+            float: distance du point d'entrée de la collision
+        """
+        return self.__tampon.distances()[self.__indice]
+    def indice(self) -> int:
+        """Retourne l'indice de la collision dans son tampon
+
+        Returns:
+            int: indice de la collision dans son tampon
+        """
+        return self.__indice
+    def objet_dynamique_touche(self) -> Raycast_Objet_Dynamique:
+        """Retourne l'objet dynamique touché par la collision
+
+        Returns:
+            Raycast_Objet_Dynamique: objet dynamique touché par la collision (ou 0)
+        """
+        return self.__tampon.objets_dynamiques()[self.__indice]
+    def offset_x(self) -> int:
+        """Retourne l'offset X de la collision dans son rayon
+
+        Returns:
+            int: offset X de la collision dans son rayon
+        """
+        return self.__tampon.offsets_x()[self.__indice]
+    def point_depart(self) -> Point_3D:
+        """Retourne le point de départ de la collision
 
         Returns:
-            float: nouvelle position X de la collision pour la texture
+            Point_3D: point de départ de la collision
         """
-        self.__x_texture = nouveau_x_texture
+        return self.__tampon.point_depart()
     def x_texture(self) -> float:
-        """Retourne la position X de la collision pour la texture
+        """Retourne la position X de la collision sur la texture
 
         Returns:
-            float: position X de la collision pour la texture
+            float: position X de la collision sur la texture, entre 0 et 1
         """
-        return self.__x_texture
+        return self.__tampon.x_textures()[self.__indice]
 
 class Raycast:
     """Classe représentant un Raycast dans le moteur"""
 
     # Constructeur de "Raycast"
-    def __init__(self, camera: Raycast_Camera) -> None:
+    def __init__(self, camera: Raycast_Camera, tampon: Raycast_Tampon_Collisions = 0) -> None:
         """Constructeur de "Raycast"
+
+        Args:
+            camera (Raycast_Camera): caméra utilisée par le raycast
+            tampon (Raycast_Tampon_Collisions, optional): tampon contenant les collisions du raycast (ou 0 pour en créer un). Defaults to 0.
         """
 
         # Définition des attributs
+        if tampon == 0: tampon = Raycast_Tampon_Collisions(16)
         self.__angles_camera = []
+        self.__avant = 0
         self.__camera = camera
-        self.__collisions = []
+        self.__distances_collisions = []
+        self.__distances_opaques = {}
+        self.__indices_collisions = []
+        self.__nombres_collisions = {}
+        self.__tampon = tampon
 
     # Retourne les données d'avancement pour le raycast
     def avancement_donnees(self, indice: int = 0) -> tuple:
@@ -352,12 +789,84 @@ class Raycast:
             elif avant.x() < 0: ratio_vertical = -ratio_vertical
             elif avant.y() < 0: ajout_vertical = -ajout_vertical
         return (ajout_horizontal, ajout_vertical, ratio_horizontal, ratio_vertical)
-    # Élimine les raycasts duplicants
+    # Ajoute une collision au raycast, en gardant les collisions rangées de la plus proche à la plus lointaine
+    def ajouter_collision(self, indice: int, opaque: bool = False, profondeur_maximum: int = 0) -> None:
+        """Ajoute une collision du tampon au raycast, à sa place selon sa distance
+
+        Une collision cachable derrière une collision opaque de la même colonne n'est pas gardée,
+        et seules les "profondeur_maximum" collisions les plus proches de chaque colonne sont gardées.
+
+        Args:
+            indice (int): indice de la collision dans le tampon
+            opaque (bool, optional): si la collision cache les collisions cachables derrière elle. Defaults to False.
+            profondeur_maximum (int, optional): nombre maximum de collisions par colonne (0 pour ne pas avoir de limite). Defaults to 0.
+        """
+
+        # Ignorer la collision si elle est cachée
+        cachables, distances, offsets_x = self.__tampon.cachables(), self.__tampon.distances(), self.__tampon.offsets_x()
+        distance, offset_x = distances[indice], offsets_x[indice]
+        distance_opaque = self.__distances_opaques.get(offset_x, inf)
+        if distance > distance_opaque and cachables[indice]: return
+
+        # Insérer la collision à sa place (les collisions arrivent souvent de la plus proche à la plus lointaine)
+        indices, distances_collisions = self.__indices_collisions, self.__distances_collisions
+        if len(distances_collisions) != len(indices): self.ranger_collisions()
+        position = len(indices)
+        if position > 0 and distances_collisions[-1] > distance: position = bisect_right(distances_collisions, distance)
+        indices.insert(position, indice)
+        distances_collisions.insert(position, distance)
+        self.__nombres_collisions[offset_x] = self.__nombres_collisions.get(offset_x, 0) + 1
+
+        # Retirer les collisions cachées par une nouvelle collision opaque
+        if opaque and distance < distance_opaque:
+            self.__distances_opaques[offset_x] = distance
+            if position + 1 < len(indices):
+                gardees = [i for i in indices[position + 1:] if offsets_x[i] != offset_x or not cachables[i]]
+                self.__nombres_collisions[offset_x] -= len(indices) - position - 1 - len(gardees)
+                indices[position + 1:] = gardees
+                distances_collisions[position + 1:] = [distances[i] for i in gardees]
+
+        # Retirer la collision la plus lointaine de la colonne si elle en a trop
+        if profondeur_maximum > 0 and self.__nombres_collisions[offset_x] > profondeur_maximum:
+            for position in range(len(indices) - 1, -1, -1):
+                if offsets_x[indices[position]] == offset_x:
+                    del indices[position]
+                    del distances_collisions[position]
+                    self.__nombres_collisions[offset_x] -= 1
+                    break
+    # Arrête chaque colonne après un certain nombre de collisions transparentes
+    def limiter_collisions_transparentes(self, maximum: int, z_depart: float) -> None:
+        """Retire de chaque colonne les collisions situées après sa "maximum"-ième collision transparente, comme un rayon qui s'arrête
+
+        Args:
+            maximum (int): nombre maximum de collisions transparentes par colonne (au moins 1)
+            z_depart (float): hauteur du point de départ (une case plus basse est transparente)
+        """
+        cases, distances, offsets_x = self.__tampon.cases(), self.__tampon.distances(), self.__tampon.offsets_x()
+        maximum = max(1, maximum)
+        transparentes = {}
+        gardees = []
+        for indice in self.__indices_collisions:
+            offset_x = offsets_x[indice]
+            nombre = transparentes.get(offset_x, 0)
+            if nombre >= maximum:
+                self.__nombres_collisions[offset_x] -= 1
+                continue
+            gardees.append(indice)
+            if cases[indice] != 0 and z_depart > cases[indice].hauteur(): transparentes[offset_x] = nombre + 1
+        self.__indices_collisions[:] = gardees
+        self.__distances_collisions[:] = [distances[indice] for indice in gardees]
+    # Range les collisions de la plus proche à la plus lointaine
     def ranger_collisions(self) -> None:
-        """Élimine les raycasts duplicants"""
+        """Range les collisions de la plus proche à la plus lointaine
+
+        Les collisions ajoutées avec "ajouter_collision" sont déjà rangées, cette fonction ne sert qu'aux collisions ajoutées directement dans "indices_collisions".
+        """
 
         # Tri les collisions
-        self.__collisions = sorted(self.__collisions, key=lambda collision: collision.entree_distance())
+        distances = self.__tampon.distances()
+        self.__indices_collisions.sort(key=distances.__getitem__)
+        self.__distances_collisions[:] = [distances[indice] for indice in self.__indices_collisions]
 
     # Getters et setter
     def angle_camera(self, indice: int) -> float:
@@ -381,8 +890,9 @@ class Raycast:
         """Retourne le vecteur avant dans le raycast
 
         Returns:
-            Point_3D: vecteur avant dans le raycast
+            Point_3D: vecteur avant dans le raycast (celui donné par "set_avant" pour le premier angle, si il existe)
         """
+        if int(indice) == 0 and self.__avant != 0: return self.__avant
         return self.camera().devant_normalise(self.angle_camera(int(indice)))
     def camera(self) -> Raycast_Camera:
         """Retourne la caméra utilisé par le raycast
@@ -392,12 +902,19 @@ class Raycast:
         """
         return self.__camera
     def collisions(self) -> list:
-        """Retourne la liste des collisions dans le raycast
+        """Retourne la liste des collisions dans le raycast, sous la forme de vues sur le tampon
 
         Returns:
             list: liste des collisions dans le raycast
         """
-        return self.__collisions
+        return [Raycast_Collision(self.__tampon, indice) for indice in self.__indices_collisions]
+    def indices_collisions(self) -> list:
+        """Retourne les indices dans le tampon des collisions du raycast
+
+        Returns:
+            list: indices dans le tampon des collisions du raycast
+        """
+        return self.__indices_collisions
     def point_depart(self) -> Point_3D:
         """Retourne le point de départ du raycast
 
@@ -419,20 +936,40 @@ class Raycast:
             nouveau_point_depart (Point_3D): nouveau point de départ du raycast
         """
         self.__point_depart = nouveau_point_depart
+    def tampon(self) -> Raycast_Tampon_Collisions:
+        """Retourne le tampon contenant les collisions du raycast
+
+        Returns:
+            Raycast_Tampon_Collisions: tampon contenant les collisions du raycast
+        """
+        return self.__tampon
 
 class Raycast_Entier:
     """Classe représentant l'entiéreté des raycasts nécessaire à un rendu"""
 
     # Constructeur de "Raycast_Entier"
-    def __init__(self) -> None:
+    def __init__(self, tampon: Raycast_Tampon_Collisions = 0) -> None:
         """Constructeur de "Raycast_Entier"
+
+        Args:
+            tampon (Raycast_Tampon_Collisions, optional): tampon contenant les collisions de tous les rayons (ou 0 pour en créer un). Defaults to 0.
         """
 
         # Définition des attributs
+        if tampon == 0: tampon = Raycast_Tampon_Collisions()
+        self.__cases_rendues = set()
         self.__point_depart = 0
         self.__raycasts = []
+        self.__tampon = tampon
 
     # Getters et setters
+    def cases_rendues(self) -> set:
+        """Retourne les cases déjà projetées par ce raycast, pour ne projeter chaque case qu'une fois
+
+        Returns:
+            set: cases déjà projetées par ce raycast
+        """
+        return self.__cases_rendues
     def nombre_rayons(self) -> int:
         """Retourne le nombre de rayons dans le raycast
 
@@ -461,6 +998,53 @@ class Raycast_Entier:
             point_depart (Point_3D): nouveau point de départ des raycasts
         """
         self.__point_depart = point_depart
+        self.__tampon.set_point_depart(point_depart)
+    def tampon(self) -> Raycast_Tampon_Collisions:
+        """Retourne le tampon contenant les collisions de tous les rayons
+
+        Returns:
+            Raycast_Tampon_Collisions: tampon contenant les collisions de tous les rayons
+        """
+        return self.__tampon
+
+class Raycast_Instantane:
+    """Classe représentant un instantané de l'état du moteur raycast utilisé pour le rendu (caméra et objets dynamiques)"""
+
+    # Constructeur de "Raycast_Instantane"
+    def __init__(self, camera: Raycast_Camera, objets_dynamiques: list, copier: bool = True) -> None:
+        """Constructeur de "Raycast_Instantane", qui copie la caméra et les objets dynamiques
+
+        Les copies ne doivent pas être modifiées : la simulation continue de modifier les originaux pendant le rendu.
+        La copie de la caméra a ses propres tables de directions, mais partage les tampons de rendu de la caméra.
+
+        Args:
+            camera (Raycast_Camera): caméra à copier
+            objets_dynamiques (list): objets dynamiques à copier
+            copier (bool, optional): si la caméra et les objets sont copiés (False pour les utiliser directement, si la simulation ne les modifie pas pendant le rendu). Defaults to True.
+        """
+
+        # Définition des attributs
+        if copier:
+            camera = copy(camera)
+            objets_dynamiques = [copy(objet) for objet in objets_dynamiques]
+        self.__camera = camera
+        self.__objets_dynamiques = objets_dynamiques
+
+    # Getters et setters
+    def camera(self) -> Raycast_Camera:
+        """Retourne la copie de la caméra
+
+        Returns:
+            Raycast_Camera: copie de la caméra
+        """
+        return self.__camera
+    def objets_dynamiques(self) -> list:
+        """Retourne les copies des objets dynamiques
+
+        Returns:
+            list: copies des objets dynamiques
+        """
+        return self.__objets_dynamiques
 
 class Raycast_Moteur(Raycast_Moteur_Structure):
     """Classe représentant un moteur de raycast"""
@@ -471,12 +1055,37 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
         super().__init__(structure_plus)
 
         # Définition des attributs
+        self.__cache_objets_dynamiques = Cache_LRU(32 * 1024 * 1024)
         self.__camera = Raycast_Camera(self, 400, 1)
+        self.__collisions_transparentes_maximum = 16
+        self.__couche_2d = 0
         self.__couleur_arriere_plan = (0, 128, 255)
+        self.__couleurs_couche_2d = {}
+        self.__cases = {}
         self.__hauteur_map = 0
+        self.__hauteur_plafond = 1
+        self.__instantane_rendu = threading.local()
         self.__largeur_map = 0
-        self.__map = []
+        self.__map_blocs = []
+        self.__map_hauteurs = array("f")
+        self.__map_materiaux = array("H")
+        self.__map_tableau = 0
+        self.__x_map = 0
+        self.__y_map = 0
+        self.__mode_raycast = "classique"
+        self.__nombre_processus = 0
+        self.__nombre_rayons = 50
         self.__objets_dynamiques = []
+        self.__profondeur_maximum = 0
+        self.__pixels_textures = {}
+        self.__pvs = 0
+        self.__pvs_hauteur_opaque = 1
+        self.__pvs_taille_bloc = 1
+        self.__raycast_lot_processus = 0
+        self.__tampon_collisions_2d = Raycast_Tampon_Collisions()
+        self.__texture_plafond = 0
+        self.__texture_sol = 0
+        self.__verrou_raycast_lot_processus = threading.Lock()
 
     # Retourne une case selon deux coordonnées
     def case(self, x_case: int, y_case: int) -> Raycast_Case:
@@ -491,9 +1100,17 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
         """
         x_case = floor(x_case)
         y_case = floor(y_case)
-        if self.dans_map(x_case, y_case):
-            return self.__map[y_case][x_case]
-        return 0
+        if not self.dans_map(x_case, y_case): return 0
+
+        # Créer la case si elle n'a jamais été utilisée
+        indice = y_case * self.__largeur_map + x_case
+        case = self.__cases.get(indice, 0)
+        if case == 0:
+            materiel = self.__map_materiaux[indice]
+            if materiel != 0: materiel = self.materiel_par_id(materiel)
+            case = Raycast_Case(materiel, self.__x_map + x_case, self.__y_map + y_case, self.__map_hauteurs[indice])
+            case = self.__cases.setdefault(indice, case) # Garder une seule case, même si plusieurs rendus la créent en même temps
+        return case
     # Retourne si une coordonnée est dans la map
     def dans_map(self, x_a_tester: int, y_a_tester: int) -> bool:
         """Retourne si une coordonnée est dans la map
@@ -506,7 +1123,8 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
         """
         x_a_tester = int(x_a_tester)
         y_a_tester = int(y_a_tester)
-        return x_a_tester >= 0 and y_a_tester >= 0 and len(self.__map) > y_a_tester and len(self.__map[y_a_tester]) > x_a_tester
+        # Une des valeurs est négative si et seulement si la coordonnée est hors de la map
+        return (x_a_tester | y_a_tester | (self.__largeur_map - 1 - x_a_tester) | (self.__hauteur_map - 1 - y_a_tester)) >= 0
     def dans_map_point(self, point: Point_3D) -> bool:
         """Retourne si un point est dans la map
 
@@ -519,45 +1137,91 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
         return self.dans_map(point.x(), point.y())
     # Génère la map depuis un texte
     def generer_map_depuis_texte(self, texte: str):
-        """Génère la map depuis un texte
+        """Génère la map depuis un texte ("largeur;hauteur;x;y;lignes")
+
+        La taille de la map vient des lignes elles mêmes : les lignes courtes sont complétées par des cases vides.
 
         Args:
             texte (str): texte d'où générer la map
         """
 
         # Préparer la génération
-        self.__map = []
+        self.__cases = {}
+        self.__couche_2d = 0
+        self.__map_tableau = 0
+        self.__pvs = 0
         texte = texte.replace(chr(10), "").replace(chr(13), "") # Suppression des caractères inutiles
         while texte.count(" ") > 0 : texte = texte.replace(" ", "")
 
         # Effectuer la génération
         decoupe = texte.split(";")
-        self.__largeur_map, self.__hauteur_map, x_map, y_map = int(decoupe[0]), int(decoupe[1]), int(decoupe[2]), int(decoupe[3])
-        x_map_actuel, y_map_actuel = x_map, y_map
-        decoupe = decoupe[4].split("-")
-        for partie in decoupe:
+        self.__x_map, self.__y_map = int(decoupe[2]), int(decoupe[3])
+        lignes = []
+        materiaux_inexistants = set()
+        for partie in decoupe[4].split("-"):
             # Parcourir ligne par ligne
-            decoupe_temporaire = partie.split("_")
-            ligne_actuelle = []
-            for bloc in decoupe_temporaire:
-                # Parcourir bloc par bloc
-                materiel = int(bloc)
-                if materiel != 0:
-                    materiel = self.materiel_par_id(materiel)
-                    if materiel == 0:
-                        print("MLib Raycast moteur : le matériel \"" + bloc + "\" que vous essayez de charger n'existe pas.")
-                case_actuelle = Raycast_Case(materiel, x_map_actuel, y_map_actuel)
-                ligne_actuelle.append(case_actuelle)
-                x_map_actuel += 1
-            self.__map.append(ligne_actuelle)
-            x_map_actuel = x_map
-            y_map_actuel += 1
+            ligne_actuelle = array("H", map(int, partie.split("_")))
+            for materiel in set(ligne_actuelle):
+                if materiel != 0 and materiel not in materiaux_inexistants and self.materiel_par_id(materiel) == 0:
+                    print("MLib Raycast moteur : le matériel \"" + str(materiel) + "\" que vous essayez de charger n'existe pas.")
+                    materiaux_inexistants.add(materiel)
+            if len(materiaux_inexistants) > 0: ligne_actuelle = array("H", [0 if materiel in materiaux_inexistants else materiel for materiel in ligne_actuelle])
+            lignes.append(ligne_actuelle)
+
+        # Ranger les lignes dans les tableaux de la map (la taille vient des lignes elles mêmes)
+        self.__hauteur_map = len(lignes)
+        self.__largeur_map = max([len(ligne) for ligne in lignes] + [0])
+        self.__map_materiaux = array("H")
+        for ligne in lignes:
+            self.__map_materiaux.extend(ligne)
+            if len(ligne) < self.__largeur_map: self.__map_materiaux.extend(array("H", [0]) * (self.__largeur_map - len(ligne)))
+        self.__map_hauteurs = array("f", [1]) * len(self.__map_materiaux)
+        self.__construire_blocs()
+    # Construit la pyramide des blocs de la map
+    def __construire_blocs(self) -> None:
+        """Construit la pyramide des blocs de la map, utilisée par les rayons pour sauter les blocs vides
+
+        Le niveau N de la pyramide découpe la map en blocs de 2^(N + 1) cases de côté, et compte les cases pleines de chaque bloc.
+        Le dernier niveau contient un seul bloc, qui couvre toute la map.
+        """
+        self.__map_blocs = []
+        largeur, hauteur = self.__largeur_map, self.__hauteur_map
+        if largeur * hauteur <= 0: return
+
+        if numpy != 0:
+            # Réduire la map deux fois par niveau, avec NumPy
+            occupation = (self.map_tableau()[0] != 0).astype(numpy.uint32)
+            while largeur > 1 or hauteur > 1:
+                largeur, hauteur = (largeur + 1) // 2, (hauteur + 1) // 2
+                agrandie = numpy.zeros((hauteur * 2, largeur * 2), dtype=numpy.uint32)
+                agrandie[:occupation.shape[0], :occupation.shape[1]] = occupation
+                occupation = agrandie.reshape(hauteur, 2, largeur, 2).sum(axis=(1, 3), dtype=numpy.uint32)
+                blocs = array("I")
+                blocs.frombytes(occupation.tobytes())
+                self.__map_blocs.append((largeur, blocs))
+        else:
+            # Réduire la map deux fois par niveau, case par case
+            occupation = array("I", [1 if materiel != 0 else 0 for materiel in self.__map_materiaux])
+            while largeur > 1 or hauteur > 1:
+                largeur_precedente, hauteur_precedente = largeur, hauteur
+                largeur, hauteur = (largeur + 1) // 2, (hauteur + 1) // 2
+                blocs = array("I", [0]) * (largeur * hauteur)
+                for y in range(hauteur_precedente):
+                    for x in range(largeur_precedente):
+                        nombre = occupation[y * largeur_precedente + x]
+                        if nombre != 0: blocs[(y >> 1) * largeur + (x >> 1)] += nombre
+                occupation = blocs
+                self.__map_blocs.append((largeur, blocs))
     # Génère la map depuis un texte dans un chemin d'accés
-    def generer_map_depuis_texte_chemin_acces(self, chemin_acces: str) -> None:
+    def generer_map_depuis_texte_chemin_acces(self, chemin_acces: str, pvs: bool = False) -> None:
         """Génère la map depuis un texte dans un chemin d'accés
 
+        Avec "pvs", le PVS de la map est lu depuis le fichier "chemin_acces.pvs.npz",
+        ou calculé (voir "calculer_pvs") puis écrit dans ce fichier si il n'existe pas ou ne correspond plus à la map.
+
         Args:
             chemin_acces (str): chemin d'accés où se trouve la map à générer
+            pvs (bool, optional): si le PVS de la map est chargé ou calculé, et gardé dans un fichier à côté de la map (nécessite NumPy). Defaults to False.
         """
         if os.path.exists(chemin_acces):
             fichier = open(chemin_acces)
@@ -565,14 +1229,196 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
             fichier.close()
         else:
             print("MLib Raycast moteur : le chemin d'accés \"" + chemin_acces + "\" que vous essayez de charger en tant que map n'existe pas.")
+            return
+
+        # Charger ou calculer le PVS de la map
+        if not pvs: return
+        if numpy == 0:
+            print("MLib Raycast moteur : le PVS nécessite NumPy, qui n'est pas installé.")
+            return
+        chemin_pvs = chemin_acces + ".pvs.npz"
+        if os.path.exists(chemin_pvs) and self.charger_pvs(chemin_pvs): return
+        self.calculer_pvs()
+        self.sauvegarder_pvs(chemin_pvs)
+    # Retourne la map sous forme de tableaux NumPy
+    def map_tableau(self) -> tuple:
+        """Retourne la map sous forme de tableaux NumPy, indexés par [y, x] (nécessite NumPy)
 
-    # Crée et retourne un nouvel objet dynamique avec son bon type
-    def nouvel_objet_dynamique_createur(self, nom: str, type: str) -> Raycast_Objet_Dynamique:
-        """Crée et retourne un nouvel objet dynamique avec son bon type
+        Returns:
+            tuple: id des matériaux de chaque case (0 pour une case vide) et hauteur de chaque case
+        """
+        if self.__map_tableau == 0:
+            # Utiliser directement les tableaux de la map, sans copie
+            forme = (self.__hauteur_map, self.__largeur_map)
+            map_materiaux = numpy.frombuffer(self.__map_materiaux, dtype=numpy.uint16).reshape(forme)
+            map_hauteurs = numpy.frombuffer(self.__map_hauteurs, dtype=numpy.float32).reshape(forme)
+            self.__map_tableau = (map_materiaux, map_hauteurs)
+        return self.__map_tableau
+    # Modifie une case de la map
+    def modifier_case(self, x_case: int, y_case: int, id_materiel: int, hauteur: float = 1) -> None:
+        """Modifie le contenu et la hauteur d'une case de la map
 
         Args:
-            nom (str): nom de l'objet à créer
-            type (str): type de l'objet à créer
+            x_case (int): X de la case à modifier
+            y_case (int): Y de la case à modifier
+            id_materiel (int): id du nouveau matériel de la case (0 pour vider la case)
+            hauteur (float, optional): nouvelle hauteur de la case. Defaults to 1.
+        """
+        if not self.dans_map(x_case, y_case):
+            print("MLib Raycast moteur : la case (" + str(x_case) + ", " + str(y_case) + ") que vous essayez de modifier n'est pas dans la map.")
+            return
+        if id_materiel != 0 and self.materiel_par_id(id_materiel) == 0:
+            print("MLib Raycast moteur : le matériel \"" + str(id_materiel) + "\" que vous essayez de placer n'existe pas.")
+            return
+
+        # Modifier la case
+        indice = int(y_case) * self.__largeur_map + int(x_case)
+        self.__cases.pop(indice, 0)
+        self.__couche_2d = 0
+        self.__map_tableau = 0
+        self.__pvs = 0
+        self.__map_hauteurs[indice] = hauteur
+        difference = (1 if id_materiel != 0 else 0) - (1 if self.__map_materiaux[indice] != 0 else 0)
+        self.__map_materiaux[indice] = id_materiel
+
+        # Mettre à jour les blocs contenant la case
+        if difference != 0:
+            for niveau, (largeur_blocs, blocs) in enumerate(self.__map_blocs):
+                blocs[(int(y_case) >> (niveau + 1)) * largeur_blocs + (int(x_case) >> (niveau + 1))] += difference
+
+    # Calcule le PVS de la map
+    def calculer_pvs(self, hauteur_opaque: float = 1, taille_bloc: int = 4) -> None:
+        """Calcule le PVS (ensemble potentiellement visible) de chaque bloc de cases de la map contenant une case vide (nécessite NumPy)
+
+        Toutes les droites traversant chaque bloc sont suivies par faisceaux, sans échantillonner de rayons :
+        une case visible depuis un point quelconque du bloc fait donc toujours partie de son PVS, partagé par toutes les cases du bloc.
+        Pendant le rendu, seules les cases du PVS du bloc de la caméra sont alors prises en compte,
+        uniquement en mode de raycast "classique" sans processus (voir "set_mode_raycast").
+        Le PVS est supprimé à chaque modification de la map, et n'est pas recalculé si il existe déjà avec la même hauteur opaque et la même taille de bloc.
+
+        Le temps de calcul augmente avec le cube du côté de la map, et diminue avec la taille des blocs (qui agrandit les PVS) :
+        avec des blocs de 4 * 4 cases, environ 3 secondes pour une map de 100 * 100 cases, et 40 secondes pour une map de 256 * 256 cases.
+        Pour une map fixe, il vaut mieux garder le PVS dans un fichier, avec "sauvegarder_pvs" et "charger_pvs",
+        ou le paramètre "pvs" de "generer_map_depuis_texte_chemin_acces" qui le fait automatiquement.
+
+        Args:
+            hauteur_opaque (float, optional): hauteur à partir de laquelle une case cache les cases derrière elle (le PVS n'est utilisé que si la caméra est plus basse). Defaults to 1.
+            taille_bloc (int, optional): nombre de cases de côté des blocs partageant un PVS. Defaults to 4.
+        """
+        if numpy == 0:
+            print("MLib Raycast moteur : le calcul du PVS nécessite NumPy, qui n'est pas installé.")
+            return
+        if self.__pvs != 0 and self.__pvs_hauteur_opaque == hauteur_opaque and self.__pvs_taille_bloc == taille_bloc: return
+
+        # Préparer les blocs contenant au moins une case vide
+        map_materiaux, map_hauteurs = self.map_tableau()
+        taille_map = map_materiaux.size
+        largeur_blocs, hauteur_blocs = -(-self.__largeur_map // taille_bloc), -(-self.__hauteur_map // taille_bloc)
+        cases_vides = numpy.flatnonzero(map_materiaux.ravel() == 0)
+        blocs = numpy.unique((cases_vides // self.__largeur_map // taille_bloc) * largeur_blocs + (cases_vides % self.__largeur_map) // taille_bloc)
+
+        # Suivre les faisceaux par groupes de blocs (limités à environ 16 Mo de cases visibles par groupe)
+        traversees = [numpy.zeros(0, dtype=numpy.int64)]
+        taille_groupe = max(1, min(256, 16 * 1024 * 1024 // max(1, taille_map)))
+        for debut in range(0, blocs.shape[0], taille_groupe):
+            traversees.append(raycast_lot_pvs(map_materiaux, map_hauteurs, blocs[debut:debut + taille_groupe], taille_bloc, hauteur_opaque))
+
+        # Ranger le PVS de chaque bloc à la suite (les cases visibles depuis le bloc i sont entre debuts[i] et debuts[i + 1])
+        traversees = numpy.concatenate(traversees)
+        debuts = numpy.searchsorted(traversees // taille_map, numpy.arange(largeur_blocs * hauteur_blocs + 1))
+        self.__pvs = (debuts, (traversees % taille_map).astype(numpy.int32))
+        self.__pvs_hauteur_opaque = hauteur_opaque
+        self.__pvs_taille_bloc = taille_bloc
+    # Retourne les cases visibles depuis une case
+    def cases_visibles(self, x_case: int, y_case: int) -> list:
+        """Retourne les indices (y * largeur de la map + x) des cases du PVS d'une case
+
+        Args:
+            x_case (int): X de la case
+            y_case (int): Y de la case
+
+        Returns:
+            list: indices triés des cases visibles depuis la case (vide si le PVS de cette case n'est pas connu)
+        """
+        x_case, y_case = floor(x_case), floor(y_case)
+        if self.__pvs == 0 or not self.dans_map(x_case, y_case): return []
+        bloc = (y_case // self.__pvs_taille_bloc) * -(-self.__largeur_map // self.__pvs_taille_bloc) + x_case // self.__pvs_taille_bloc
+        return self.__pvs[1][self.__pvs[0][bloc]:self.__pvs[0][bloc + 1]]
+    def __cases_visibles_camera(self) -> list:
+        """Retourne les indices des cases du PVS de la caméra
+
+        Returns:
+            list: indices triés des cases visibles depuis la caméra (vide si le PVS ne peut pas être utilisé)
+        """
+        if self.camera().z() > self.__pvs_hauteur_opaque: return []
+        return self.cases_visibles(self.camera().x(), self.camera().y())
+    # Charge le PVS de la map depuis un fichier
+    def charger_pvs(self, chemin_acces: str) -> bool:
+        """Charge le PVS de la map depuis un fichier créé avec "sauvegarder_pvs" (nécessite NumPy)
+
+        Args:
+            chemin_acces (str): chemin d'accés du fichier
+
+        Returns:
+            bool: si le PVS a été chargé (le fichier doit avoir été créé avec la même map)
+        """
+        if numpy == 0:
+            print("MLib Raycast moteur : le chargement du PVS nécessite NumPy, qui n'est pas installé.")
+            return False
+        if not os.path.exists(chemin_acces):
+            print("MLib Raycast moteur : le chemin d'accés \"" + chemin_acces + "\" que vous essayez de charger en tant que PVS n'existe pas.")
+            return False
+
+        # Charger le fichier
+        with numpy.load(chemin_acces) as fichier:
+            if tuple(fichier["forme"].tolist()) != (self.__hauteur_map, self.__largeur_map) or ("empreinte" in fichier.files and int(fichier["empreinte"]) != self.__empreinte_map()):
+                print("MLib Raycast moteur : le PVS \"" + chemin_acces + "\" que vous essayez de charger ne correspond pas à la map.")
+                return False
+            self.__pvs = (fichier["debuts"], fichier["cases"])
+            self.__pvs_hauteur_opaque = float(fichier["hauteur_opaque"])
+            self.__pvs_taille_bloc = int(fichier["taille_bloc"]) if "taille_bloc" in fichier.files else 1
+        return True
+    # Retourne l'empreinte de la map
+    def __empreinte_map(self) -> int:
+        """Retourne l'empreinte (CRC32) des matériaux et des hauteurs de la map, pour reconnaître la map d'un PVS sauvegardé
+
+        Returns:
+            int: empreinte de la map
+        """
+        return crc32(self.__map_hauteurs.tobytes(), crc32(self.__map_materiaux.tobytes()))
+    # Sauvegarde le PVS de la map dans un fichier
+    def sauvegarder_pvs(self, chemin_acces: str) -> None:
+        """Sauvegarde le PVS de la map dans un fichier NumPy compressé (nécessite NumPy)
+
+        Args:
+            chemin_acces (str): chemin d'accés du fichier (".npz" est ajouté si nécessaire)
+        """
+        if self.__pvs == 0:
+            print("MLib Raycast moteur : aucun PVS n'a été calculé pour la map.")
+            return
+        numpy.savez_compressed(chemin_acces, debuts=self.__pvs[0], cases=self.__pvs[1], forme=numpy.array([self.__hauteur_map, self.__largeur_map]), hauteur_opaque=numpy.array(self.__pvs_hauteur_opaque), taille_bloc=numpy.array(self.__pvs_taille_bloc), empreinte=numpy.array(self.__empreinte_map(), dtype=numpy.uint32))
+
+    # Crée et retourne une nouvelle caméra
+    def nouvelle_camera(self, largeur_ecran: int = 400, distance_ecran: float = 1) -> Raycast_Camera:
+        """Crée et retourne une nouvelle caméra pour ce moteur, en plus de sa caméra principale
+
+        La caméra peut être rendue avec "rendu_3d_camera", ou dans une "Raycast_Fenetre" avec "set_camera".
+
+        Args:
+            largeur_ecran (int, optional): largeur de l'écran de la caméra en pixel. Defaults to 400.
+            distance_ecran (float, optional): distance de la caméra à l'écran. Defaults to 1.
+
+        Returns:
+            Raycast_Camera: caméra créée
+        """
+        return Raycast_Camera(self, largeur_ecran, distance_ecran)
+    # Crée et retourne un nouvel objet dynamique avec son bon type
+    def nouvel_objet_dynamique_createur(self, nom: str, type: str) -> Raycast_Objet_Dynamique:
+        """Crée et retourne un nouvel objet dynamique avec son bon type
+
+        Args:
+            nom (str): nom de l'objet à créer
+            type (str): type de l'objet à créer
 
         Returns:
             Raycast_Objet_Dynamique: objet crée
@@ -628,273 +1474,179 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
         return retour
 
     # Ajoute une collision au raycast
-    def __raycast_appliquer_difference_horizontale(self, point: Point_3D, ajout_horizontal: float, ratio_horizontal: float) -> None:
-        """Applique une différence nécessaire dans la map pour le raycast
+    def __raycast_nouvelle_collision(self, raycast_entier: Raycast_Entier, raycast: Raycast, offset_x: int, case_touchee: Raycast_Case, x_point: float, y_point: float, sens_arrive: int) -> None:
+        """Ajoute une collision avec une case au raycast
 
-        Args:
-            point (Point_3D): point auquel appliquer la différence
+        Arguments:
+            raycast_entier (Raycast_Entier): données sur l'entiéreté des raycasts du rendu
+            raycast (Raycast): raycast auquel ajouter une collision
+            offset_x (int): offset X de la collision dans le raycast
+            case_touchee (Raycast_Case): case touchée par la collision
+            x_point (float): X du point touché par la collision
+            y_point (float): Y du point touché par la collision
+            sens_arrive (int): sens d'arrivé de la collision (0 = horizontal, 1 = vertical)
         """
-        # Nouvelle position
-        x_actuel = ceil(point.x())
-        if ajout_horizontal < 0: x_actuel = floor(point.x())
-        difference_x = abs(x_actuel - point.x())
-        y_actuel = point.y() + difference_x * ratio_horizontal
-        # Appliquer les modifications
-        point.set_x(x_actuel)
-        point.set_y(y_actuel)
-    def __raycast_appliquer_difference_verticale(self, point: Point_3D, ajout_vertical: float, ratio_vertical: float) -> None:
-        """Applique une différence nécessaire dans la map pour le raycast
+
+        # Préparer la recherche de la sortie
+        x_depart, y_depart, z_depart = self.camera().x(), self.camera().y(), self.camera().z()
+        difference_x, difference_y = x_point - x_depart, y_point - y_depart
+        ajout_horizontal = -1 if difference_x < 0 else 1
+        ajout_vertical = -1 if difference_y < 0 else 1
+        ratio_horizontal, ratio_vertical = 1, 1
+        if difference_x != 0: ratio_horizontal = abs(difference_y / difference_x) * ajout_vertical
+        if difference_y != 0: ratio_vertical = abs(difference_x / difference_y) * ajout_horizontal
+        x_case, y_case = case_touchee.x() - self.__x_map, case_touchee.y() - self.__y_map
+
+        # Chercher les deux sorties possibles
+        distance_horizontale_sortie, distance_verticale_sortie = -1, -1
+        if sens_arrive == 0:
+            # Tester l'axe horizontal
+            x_horizontal, y_horizontal = x_point + ajout_horizontal, y_point + ratio_horizontal
+            distance_horizontale_sortie = sqrt((x_horizontal - x_depart) ** 2 + (y_horizontal - y_depart) ** 2 + z_depart * z_depart)
+
+            # Tester l'axe vertical
+            y_vertical = ceil(y_point) if ajout_vertical > 0 else floor(y_point)
+            x_vertical = x_point + abs(y_vertical - y_point) * ratio_vertical
+            x_voisin, y_voisin = floor(x_vertical), floor(y_vertical) - (0 if ajout_vertical > 0 else 1)
+            if self.dans_map(x_voisin, y_voisin) and (x_voisin != x_case or y_voisin != y_case):
+                distance_verticale_sortie = sqrt((x_vertical - x_depart) ** 2 + (y_vertical - y_depart) ** 2 + z_depart * z_depart)
+        else:
+            # Tester l'axe vertical
+            x_vertical, y_vertical = x_point + ratio_vertical, y_point + ajout_vertical
+            distance_verticale_sortie = sqrt((x_vertical - x_depart) ** 2 + (y_vertical - y_depart) ** 2 + z_depart * z_depart)
+
+            # Tester l'axe horizontal
+            x_horizontal = ceil(x_point) if ajout_horizontal > 0 else floor(x_point)
+            y_horizontal = y_point + abs(x_horizontal - x_point) * ratio_horizontal
+            x_voisin, y_voisin = floor(x_horizontal) - (0 if ajout_horizontal > 0 else 1), floor(y_horizontal)
+            if self.dans_map(x_voisin, y_voisin) and (x_voisin != x_case or y_voisin != y_case):
+                distance_horizontale_sortie = sqrt((x_horizontal - x_depart) ** 2 + (y_horizontal - y_depart) ** 2 + z_depart * z_depart)
+
+        # Préparer le point de sortie
+        x_sortie, y_sortie, distance_sortie = x_horizontal, y_horizontal, distance_horizontale_sortie
+        if distance_horizontale_sortie <= -1 or (distance_verticale_sortie > -1 and distance_verticale_sortie <= distance_horizontale_sortie):
+            x_sortie, y_sortie, distance_sortie = x_vertical, y_vertical, distance_verticale_sortie
+
+        # Ajoute la collision
+        x_texture = y_point - floor(y_point) if sens_arrive == 0 else x_point - floor(x_point)
+        distance_entree = sqrt(difference_x * difference_x + difference_y * difference_y + z_depart * z_depart)
+        if self.camera().distance_maximum() > 0 and distance_entree > self.camera().distance_maximum(): return
+        indice = raycast_entier.tampon().ajouter(case_touchee, 0, offset_x, x_point, y_point, distance_entree, x_sortie, y_sortie, distance_sortie, x_texture)
+        raycast.ajouter_collision(indice, z_depart <= case_touchee.hauteur(), self.profondeur_maximum())
+    def __raycast_angle_relatif(self, x_point: float, y_point: float) -> float:
+        """Retourne l'angle d'un point par rapport au vecteur avant de la caméra, entre -pi et pi
 
         Args:
-            point (Point_3D): point auquel appliquer la différence
-        """
-        # Nouvelle position
-        y_actuel = ceil(point.y())
-        if ajout_vertical < 0: y_actuel = floor(point.y())
-        difference_y = abs(y_actuel - point.y())
-        x_actuel = point.x() + difference_y * ratio_vertical
-        # Appliquer les modifications
-        point.set_x(x_actuel)
-        point.set_y(y_actuel)
-    def __raycast_avancement_donnees(self, point_depart: Point_3D, point_arrive: Point_3D) -> tuple:
-        """Retourne quelques données sur la façon dont le rayon doit avancer
+            x_point (float): X du point
+            y_point (float): Y du point
 
         Returns:
-            tuple: quelques données sur la façon dont le rayon doit avancer
-        """
-        ajout_horizontal = 1
-        ajout_vertical = 1
-        ratio_horizontal = 1
-        ratio_vertical = 1
-        # Préparation des données du raycast horziontal
-        avant = point_arrive.copie()
-        avant -= point_depart
-        if avant.x() != 0:
-            # Calcul des différences nécessaires
-            ajout_horizontal = 1
-            ratio_horizontal = abs(avant.y() / avant.x())
-            if avant.x() < 0 and avant.y() < 0:
-                ajout_horizontal = -ajout_horizontal
-                ratio_horizontal = -ratio_horizontal
-            elif avant.y() < 0: ratio_horizontal = -ratio_horizontal
-            elif avant.x() < 0: ajout_horizontal = -ajout_horizontal
-        # Préapartion des données du raycast vertical
-        if avant.y() != 0:
-            # Calcul des différences nécessaires
-            ajout_vertical = 1
-            ratio_vertical = abs(avant.x() / avant.y())
-            if avant.x() < 0 and avant.y() < 0:
-                ajout_vertical = -ajout_vertical
-                ratio_vertical = -ratio_vertical
-            elif avant.x() < 0: ratio_vertical = -ratio_vertical
-            elif avant.y() < 0: ajout_vertical = -ajout_vertical
-        return (ajout_horizontal, ajout_vertical, ratio_horizontal, ratio_vertical)
-    def __raycast_donnees_affichage_case(self, raycast_entier: Raycast_Entier, case: Raycast_Case, donnees_points_case: tuple) -> tuple:
-        """Retourne les données nécessaire à l'affichage d'une case
+            float: angle du point par rapport au vecteur avant de la caméra
         """
+        angle_point = atan2(y_point - self.camera().y(), x_point - self.camera().x()) - self.camera().rotation_y()
+        return (angle_point + pi) % (2 * pi) - pi
+    def __raycast_case(self, raycast_entier: Raycast_Entier, case: Raycast_Case) -> None:
+        """Réalise un raycast pour une case entière"""
 
-        # Préparation des données
-        point_case, point_case_milieu, point_case_fin = donnees_points_case[:3]
+        # Vérifier si le rendu doit être fait (une seule fois par raycast, même si plusieurs vues sont rendues en même temps)
+        if case in raycast_entier.cases_rendues(): return
+        raycast_entier.cases_rendues().add(case)
+        case.rendu(self.structure_plus().numero_frame())
 
-        # Calcul les angles pour la case
-        angle_case = -angle(self.camera() + self.camera().devant_normalise(), self.camera(), point_case)
-        angle_case_fin = -angle(self.camera() + self.camera().devant_normalise(), self.camera(), point_case_fin)
-        angle_case_milieu = -angle(self.camera() + self.camera().devant_normalise(), self.camera(), point_case_milieu)
-        angle_total_face_1 = abs(angle_case_milieu - angle_case)
-        angle_total_face_2 = abs(angle_case_fin - angle_case_milieu)
-        angle_pixel = self.camera().fov() / self.camera().largeur_ecran()
+        # Chercher les faces visibles de la case (sous la forme (x début, y début, x fin, y fin, sens d'arrivé))
+        faces = []
+        if self.camera().x() < case.x(): faces.append((case.x(), case.y(), case.x(), case.y() + 1, 0))
+        elif self.camera().x() > case.x() + 1: faces.append((case.x() + 1, case.y(), case.x() + 1, case.y() + 1, 0))
+        if self.camera().y() < case.y(): faces.append((case.x(), case.y(), case.x() + 1, case.y(), 1))
+        elif self.camera().y() > case.y() + 1: faces.append((case.x(), case.y() + 1, case.x() + 1, case.y() + 1, 1))
 
-        # Calcul les pixels nécessaire via les angles
-        angle_start = round(((angle_case + self.camera().fov() / 2.0) / self.camera().fov()) * self.camera().largeur_ecran())
-        number_pixels_face_1 = round(angle_total_face_1 / angle_pixel)
-        number_pixels_face_2 = round(angle_total_face_2 / angle_pixel)
-        return (angle_start, number_pixels_face_1, number_pixels_face_2)
-    def __raycast_nouvelle_collision(self, raycast_entier: Raycast_Entier, raycast: Raycast, offset_x: int, case_touchee: Raycast_Case, point_touche: Point_3D, point_touche_distance: float, sens_arrive: int, donnees_raycast: tuple) -> None:
-        """Ajoute une collision au raycast
+        # Projeter chaque face sur l'écran
+        for face in faces:
+            self.__raycast_face(raycast_entier, case, face)
+    def __raycast_pvs(self, raycast_entier: Raycast_Entier, cases_visibles: "numpy.ndarray") -> None:
+        """Réalise un raycast en projetant les cases du PVS de la caméra, au lieu d'envoyer des rayons
 
-        Arguments:
-            raycast (Raycast): raycast auquel ajouté une collision
-            case_touchee (Raycast_Case): case touchée par la collision
-            point_touche (Raycast_Case): point touché par la collision
-            point_touche_distance (float): distance entre le point de la collision et l'envoyeur du rayon 
-            sens_arrive (int): sens d'arrivé de la collision (0 = horizontal, 1 = vertical)
-            donnees_raycast (tuple): autres données secondaires sur le raycast
+        Args:
+            raycast_entier (Raycast_Entier): données sur l'entiéreté des raycasts du rendu
+            cases_visibles (numpy.ndarray): indices des cases du PVS de la caméra
         """
 
-        # Préparer la création de la collision
-        ajout_horizontal = donnees_raycast[0]
-        ajout_vertical = donnees_raycast[1]
-        point_actuel = point_touche.copie()
-        ratio_horizontal = donnees_raycast[2]
-        ratio_vertical = donnees_raycast[3]
+        # Lister les cases pleines du PVS
+        murs = cases_visibles[self.map_tableau()[0].ravel()[cases_visibles] != 0]
+        x_murs, y_murs = murs % self.__largeur_map, murs // self.__largeur_map
 
-        # Créer la collision
-        raycast_actuel = Raycast_Collision()
-        raycast_actuel.set_case_touchee(case_touchee)
-        raycast_actuel.set_entree(point_actuel.copie(), point_touche_distance)
-        raycast_actuel.set_offset_x(offset_x)
-        raycast_actuel.set_point_depart(raycast_entier.point_depart())
+        # Garder les cases dans le champ de vision (avec une marge de la moitié de la diagonale d'une case)
+        difference_x, difference_y = x_murs + 0.5 - self.camera().x(), y_murs + 0.5 - self.camera().y()
+        angles = numpy.mod(numpy.arctan2(difference_y, difference_x) - self.camera().rotation_y() + pi, 2 * pi) - pi
+        with numpy.errstate(divide="ignore"):
+            marges = numpy.arcsin(numpy.minimum(1, 0.7072 / numpy.hypot(difference_x, difference_y)))
+        garde = numpy.abs(angles) <= self.camera().fov() / 2.0 + marges
+        garde &= numpy.hypot(difference_x, difference_y) - 0.7072 <= self.camera().distance_plane_maximum()
 
-        # Préparer la recherche de la sortie
-        distance_horizontale_sortie = -1
-        distance_verticale_sortie = -1
-        point_de_depart = raycast_actuel.point_depart()
-        point_horizontal_sortie = point_touche.copie()
-        point_vertical_sortie = point_touche.copie()
-        if case_touchee != 0:
-            # Modifier les coordonnées comme nécessaire
+        # Projeter les cases
+        for x_case, y_case in zip(x_murs[garde].tolist(), y_murs[garde].tolist()):
+            self.__raycast_case(raycast_entier, self.case(x_case, y_case))
+
+        # Arrêter chaque colonne après autant de cases transparentes qu'un rayon
+        for rayon in raycast_entier.rayons(): rayon.limiter_collisions_transparentes(self.collisions_transparentes_maximum(), self.camera().z())
+    def __raycast_face(self, raycast_entier: Raycast_Entier, case: Raycast_Case, face: tuple) -> None:
+        """Ajoute une collision pour chaque colonne de pixels couverte par une face d'une case
+
+        Args:
+            raycast_entier (Raycast_Entier): données sur l'entiéreté des raycasts du rendu
+            case (Raycast_Case): case de la face
+            face (tuple): face à projeter (x début, y début, x fin, y fin, sens d'arrivé)
+        """
+
+        # Préparation des données
+        x_debut, y_debut, x_fin, y_fin, sens_arrive = face
+        fov, largeur_ecran = self.camera().fov(), self.camera().largeur_ecran()
+        rayon_par_pixel = floor(largeur_ecran / (raycast_entier.nombre_rayons()))
+        x_directions, y_directions = self.camera().directions(largeur_ecran)
+
+        # Calcul des colonnes de pixels couvertes par la face
+        angle_debut = self.__raycast_angle_relatif(x_debut, y_debut)
+        angle_fin = self.__raycast_angle_relatif(x_fin, y_fin)
+        colonne_debut, colonne_fin = 0, largeur_ecran
+        if abs(angle_debut - angle_fin) <= pi:
+            # La face ne passe pas derrière la caméra
+            colonne_debut = max(0, floor(((fov / 2.0 - max(angle_debut, angle_fin)) / fov) * largeur_ecran))
+            colonne_fin = min(largeur_ecran, ceil(((fov / 2.0 - min(angle_debut, angle_fin)) / fov) * largeur_ecran) + 1)
+
+        for i in range(colonne_debut, colonne_fin):
+            # Calcul du point exact touché par le rayon de la colonne
+            avant_x, avant_y = x_directions[i], y_directions[i]
             if sens_arrive == 0:
-                # Tester l'axe horizontal
-                point_horizontal_sortie.set_x(point_horizontal_sortie.x() + ajout_horizontal)
-                point_horizontal_sortie.set_y(point_horizontal_sortie.y() + ratio_horizontal)
-                distance_horizontale_sortie = distance(point_de_depart, point_horizontal_sortie)
-
-                # Tester l'axe vertical
-                self.__raycast_appliquer_difference_verticale(point_vertical_sortie, ajout_vertical, ratio_vertical)
-                case_verticale =  0
-                if ajout_vertical > 0: case_verticale = self.case(point_vertical_sortie.x(), point_vertical_sortie.y())
-                else: case_verticale = self.case(point_vertical_sortie.x(), point_vertical_sortie.y() - 1)
-                if case_verticale != 0 and case_verticale != case_touchee: distance_verticale_sortie = distance(point_de_depart, point_vertical_sortie)
+                if avant_x == 0: continue
+                distance_plane = (x_debut - self.camera().x()) / avant_x
+                x_point, y_point = x_debut, self.camera().y() + avant_y * distance_plane
+                if y_point < y_debut or y_point > y_fin: continue
             else:
-                # Tester l'axe vertical
-                point_vertical_sortie.set_x(point_vertical_sortie.x() + ratio_vertical)
-                point_vertical_sortie.set_y(point_vertical_sortie.y() + ajout_vertical)
-                distance_verticale_sortie = distance(point_de_depart, point_vertical_sortie)
-
-                # Tester l'axe horizontal
-                self.__raycast_appliquer_difference_horizontale(point_horizontal_sortie, ajout_horizontal, ratio_horizontal)
-                case_horizontale =  0
-                if ajout_horizontal > 0: case_horizontale = self.case(point_horizontal_sortie.x(), point_horizontal_sortie.y())
-                else: case_horizontale = self.case(point_horizontal_sortie.x() - 1, point_horizontal_sortie.y())
-                if case_horizontale != 0 and case_horizontale != case_touchee: distance_horizontale_sortie = distance(point_de_depart, point_horizontal_sortie)
-                    
-        # Préparer le point de sortie
-        if distance_horizontale_sortie <= -1:
-            raycast_actuel.set_case_sortie(point_vertical_sortie, distance_verticale_sortie)
-        elif distance_verticale_sortie <= -1:
-            raycast_actuel.set_case_sortie(point_horizontal_sortie, distance_horizontale_sortie)
-        elif distance_verticale_sortie <= distance_horizontale_sortie:
-            raycast_actuel.set_case_sortie(point_vertical_sortie, distance_verticale_sortie)
-        else:
-            raycast_actuel.set_case_sortie(point_horizontal_sortie, distance_horizontale_sortie)
+                if avant_y == 0: continue
+                distance_plane = (y_debut - self.camera().y()) / avant_y
+                x_point, y_point = self.camera().x() + avant_x * distance_plane, y_debut
+                if x_point < x_debut or x_point > x_fin: continue
+            if distance_plane <= 0: continue
 
-        # Ajoute la collision
-        raycast.collisions().append(raycast_actuel)
-    def __raycast_point_affichage(self, case: Raycast_Case) -> None:
-        """Retourne les points nécessaires à l'affichage d'une case
-
-        Args:
-            case (Raycast_Case): points nécessaires à l'affichage d'une case
-        """
-        point_case = Point_3D()
-        point_case_fin = Point_3D()
-        point_case_milieu = Point_3D()
-        a_ajouter_x_case = 0
-        a_ajouter_x_case_fin = 0
-        a_ajouter_x_case_milieu = 0
-        a_ajouter_y_case = 0
-        a_ajouter_y_case_fin = 0
-        a_ajouter_y_case_milieu = 0
-        deuxieme_face = 1
-        premiere_face = 0
-        if case.x() > self.camera().x():
-            if case.y() >= self.camera().y():
-                a_ajouter_x_case_fin = 1
-                a_ajouter_y_case = 1
-            else:
-                a_ajouter_x_case = 1
-                a_ajouter_y_case_milieu = 1
-                a_ajouter_y_case = 1
-                deuxieme_face = 0
-                premiere_face = 1
-        else:
-            if case.y() >= self.camera().y():
-                a_ajouter_x_case_fin = 1
-                a_ajouter_x_case_milieu = 1
-                a_ajouter_y_case_fin = 1
-                deuxieme_face = 0
-                premiere_face = 1
-            else:
-                a_ajouter_x_case = 1
-                a_ajouter_x_case_milieu = 1
-                a_ajouter_y_case_fin = 1
-                a_ajouter_y_case_milieu = 1
-        point_case.set_x(case.x() + a_ajouter_x_case)
-        point_case_fin.set_x(case.x() + a_ajouter_x_case_fin)
-        point_case_milieu.set_x(case.x() + a_ajouter_x_case_milieu)
-        point_case.set_y(case.y() + a_ajouter_y_case)
-        point_case_fin.set_y(case.y() + a_ajouter_y_case_fin)
-        point_case_milieu.set_y(case.y() + a_ajouter_y_case_milieu)
-        return (point_case, point_case_milieu, point_case_fin, premiere_face, deuxieme_face)
-    def __raycast_case(self, raycast_entier: Raycast_Entier, case: Raycast_Case) -> None:
-        """Réalise un raycast pour une case entière"""
+            # Appliquer la collision
+            offset_actuel = i % rayon_par_pixel
+            rayon_actuel = floor(i / rayon_par_pixel)
+            if rayon_actuel < raycast_entier.nombre_rayons():
+                self.__raycast_nouvelle_collision(raycast_entier, raycast_entier.rayons()[rayon_actuel], offset_actuel, case, x_point, y_point, sens_arrive)
+    def __raycast_projection_objet_dynamique(self, objet: Raycast_Objet_Dynamique) -> tuple:
+        """Retourne la projection d'un objet dynamique sur l'écran
 
-        # Vérifier si le rendu doit être fait
-        if case.numero_frame_dernier_rendu() == self.structure_plus().numero_frame(): return
-        case.rendu(self.structure_plus().numero_frame())
+        Args:
+            objet (Raycast_Objet_Dynamique): objet à projeter
 
-        # Calculer les valeurs nécessaires pour la case
-        donnees = self.__raycast_point_affichage(case)
-        point_case, point_case_milieu, point_case_fin, premiere_face, deuxieme_face = donnees
-
-        # Calcul les pixels nécessaires pour l'affichage
-        donnees = self.__raycast_donnees_affichage_case(raycast_entier, case, donnees)
-        angle_start, number_pixels_face_1, number_pixels_face_2 = donnees
-        nombre_pixels_total = number_pixels_face_1 + number_pixels_face_2
-        rayon_par_pixel = floor(self.camera().largeur_ecran() / (raycast_entier.nombre_rayons()))
-
-        if number_pixels_face_1 >= 1:
-            # Calcul des collisions nécessaires pour la première face
-            point_actuel = point_case.copie()
-            distance_actuelle = 0
-            for i in range(angle_start, angle_start + number_pixels_face_1 + 1):
-                if i < 0:
-                    # Modifier le point actuel
-                    point_actuel.set_x(point_actuel.x() + (point_case_milieu.x() - point_case.x())/number_pixels_face_1)
-                    point_actuel.set_y(point_actuel.y() + (point_case_milieu.y() - point_case.y())/number_pixels_face_1)
-                    continue
-                if i >= self.camera().largeur_ecran(): break
-                # Appliquer la collision
-                donnees_raycast = self.__raycast_avancement_donnees(self.camera(), point_actuel)
-                distance_actuelle = distance(self.camera(), point_actuel)
-                offset_actuel = i % rayon_par_pixel
-                rayon_actuel = floor(i / rayon_par_pixel)
-                if rayon_actuel < raycast_entier.nombre_rayons():
-                    raycast_actuel = raycast_entier.rayons()[rayon_actuel]
-                    self.__raycast_nouvelle_collision(raycast_entier, raycast_actuel, offset_actuel, case, point_actuel, distance_actuelle, premiere_face, donnees_raycast)
-
-                # Modifier le point actuel
-                point_actuel.set_x(point_actuel.x() + (point_case_milieu.x() - point_case.x())/number_pixels_face_1)
-                point_actuel.set_y(point_actuel.y() + (point_case_milieu.y() - point_case.y())/number_pixels_face_1)
-
-        if number_pixels_face_2 >= 1:
-            # Calcul des collisions nécessaires pour la deuxième face
-            point_actuel = point_case_milieu.copie()
-            for i in range(angle_start + number_pixels_face_1 - 1, angle_start + nombre_pixels_total):
-                if i < 0:
-                    # Modifier le point actuel
-                    point_actuel.set_x(point_actuel.x() + (point_case_fin.x() - point_case_milieu.x())/number_pixels_face_2)
-                    point_actuel.set_y(point_actuel.y() + (point_case_fin.y() - point_case_milieu.y())/number_pixels_face_2)
-                    continue
-                if i >= self.camera().largeur_ecran(): break
-                # Appliquer la collision
-                donnees_raycast = self.__raycast_avancement_donnees(self.camera(), point_actuel)
-                distance_actuelle = distance(self.camera(), point_actuel)
-                offset_actuel = i % rayon_par_pixel
-                rayon_actuel = floor(i / rayon_par_pixel)
-                if rayon_actuel < raycast_entier.nombre_rayons():
-                    raycast_actuel = raycast_entier.rayons()[rayon_actuel]
-                    self.__raycast_nouvelle_collision(raycast_entier, raycast_actuel, offset_actuel, case, point_actuel, distance_actuelle, deuxieme_face, donnees_raycast)
-
-                # Modifier le point actuel
-                point_actuel.set_x(point_actuel.x() + (point_case_fin.x() - point_case_milieu.x())/number_pixels_face_2)
-                point_actuel.set_y(point_actuel.y() + (point_case_fin.y() - point_case_milieu.y())/number_pixels_face_2)
-    def __raycast_objet_dynamique(self, raycast_entier: Raycast_Entier, objet: Raycast_Objet_Dynamique) -> None:
-        """Réalise un raycast pour une case entière"""
+        Returns:
+            tuple: distance de l'objet, première colonne et nombre de colonnes couvertes (ou 0 si l'objet n'est pas projetable)
+        """
 
         # Calcul les angles nécessaires pour l'affichage
         distance_objet = distance(self.camera(), objet)
-        if distance_objet <= 0: return
+        if distance_objet <= 0: return 0
+        if self.camera().distance_maximum() > 0 and distance_objet > self.camera().distance_maximum(): return 0
         largeur_objet = self.largeur_apparente(objet.largeur(), distance_objet)
         angle_case = -angle(self.camera() + self.camera().devant_normalise(), self.camera(), objet)
         angle_start = angle_case - largeur_objet / 2.0
@@ -902,166 +1654,249 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
         # Calcul les pixels nécessaire via les angles
         angle_pixel = round(largeur_objet / (self.camera().fov() / self.camera().largeur_ecran()))
         angle_start = round(((angle_start + self.camera().fov() / 2.0) / self.camera().fov()) * self.camera().largeur_ecran())
-        rayon_par_pixel = floor(self.camera().largeur_ecran() / (raycast_entier.nombre_rayons()))
-
-        # Dessine l'objet
-        for i in range(angle_start, angle_start + angle_pixel):
-            if i < 0: continue
-            if i >= self.camera().largeur_ecran(): break
-            # Appliquer la collision
-            offset_actuel = i % rayon_par_pixel
-            rayon_actuel = floor(i / rayon_par_pixel)
-            raycast_actuel = raycast_entier.rayons()[rayon_actuel]
-
-            #Créer la collision
-            collision = Raycast_Collision()
-            collision.set_entree(objet, distance_objet)
-            collision.set_objet_dynamique_touche(objet)
-            collision.set_offset_x(offset_actuel)
-            collision.set_point_depart(raycast_entier.point_depart())
-            collision.set_x_texture((i - angle_start) / angle_pixel)
-            raycast_actuel.collisions().append(collision)
-    def __raycast_position_pleine(self, raycast_entier: Raycast_Entier, x_a_tester: float, y_a_tester: float) -> bool:
-        """Gère si une certaine position dans un raycast contient une case afficahble ou non
+        return (distance_objet, angle_start, angle_pixel)
+    def __raycast_objet_dynamique_visible(self, objet: Raycast_Objet_Dynamique, cases_visibles: list) -> bool:
+        """Retourne si un objet dynamique peut être visible par la caméra
 
         Args:
-            point (Point_3D): position à tester
+            objet (Raycast_Objet_Dynamique): objet à tester
+            cases_visibles (list): indices des cases du PVS de la caméra (vide si le PVS n'est pas utilisé)
+
+        Returns:
+            bool: si l'objet peut être visible
         """
-        if self.dans_map(x_a_tester, y_a_tester):
-            if self.__map[y_a_tester][x_a_tester] != 0 and self.__map[y_a_tester][x_a_tester].contenu() != 0:
-                self.__raycast_case(raycast_entier, self.__map[y_a_tester][x_a_tester])
+        if not objet.visible(): return False
+        x_case, y_case = floor(objet.x()), floor(objet.y())
+        if len(cases_visibles) <= 0 or not self.dans_map(x_case, y_case): return True
+
+        # Chercher la case de l'objet dans le PVS
+        indice = y_case * self.__largeur_map + x_case
+        position = int(numpy.searchsorted(cases_visibles, indice))
+        return position < len(cases_visibles) and cases_visibles[position] == indice
     def raycast(self, raycast_entier: Raycast_Entier, final: Raycast, point_de_depart: Transformation_3D) -> None:
-        """Réalise et retourne un résultat de raycast
+        """Réalise un raycast en un seul passage (DDA) à travers la grille de la map
+
+        Les lignes horizontales et verticales de la grille sont traversées dans l'ordre de leur distance,
+        les blocs vides de la pyramide de la map étant traversés en une seule fois, et le rayon s'arrête à la première case opaque touchée (case plus haute que le point de départ),
+        après un certain nombre de cases transparentes (cases au dessus desquelles le point de départ voit),
+        ou au delà de la distance maximum de la caméra.
 
         Argument:
+            raycast_entier (Raycast_Entier): données sur l'entiéreté des raycasts du rendu
+            final (Raycast): rayon à envoyer
             point_de_depart (Transformation_3D): point de départ du rayon
-
-        Returns:
-            Raycast: résultat de raycast
         """
 
-        # Préparation des raycast
+        # Préparation du raycast
         avant = final.avant()
-        donnees = final.avancement_donnees()
-        ajout_horizontal, ajout_vertical, ratio_horizontal, ratio_vertical = donnees
-
-        # Réalisation du raycast vertical
-        point_vertical = point_de_depart.copie()
-        if avant.y() != 0:
-            # Départ vers le début réel du raycast
-            self.__raycast_appliquer_difference_verticale(point_vertical, ajout_vertical, ratio_vertical)
-            
-            # Premier test de la map
-            x_a_tester = floor(point_vertical.x())
-            y_a_tester = floor(point_vertical.y())
-            if ajout_vertical > 0: y_a_tester = floor(point_vertical.y()) + 1
-            self.__raycast_position_pleine(raycast_entier, x_a_tester, y_a_tester)
-            # Envoie du rayon
-            while self.dans_map_point(point_vertical):
-                # Nouvelle position
-                x_actuel = point_vertical.x() + ratio_vertical
-                y_actuel = point_vertical.y() + ajout_vertical
-                point_vertical.set_x(x_actuel)
-                point_vertical.set_y(y_actuel)
-
-                # Gérer la map
-                x_a_tester = floor(x_actuel)
-                y_a_tester = floor(y_actuel)
-                if ajout_vertical > 0: y_a_tester = floor(y_actuel) + 1
-                self.__raycast_position_pleine(raycast_entier, x_a_tester, y_a_tester)
-
-        # Réalisation du raycast horizontal
-        point_horizontal = point_de_depart.copie()
-        if avant.x() != 0:
-            # Départ vers le début réel du raycast
-            self.__raycast_appliquer_difference_horizontale(point_horizontal, ajout_horizontal, ratio_horizontal)
-            
-            # Premier test de la map
-            x_a_tester = floor(point_horizontal.x()) - 1
-            if ajout_horizontal > 0: x_a_tester = floor(point_horizontal.x())
-            y_a_tester = ceil(point_horizontal.y())
-            self.__raycast_position_pleine(raycast_entier, x_a_tester, y_a_tester)
-            # Envoie du rayon
-            while self.dans_map_point(point_horizontal):
-                # Nouvelle position
-                x_actuel = point_horizontal.x() + ajout_horizontal
-                y_actuel = point_horizontal.y() + ratio_horizontal
-                point_horizontal.set_x(x_actuel)
-                point_horizontal.set_y(y_actuel)
-
-                # Gérer la map
-                x_a_tester = floor(x_actuel) - 1
-                if ajout_horizontal > 0: x_a_tester = floor(x_actuel)
-                y_a_tester = floor(y_actuel)
-                self.__raycast_position_pleine(raycast_entier, x_a_tester, y_a_tester)
+        x_case, y_case = floor(point_de_depart.x()), floor(point_de_depart.y())
+        ajout_x, ajout_y = 0, 0
+        distance_delta_x, distance_delta_y = inf, inf
+        distance_x, distance_y = inf, inf
+        if avant.x() > 0:
+            ajout_x, distance_delta_x = 1, 1.0 / avant.x()
+            distance_x = (x_case + 1 - point_de_depart.x()) * distance_delta_x
+        elif avant.x() < 0:
+            ajout_x, distance_delta_x = -1, -1.0 / avant.x()
+            distance_x = (point_de_depart.x() - x_case) * distance_delta_x
+        if avant.y() > 0:
+            ajout_y, distance_delta_y = 1, 1.0 / avant.y()
+            distance_y = (y_case + 1 - point_de_depart.y()) * distance_delta_y
+        elif avant.y() < 0:
+            ajout_y, distance_delta_y = -1, -1.0 / avant.y()
+            distance_y = (point_de_depart.y() - y_case) * distance_delta_y
+
+        # Envoie du rayon
+        case_vide = False
+        collisions_transparentes = 0
+        distance_plane_maximum = self.camera().distance_plane_maximum()
+        hauteur_map, largeur_map = self.__hauteur_map, self.__largeur_map
+        map_blocs, map_hauteurs, map_materiaux = self.__map_blocs, self.__map_hauteurs, self.__map_materiaux
+        while True:
+            # Chercher le plus grand bloc vide contenant la case actuelle
+            if min(distance_x, distance_y) > distance_plane_maximum: break
+            niveau = 0
+            if case_vide:
+                for largeur_blocs, blocs in map_blocs:
+                    if blocs[(y_case >> (niveau + 1)) * largeur_blocs + (x_case >> (niveau + 1))] != 0: break
+                    niveau += 1
+
+            if niveau > 0:
+                # Sauter directement à la première case après le bloc vide
+                taille_bloc = 1 << niveau
+                x_bloc, y_bloc = (x_case >> niveau) << niveau, (y_case >> niveau) << niveau
+                pas_x = (x_bloc + taille_bloc - 1 - x_case if ajout_x > 0 else x_case - x_bloc) + 1
+                pas_y = (y_bloc + taille_bloc - 1 - y_case if ajout_y > 0 else y_case - y_bloc) + 1
+                sortie_x = distance_x + (pas_x - 1) * distance_delta_x if ajout_x != 0 else inf
+                sortie_y = distance_y + (pas_y - 1) * distance_delta_y if ajout_y != 0 else inf
+                if min(sortie_x, sortie_y) > distance_plane_maximum: break
+                if sortie_x < sortie_y:
+                    # Le rayon sort du bloc par une ligne verticale, après avoir traversé quelques lignes horizontales
+                    x_case, distance_x = x_case + pas_x * ajout_x, sortie_x + distance_delta_x
+                    if sortie_x >= distance_y:
+                        pas_y = floor((sortie_x - distance_y) / distance_delta_y) + 1
+                        y_case, distance_y = y_case + pas_y * ajout_y, distance_y + pas_y * distance_delta_y
+                else:
+                    # Le rayon sort du bloc par une ligne horizontale, après avoir traversé quelques lignes verticales
+                    y_case, distance_y = y_case + pas_y * ajout_y, sortie_y + distance_delta_y
+                    if sortie_y > distance_x:
+                        pas_x = ceil((sortie_y - distance_x) / distance_delta_x)
+                        x_case, distance_x = x_case + pas_x * ajout_x, distance_x + pas_x * distance_delta_x
+            elif distance_x < distance_y:
+                # Passer à la prochaine ligne de la grille la plus proche
+                distance_x += distance_delta_x
+                x_case += ajout_x
+            else:
+                distance_y += distance_delta_y
+                y_case += ajout_y
+
+            # Vérifier si le rayon est sorti de la map
+            case_vide = False
+            if x_case < 0 or y_case < 0 or x_case >= largeur_map or y_case >= hauteur_map:
+                if (x_case < 0 and ajout_x <= 0) or (x_case >= largeur_map and ajout_x >= 0): break
+                if (y_case < 0 and ajout_y <= 0) or (y_case >= hauteur_map and ajout_y >= 0): break
+                continue
+
+            # Gérer la case touchée
+            indice = y_case * largeur_map + x_case
+            case_vide = map_materiaux[indice] == 0
+            if not case_vide:
+                self.__raycast_case(raycast_entier, self.case(x_case, y_case))
+                if point_de_depart.z() <= map_hauteurs[indice]: break
+                collisions_transparentes += 1
+                if collisions_transparentes >= self.collisions_transparentes_maximum(): break
     # Effectue l'entiéreté des raycasts nécessaires à un rendu
     def __raycast_entier_un(self, raycast_entier: Raycast_Entier, nombre_raycast: int = 20):
-        """Effectue un raycast pour le raycast en multithread"""
+        """Envoie les rayons d'un raycast entier l'un après l'autre, dans ce processus
+
+        Le raycast dans plusieurs processus ne passe pas par ici : chaque processus trace une bande de colonnes avec "raycast_lot",
+        en lisant la map et en écrivant ses collisions dans de la mémoire partagée.
+        """
         for i in range(nombre_raycast):
             self.raycast(raycast_entier, raycast_entier.rayons()[i], self.camera())
-    def raycast_entier(self, nombre_rayons: int = 100, nombre_thread: int= 0, largeur_ecran: int = 100) -> Raycast_Entier:
+    def raycast_entier(self, nombre_rayons: int = 100, nombre_thread: int= 0, largeur_ecran: int = 100, tampon_collisions: Raycast_Tampon_Collisions = 0) -> Raycast_Entier:
         """Retourne les données sur l'entiéreté des raycasts nécessaires à un rendu
 
         Argument:
             nombre_rayons(int): nombre de rayons produits par le raycast
+            nombre_thread(int): nombre de processus qui se partagent les colonnes de l'écran (0 pour tout faire dans ce processus, nécessite NumPy)
+            largeur_ecran(int): nombre de colonnes de l'écran
+            tampon_collisions(Raycast_Tampon_Collisions): tampon où ranger les collisions (0 pour celui des tampons de rendu de la caméra)
 
         Returns:
             Raycast_Entier: données sur l'entiéreté des raycasts nécessaires à un rendu
         """
 
-        # Configurer le Raycast_Entier
-        angle_actuel = -self.camera().fov() / 2.0
-        dernier_raycast = 0
+        # Configurer le Raycast_Entier, avec la table des directions de la caméra
+        angles = self.camera().table_directions(largeur_ecran)[0]
+        x_directions, y_directions = self.camera().directions(largeur_ecran)
         pixels_par_rayon = ceil(largeur_ecran / nombre_rayons)
-        raycasts = Raycast_Entier()
+        if tampon_collisions == 0: tampon_collisions = self.camera().tampons_rendu().tampon_collisions()
+        tampon_collisions.vider()
+        raycasts = Raycast_Entier(tampon_collisions)
         raycasts.set_point_depart(self.camera())
-        for i in range(nombre_rayons):
-            # Créer le raycast
-            raycast_actuel = Raycast(self.camera())
-            raycasts.rayons().append(raycast_actuel)
-            for j in range(pixels_par_rayon):
-                raycast_actuel.angles_camera().append(angle_actuel)
-                angle_actuel += self.camera().fov() / (largeur_ecran)
-        # Créer 1 derniers Raycasts pour éviter certains bugs de rendu
-        angle_actuel = self.camera().fov() / 2.0
-        dernier_raycast = Raycast(self.camera())
-        for j in range(pixels_par_rayon):
-            dernier_raycast.angles_camera().append(angle_actuel)
-            angle_actuel += self.camera().fov() / (largeur_ecran)
-
-        if nombre_thread > 0:
-            # Création des threads nécessaires
-            rayons_par_thread = int(nombre_rayons / nombre_thread)
-            tous_les_threads = []
-            for i in range(nombre_thread):
-                tous_les_raycasts = []
-                thread = threading.Thread(target=self.__raycast_entier_un, args=(raycasts, tous_les_raycasts, i * rayons_par_thread, self.camera().fov(), nombre_rayons))
-                thread.start()
-                tous_les_threads.append(thread)
-                tous_les_threads.append(tous_les_raycasts)
-            
-            # Ajoute l'entiéreté des rayons
-            nb_raycast = 0
-            for thread in tous_les_threads:
-                if type(thread) == threading.Thread:
-                    thread.join()
-                else:
-                    for raycast in thread:
-                        raycasts.rayons()[nb_raycast] = raycast
-                        nb_raycast += 1
-        else: self.__raycast_entier_un(raycasts, raycasts.nombre_rayons())
-        # Effectue un dernier Raycast pour éviter certains bugs de rendu
-        self.raycast(raycasts, dernier_raycast, self.camera())
-
-        # Générations des objets dynamiques nécessaires
-        for objet in self.objets_dynamiques():
-            if objet.visible():
-                self.__raycast_objet_dynamique(raycasts, objet)
+        for i in range(nombre_rayons + 1):
+            # Créer le raycast, qui part de sa première colonne (le dernier raycast part du bord de l'écran, pour éviter certains bugs de rendu)
+            colonne = min(i * pixels_par_rayon, largeur_ecran)
+            if i == nombre_rayons: colonne = largeur_ecran
+            raycast_actuel = Raycast(self.camera(), raycasts.tampon())
+            raycast_actuel.angles_camera().extend(angles[colonne:colonne + pixels_par_rayon])
+            avant = Point_3D()
+            avant.set_x(x_directions[colonne])
+            avant.set_y(y_directions[colonne])
+            avant.set_z(sin(self.camera().rotation_x()))
+            raycast_actuel.set_avant(avant)
+            if i < nombre_rayons: raycasts.rayons().append(raycast_actuel)
+            else: dernier_raycast = raycast_actuel
+
+        cases_visibles = self.__cases_visibles_camera()
+        if nombre_thread > 0 and numpy != 0:
+            # Effectuer le raycast par bandes de colonnes, dans plusieurs processus
+            with self.__verrou_raycast_lot(nombre_thread):
+                self.__raycast_entier_depuis_lot(raycasts, self.raycast_lot(largeur_ecran, nombre_thread), largeur_ecran)
+        elif len(cases_visibles) > 0:
+            # Projeter directement les cases du PVS de la caméra
+            self.__raycast_pvs(raycasts, cases_visibles)
+        else:
+            self.__raycast_entier_un(raycasts, raycasts.nombre_rayons())
+            # Effectue un dernier Raycast pour éviter certains bugs de rendu
+            self.raycast(raycasts, dernier_raycast, self.camera())
 
-        # Terminer la recherche de collisions
-        for rayon in raycasts.rayons(): rayon.ranger_collisions()
-        
         return raycasts
+    def __raycast_entier_depuis_lot(self, raycast_entier: Raycast_Entier, resultat: Raycast_Lot, largeur_ecran: int) -> None:
+        """Ajoute les collisions d'un raycast par lot aux rayons d'un raycast entier
+
+        Args:
+            raycast_entier (Raycast_Entier): raycast entier où ajouter les collisions
+            resultat (Raycast_Lot): résultat du raycast par lot
+            largeur_ecran (int): nombre de colonnes de l'écran
+        """
+
+        # Préparation des données
+        rayon_par_pixel = floor(largeur_ecran / (raycast_entier.nombre_rayons()))
+        x_camera, y_camera, z_camera = self.camera().x(), self.camera().y(), self.camera().z()
+        x_directions, y_directions = self.camera().directions(largeur_ecran)
+
+        # Créer une collision pour chaque case touchée par chaque colonne
+        couches, colonnes = numpy.nonzero(numpy.isfinite(resultat.distances()))
+        for couche, colonne in zip(couches.tolist(), colonnes.tolist()):
+            rayon_actuel = floor(colonne / rayon_par_pixel)
+            if rayon_actuel >= raycast_entier.nombre_rayons(): continue
+            avant_x, avant_y = x_directions[colonne], y_directions[colonne]
+
+            # Retrouver les points d'entrée et de sortie depuis leurs distances
+            distance_entree = float(resultat.distances()[couche, colonne])
+            distance_plane = sqrt(max(0, distance_entree * distance_entree - z_camera * z_camera))
+            distance_sortie = float(resultat.distances_sortie()[couche, colonne])
+            distance_plane_sortie = sqrt(max(0, distance_sortie * distance_sortie - z_camera * z_camera))
+            if distance_sortie == inf: distance_sortie, distance_plane_sortie = -1, distance_plane
+
+            # Ajouter la collision
+            case = self.case(int(resultat.x_cases()[couche, colonne]), int(resultat.y_cases()[couche, colonne]))
+            indice = raycast_entier.tampon().ajouter(case, 0, colonne % rayon_par_pixel, x_camera + avant_x * distance_plane, y_camera + avant_y * distance_plane, distance_entree, x_camera + avant_x * distance_plane_sortie, y_camera + avant_y * distance_plane_sortie, distance_sortie, float(resultat.x_textures()[couche, colonne]))
+            raycast_entier.rayons()[rayon_actuel].ajouter_collision(indice, z_camera <= case.hauteur(), self.profondeur_maximum())
+    def __verrou_raycast_lot(self, nombre_processus: int):
+        """Retourne le verrou à prendre pendant un raycast par lot et la lecture de son résultat
+
+        Le résultat des processus est partagé entre toutes les caméras, qui doivent donc l'utiliser l'une après l'autre.
+        Sans processus, chaque raycast par lot a son propre résultat, et aucun verrou n'est nécessaire.
+
+        Args:
+            nombre_processus (int): nombre de processus du raycast par lot
+
+        Returns:
+            verrou à utiliser avec "with"
+        """
+        if nombre_processus > 0: return self.__verrou_raycast_lot_processus
+        return nullcontext()
+    def raycast_lot(self, largeur_ecran: int, nombre_processus: int = 0) -> Raycast_Lot:
+        """Effectue un raycast par lot, avec un rayon par colonne de l'écran (nécessite NumPy)
+
+        Args:
+            largeur_ecran (int): nombre de colonnes de l'écran
+            nombre_processus (int, optional): nombre de processus qui se partagent les colonnes de l'écran (0 pour tout faire dans ce processus). Defaults to 0.
+
+        Returns:
+            Raycast_Lot: collisions de chaque colonne, rangées de la plus proche à la plus lointaine
+        """
+
+        # Préparer le raycast
+        map_materiaux, map_hauteurs = self.map_tableau()
+        if map_materiaux.size <= 0: return Raycast_Lot(largeur_ecran, self.collisions_transparentes_maximum() + 1)
+        angles = self.camera().rotation_y() + numpy.array(self.camera().table_directions(largeur_ecran)[0][:largeur_ecran])
+        point_de_depart = (self.camera().x(), self.camera().y(), self.camera().z())
+
+        # Effectuer le raycast dans plusieurs processus
+        if nombre_processus > 0:
+            if self.__raycast_lot_processus == 0 or self.__raycast_lot_processus.nombre_processus() != nombre_processus:
+                if self.__raycast_lot_processus != 0: self.__raycast_lot_processus.fermer()
+                self.__raycast_lot_processus = Raycast_Lot_Processus(nombre_processus)
+            return self.__raycast_lot_processus.raycast(map_materiaux, map_hauteurs, point_de_depart, angles, self.collisions_transparentes_maximum() + 1, self.camera().distance_maximum())
+
+        # Effectuer le raycast dans ce processus
+        resultat = Raycast_Lot(largeur_ecran, self.collisions_transparentes_maximum() + 1)
+        raycast_lot_colonnes(resultat, map_materiaux, map_hauteurs, point_de_depart, angles, 0, self.camera().distance_maximum())
+        return resultat
     # Retourne la taille apparente d'un objet à une certaine distance
     def largeur_apparente(self, largeur: float, distance: float) -> float:
         """Retourne la largeur apparente d'un objet à une certaine distance
@@ -1131,6 +1966,9 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
     def rendu_2d(self) -> pygame.Surface:
         """Retourne le rendu 2D du raycast
 
+        Les cases sont dessinées une seule fois dans une couche gardée jusqu'à une modification de la map,
+        et les rayons sont ceux du dernier rendu 3D de la caméra (sans refaire de raycast, si ce rendu est de cette frame ou de la précédente).
+
         Returns:
             pygame.Surface: rendu 2D du raycast
         """
@@ -1145,26 +1983,16 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
             x_objet = self.camera().x() * largeur_case
             y_objet = surface.get_height() - self.camera().y() * largeur_case
             pygame.draw.circle(surface, (0, 255, 0), (x_objet, y_objet), 4)
-            
+
             # Dessiner les rayons de raycast
-            raycasts = self.raycast_entier()
-            for rayon in raycasts.rayons():
-                if len(rayon.collisions()) > 0:
-                    x_objet, y_objet = raycasts.point_depart().x() * largeur_case, surface.get_height() - raycasts.point_depart().y() * largeur_case
-                    x_devant, y_devant = rayon.collisions()[0].entree().x() * largeur_case, surface.get_height() - rayon.collisions()[0].entree().y() * largeur_case
-                    pygame.draw.line(surface, (0, 255, 0), (x_objet, y_objet), (x_devant, y_devant), 2)
-
-        # Dessiner les cases une par une dessus
-        x_actuel, y_actuel = 0, 0
-        for ligne in self.__map:
-            for case in ligne:
-                # On dessine les cases 1 par 1
-                if case.contenu() != 0:
-                    pygame.draw.rect(surface, case.contenu().couleur_2d(), (x_actuel * largeur_case, surface.get_height() - y_actuel * largeur_case, largeur_case, largeur_case))
-                x_actuel += 1
-            x_actuel = 0
-            y_actuel += 1
-        
+            x_depart, y_depart, points = self.__rayons_2d()
+            x_objet, y_objet = x_depart * largeur_case, surface.get_height() - y_depart * largeur_case
+            for x_devant, y_devant in points:
+                pygame.draw.line(surface, (0, 255, 0), (x_objet, y_objet), (x_devant * largeur_case, surface.get_height() - y_devant * largeur_case), 2)
+
+        # Dessiner les cases dessus
+        surface.blit(self.__couche_statique_2d(largeur_case), (0, 0))
+
         # Dessiner les objets dynamiques
         for objet in self.__objets_dynamiques:
             if objet.materiel() != 0:
@@ -1174,68 +2002,545 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
                 pygame.draw.circle(surface, objet.materiel().couleur_2d(), (x_objet, y_objet), 4)
 
         return surface
+    # Retourne la couche des cases du rendu 2D
+    def __couche_statique_2d(self, largeur_case: int) -> pygame.Surface:
+        """Retourne la couche transparente contenant les cases du rendu 2D, redessinée seulement si la map ou la couleur 2D d'un matériel change
+
+        Args:
+            largeur_case (int): largeur d'une case en pixel
+
+        Returns:
+            pygame.Surface: couche des cases du rendu 2D
+        """
+
+        # Vérifier si la couche est encore valide
+        taille = (self.__largeur_map * largeur_case, self.__hauteur_map * largeur_case)
+        if self.__couche_2d != 0 and self.__couche_2d.get_size() == taille:
+            if all(self.materiel_par_id(id).couleur_2d() == couleur for id, couleur in self.__couleurs_couche_2d.items()): return self.__couche_2d
+
+        # Dessiner les cases une par une
+        self.__couche_2d = pygame.Surface(taille, pygame.SRCALPHA)
+        self.__couleurs_couche_2d = {}
+        for indice, materiel in enumerate(self.__map_materiaux):
+            if materiel != 0:
+                if materiel not in self.__couleurs_couche_2d: self.__couleurs_couche_2d[materiel] = self.materiel_par_id(materiel).couleur_2d()
+                x_actuel, y_actuel = indice % self.__largeur_map, indice // self.__largeur_map
+                pygame.draw.rect(self.__couche_2d, self.__couleurs_couche_2d[materiel], (x_actuel * largeur_case, taille[1] - y_actuel * largeur_case, largeur_case, largeur_case))
+        return self.__couche_2d
+    # Retourne les rayons à dessiner dans le rendu 2D
+    def __rayons_2d(self) -> tuple:
+        """Retourne les rayons à dessiner dans le rendu 2D : ceux du dernier rendu 3D de la caméra s'il est assez récent et fait depuis sa position actuelle, ou ceux d'un nouveau raycast
+
+        Le rendu 3D ne garde que la distance de la première collision de chaque rayon : ses points ne sont calculés qu'ici.
+        Le nouveau raycast range ses collisions dans un tampon du moteur, pour ne pas écrire dans celui d'un rendu 3D de la caméra en cours.
+
+        Returns:
+            tuple: X et Y du départ des rayons, et liste des points (x, y) touchés en premier par chaque rayon
+        """
+        camera = self.camera()
+        rayons = camera.tampons_rendu().rayons_2d()
+        if rayons != 0 and rayons[0] >= self.structure_plus().numero_frame() - 1 and rayons[1:5] == (camera.x(), camera.y(), camera.z(), camera.rotation_y()):
+            # Calculer le point touché par chaque rayon du rendu 3D depuis la distance de sa première collision
+            numero_frame, x_depart, y_depart, z_depart, rotation_depart, x_directions, y_directions, colonnes, distances = rayons
+            points = []
+            for colonne, distance in zip(colonnes, distances):
+                if distance == inf: continue
+                distance_plane = sqrt(max(0, distance * distance - z_depart * z_depart))
+                points.append((x_depart + x_directions[colonne] * distance_plane, y_depart + y_directions[colonne] * distance_plane))
+            return (x_depart, y_depart, points)
+
+        # Effectuer un nouveau raycast, avec les rayons et la largeur d'écran du rendu 3D
+        raycasts = self.raycast_entier(self.nombre_rayons_camera(), 0, camera.largeur_ecran(), self.__tampon_collisions_2d)
+        x_entrees, y_entrees = raycasts.tampon().x_entrees(), raycasts.tampon().y_entrees()
+        points = [(x_entrees[rayon.indices_collisions()[0]], y_entrees[rayon.indices_collisions()[0]]) for rayon in raycasts.rayons() if len(rayon.indices_collisions()) > 0]
+        return (raycasts.point_depart().x(), raycasts.point_depart().y(), points)
+    # Garde les rayons d'un rendu 3D pour le rendu 2D
+    def __garder_rayons_2d(self, largeur_ecran: int, colonnes: list, distances: list) -> None:
+        """Garde les rayons d'un rendu 3D dans les tampons de rendu de la caméra, pour le rendu 2D
+
+        Args:
+            largeur_ecran (int): nombre de colonnes de l'écran
+            colonnes (list): colonne de l'écran de la première collision de chaque rayon
+            distances (list): distance de la première collision de chaque rayon (inf si il ne touche rien)
+        """
+        camera = self.camera()
+        x_directions, y_directions = camera.directions(largeur_ecran)
+        camera.tampons_rendu().set_rayons_2d((self.structure_plus().numero_frame(), camera.x(), camera.y(), camera.z(), camera.rotation_y(), x_directions, y_directions, colonnes, distances))
     # Retourne le rendu 3D du raycast
     def rendu_3d(self) -> pygame.Surface:
         """Retourne le rendu 3D du raycast
 
+        La surface retournée est celle de la caméra, réutilisée d'une frame à l'autre, et recréée seulement si la largeur de l'écran change.
+
         Returns:
             pygame.Surface: rendu 3D du raycast
         """
 
-        # Création de la surface et des informations nécessaire
+        # Préparation de la surface et des informations nécessaire
         largeur_ecran = self.camera().largeur_ecran()
-        raycasts = self.raycast_entier(50, 0, largeur_ecran)
-        surface = pygame.Surface((largeur_ecran, largeur_ecran))
+        tampons = self.camera().tampons_rendu()
+        if tampons.surface_rendu_3d() == 0 or tampons.surface_rendu_3d().get_width() != largeur_ecran:
+            tampons.set_surface_rendu_3d(pygame.Surface((largeur_ecran, largeur_ecran), 0, 32))
+        surface = tampons.surface_rendu_3d()
         surface.fill(self.couleur_arriere_plan())
 
-        # Calcul de l'horizon
+        # Calcul de l'horizon, et dessin du sol et du plafond
         horizon_y = (surface.get_height() / 2.0) + (surface.get_height()) * sin(self.camera().rotation_x())
-        if(floor(horizon_y) < surface.get_height()):
+        if self.__texture_plafond != 0: self.__rendu_3d_plan(surface, self.__texture_plafond, self.__hauteur_plafond, horizon_y)
+        if(floor(horizon_y) < surface.get_height()) and not self.__rendu_3d_plan(surface, self.__texture_sol, 0, horizon_y):
             surface.blit(self.texture_bas_rendu_3D(surface.get_width(), surface.get_height() - floor(horizon_y)), (0, floor(horizon_y)))
 
-        # Dessiner chaque rayon
+        # Dessiner les cases selon le mode de raycast, puis les objets dynamiques testés avec le tampon de profondeur
+        tampons.set_profondeurs_colonnes(array("d", [inf]) * largeur_ecran)
+        tampons.set_hauts_colonnes(array("l", [0]) * largeur_ecran)
+        if self.mode_raycast() == "lot": self.__rendu_3d_lot(surface, horizon_y)
+        else: self.__rendu_3d_classique(surface, horizon_y)
+        self.__rendu_3d_objets_dynamiques(surface, horizon_y)
+
+        return surface
+    # Retourne le rendu 3D d'une caméra
+    def rendu_3d_camera(self, camera: Raycast_Camera) -> pygame.Surface:
+        """Retourne le rendu 3D d'une caméra du moteur (autre que sa caméra principale, pour un écran partagé ou un rétroviseur par exemple)
+
+        La map, les matériaux et les caches des textures sont partagés entre les caméras, mais chaque caméra a ses propres tampons de rendu :
+        plusieurs caméras peuvent donc être rendues en même temps, dans des threads différents.
+
+        Args:
+            camera (Raycast_Camera): caméra à rendre (0 pour la caméra principale)
+
+        Returns:
+            pygame.Surface: rendu 3D de la caméra
+        """
+        if camera == 0 or camera == self.__camera: return self.rendu_3d()
+        return self.rendu_3d_instantane(Raycast_Instantane(camera, self.__objets_dynamiques, False))
+    # Retourne un instantané de l'état nécessaire au rendu
+    def instantane(self, camera: Raycast_Camera = 0) -> Raycast_Instantane:
+        """Retourne un instantané d'une caméra et des objets dynamiques, pour un rendu pendant que la simulation continue
+
+        Args:
+            camera (Raycast_Camera, optional): caméra de l'instantané (0 pour la caméra principale). Defaults to 0.
+
+        Returns:
+            Raycast_Instantane: instantané de l'état nécessaire au rendu
+        """
+        if camera == 0: camera = self.__camera
+        return Raycast_Instantane(camera, self.__objets_dynamiques)
+    # Retourne le rendu 3D d'un instantané
+    def rendu_3d_instantane(self, instantane: Raycast_Instantane) -> pygame.Surface:
+        """Retourne le rendu 3D d'un instantané, qui peut être fait dans un autre thread que la simulation
+
+        Pendant ce rendu, "camera" et "objets_dynamiques" retournent l'instantané seulement dans le thread du rendu.
+        La map ne doit pas être modifiée pendant le rendu.
+
+        Args:
+            instantane (Raycast_Instantane): instantané à rendre
+
+        Returns:
+            pygame.Surface: rendu 3D de l'instantané
+        """
+        self.__instantane_rendu.instantane = instantane
+        try: return self.rendu_3d()
+        finally: self.__instantane_rendu.instantane = 0
+    def __couleur_brouillard(self, couleur: tuple, distance: float) -> tuple:
+        """Retourne une couleur mélangée avec la couleur d'arrière plan selon le brouillard de la caméra
+
+        Args:
+            couleur (tuple): couleur à mélanger
+            distance (float): distance de la couleur
+
+        Returns:
+            tuple: couleur mélangée
+        """
+        facteur = self.camera().facteur_brouillard(distance)
+        if facteur <= 0: return couleur
+        return tuple(round(c + (f - c) * facteur) for c, f in zip(couleur, self.couleur_arriere_plan()))
+    def __facteurs_brouillard(self, distances: "numpy.ndarray") -> "numpy.ndarray":
+        """Retourne la force du brouillard à plusieurs distances, comme "Raycast_Camera.facteur_brouillard"
+
+        Args:
+            distances (numpy.ndarray): distances à tester
+
+        Returns:
+            numpy.ndarray: force du brouillard à chaque distance, entre 0 et 1
+        """
+        camera = self.camera()
+        if not camera.brouillard() or camera.distance_maximum() <= 0: return numpy.zeros(distances.shape)
+        if camera.distance_maximum() <= camera.distance_brouillard(): return (distances > camera.distance_brouillard()).astype(numpy.float64)
+        return numpy.clip((distances - camera.distance_brouillard()) / (camera.distance_maximum() - camera.distance_brouillard()), 0, 1)
+    def __rendu_3d_case(self, surface: pygame.Surface, x_colonne: int, distance_entree: float, distance_sortie: float, horizon_y: float) -> int:
+        """Dessine une colonne d'une case dans le rendu 3D
+
+        Args:
+            surface (pygame.Surface): surface du rendu 3D
+            x_colonne (int): colonne de pixels à dessiner
+            distance_entree (float): distance d'entrée dans la case
+            distance_sortie (float): distance de sortie de la case (ou -1 si inconnue)
+            horizon_y (float): position Y de l'horizon
+
+        Returns:
+            int: position Y du plus haut pixel dessiné
+        """
+
+        # Calcul de la position de la case
+        hauteur_surface = surface.get_height()
+        objet_hauteur = self.taille_apparente(hauteur_surface, distance_entree)
+        objet_y = horizon_y - ceil((-self.camera().z() * (self.camera().distance_ecran() / distance_entree)) * hauteur_surface) - objet_hauteur
+        haut_y = objet_y
+        # Dessiner le toit si nécessaire
+        if objet_y > horizon_y and distance_sortie != -1:
+            autre_cote_hauteur = self.taille_apparente(hauteur_surface, distance_sortie)
+            autre_cote_y = horizon_y - floor((-self.camera().z() * (self.camera().distance_ecran() / distance_sortie)) * hauteur_surface) - autre_cote_hauteur
+            pygame.draw.rect(surface, self.__couleur_brouillard((255, 0, 0), distance_entree), (x_colonne, autre_cote_y, 1, (objet_y - autre_cote_y) + 1))
+            haut_y = min(haut_y, autre_cote_y)
+        # Optimiser le traçage
+        if objet_y < 0:
+            objet_hauteur += objet_y
+            objet_y = 0
+        if objet_y + objet_hauteur > hauteur_surface: objet_hauteur = hauteur_surface - objet_y
+        pygame.draw.rect(surface, self.__couleur_brouillard((180, 0, 0), distance_entree), (x_colonne, objet_y, 1, objet_hauteur))
+        return max(0, int(haut_y))
+    def __rendu_3d_cases_tableau(self, surface: pygame.Surface, colonnes: "numpy.ndarray", distances_entree: "numpy.ndarray", distances_sortie: "numpy.ndarray", horizon_y: float) -> None:
+        """Dessine des colonnes de cases directement dans les pixels du rendu 3D, avec NumPy, et remplit le tampon de profondeur
+
+        Le résultat est le même que "__rendu_3d_case" appelé pour chaque collision dans l'ordre donné,
+        mais chaque colonne de pixels est remplie en quelques opérations NumPy au lieu d'un appel à Pygame par colonne.
+
+        Args:
+            surface (pygame.Surface): surface du rendu 3D (en 32 bits)
+            colonnes (numpy.ndarray): colonne de pixels de chaque collision, dans l'ordre de dessin (de la plus lointaine à la plus proche)
+            distances_entree (numpy.ndarray): distance d'entrée dans la case de chaque collision
+            distances_sortie (numpy.ndarray): distance de sortie de la case de chaque collision (ou -1 si inconnue)
+            horizon_y (float): position Y de l'horizon
+        """
+        if colonnes.shape[0] <= 0: return
+
+        # Calcul de la position des cases et de leur toit (comme dans "__rendu_3d_case")
+        hauteur_surface = surface.get_height()
+        distance_ecran, z_camera = self.camera().distance_ecran(), self.camera().z()
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            objet_hauteur = (distance_ecran / distances_entree) * hauteur_surface
+            objet_y = horizon_y - numpy.ceil((-z_camera * (distance_ecran / distances_entree)) * hauteur_surface) - objet_hauteur
+            autre_cote_hauteur = (distance_ecran / distances_sortie) * hauteur_surface
+            autre_cote_y = horizon_y - numpy.floor((-z_camera * (distance_ecran / distances_sortie)) * hauteur_surface) - autre_cote_hauteur
+        toits = (objet_y > horizon_y) & (distances_sortie != -1)
+        haut_y = numpy.where(toits, numpy.minimum(objet_y, autre_cote_y), objet_y)
+        hauteur_mur = numpy.where(objet_y < 0, objet_hauteur + objet_y, objet_hauteur)
+        y_mur = numpy.maximum(objet_y, 0)
+        hauteur_mur = numpy.where(y_mur + hauteur_mur > hauteur_surface, hauteur_surface - y_mur, hauteur_mur)
+
+        # Préparer les segments de pixels à remplir (le toit puis le mur de chaque collision), tronqués comme par Pygame
+        nombre = colonnes.shape[0]
+        debuts, fins = numpy.empty(nombre * 2), numpy.empty(nombre * 2)
+        debuts[0::2] = numpy.where(toits, numpy.trunc(autre_cote_y), 0)
+        fins[0::2] = numpy.where(toits, debuts[0::2] + numpy.trunc(objet_y - autre_cote_y + 1), 0)
+        debuts[1::2], fins[1::2] = numpy.trunc(y_mur), numpy.trunc(y_mur) + numpy.trunc(hauteur_mur)
+        couleurs = numpy.empty((nombre * 2, 3))
+        couleurs[0::2], couleurs[1::2] = (255, 0, 0), (180, 0, 0)
+        facteurs = numpy.repeat(self.__facteurs_brouillard(distances_entree), 2)[:, None]
+        couleurs = numpy.round(couleurs + (numpy.array(self.couleur_arriere_plan()[:3]) - couleurs) * facteurs).astype(numpy.uint32)
+        decalages, pertes = surface.get_shifts(), surface.get_losses()
+        valeurs = numpy.full(nombre * 2, surface.get_masks()[3], dtype=numpy.uint32)
+        for i in range(3): valeurs |= (couleurs[:, i] >> pertes[i]) << decalages[i]
+        colonnes_segments = numpy.repeat(colonnes, 2)
+        debuts, fins = numpy.clip(debuts, 0, hauteur_surface).astype(numpy.int64), numpy.clip(fins, 0, hauteur_surface).astype(numpy.int64)
+        garde = fins > debuts
+        debuts, fins, valeurs, colonnes_segments = debuts[garde], fins[garde], valeurs[garde], colonnes_segments[garde]
+
+        # Numéroter les segments de chaque colonne dans l'ordre de dessin
+        ordre = numpy.argsort(colonnes_segments, kind="stable")
+        colonnes_rangees = colonnes_segments[ordre]
+        premiers = numpy.flatnonzero(numpy.r_[True, colonnes_rangees[1:] != colonnes_rangees[:-1]])
+        rangs = numpy.empty(ordre.shape[0], dtype=numpy.int64)
+        rangs[ordre] = numpy.arange(ordre.shape[0]) - numpy.repeat(premiers, numpy.diff(numpy.r_[premiers, ordre.shape[0]]))
+
+        # Remplir les segments rang par rang, chaque rang ayant au plus un segment par colonne (seuls les pixels couverts sont touchés)
+        pixels = pygame.surfarray.pixels2d(surface)
+        for rang in range(int(rangs.max(initial=-1)) + 1):
+            segments = rangs == rang
+            longueurs = fins[segments] - debuts[segments]
+            decalages_lignes = numpy.cumsum(longueurs) - longueurs
+            y = numpy.repeat(debuts[segments] - decalages_lignes, longueurs) + numpy.arange(int(longueurs.sum()))
+            pixels[numpy.repeat(colonnes_segments[segments], longueurs), y] = numpy.repeat(valeurs[segments], longueurs)
+        del pixels
+
+        # Garder la collision la plus proche (la dernière dessinée) de chaque colonne dans le tampon de profondeur
+        colonnes_uniques, derniers = numpy.unique(colonnes[::-1], return_index=True)
+        derniers = nombre - 1 - derniers
+        tampons = self.camera().tampons_rendu()
+        profondeurs = numpy.frombuffer(tampons.profondeurs_colonnes(), dtype=numpy.float64)
+        hauts = numpy.frombuffer(tampons.hauts_colonnes(), dtype="i" + str(tampons.hauts_colonnes().itemsize))
+        profondeurs[colonnes_uniques] = distances_entree[derniers]
+        hauts[colonnes_uniques] = numpy.maximum(0, numpy.trunc(haut_y[derniers]))
+    def __quantifier_taille_objet(self, taille: float) -> int:
+        """Retourne une taille à l'écran d'objet dynamique quantifiée, pour limiter le nombre de redimensionnements différents
+
+        Les tailles de plus de 64 pixels sont arrondies en gardant 6 bits significatifs (erreur de moins de 2%).
+
+        Args:
+            taille (float): taille à l'écran en pixels
+
+        Returns:
+            int: taille quantifiée en pixels
+        """
+        taille = round(taille)
+        if taille <= 64: return taille
+        pas = 1 << (taille.bit_length() - 6)
+        return ((taille + pas // 2) // pas) * pas
+    def __texture_objet_dynamique(self, texture: Texture, largeur: int, hauteur: int) -> pygame.Surface:
+        """Retourne une texture d'objet dynamique entière redimensionnée, depuis le cache si possible
+
+        Args:
+            texture (Texture): texture à redimensionner
+            largeur (int): largeur quantifiée de l'objet à l'écran
+            hauteur (int): hauteur quantifiée de l'objet à l'écran
+
+        Returns:
+            pygame.Surface: texture redimensionnée (ou 0 si elle est trop grande pour le cache)
+        """
+        cache = self.__cache_objets_dynamiques
+        cle = (texture, largeur, hauteur)
+        image = cache.element(cle)
+        if image != 0: return image
+
+        # Ne pas redimensionner entièrement une texture prenant plus d'un quart du cache
+        taille = largeur * hauteur * texture.surface().get_bytesize()
+        if cache.taille_maximum() > 0 and taille * 4 > cache.taille_maximum(): return 0
+        image = pygame.transform.scale(texture.surface(), (largeur, hauteur))
+        cache.ajouter(cle, image, taille)
+        return image
+    def __rendu_3d_objet_dynamique(self, surface: pygame.Surface, objet: Raycast_Objet_Dynamique, distance_objet: float, colonne_debut: int, nombre_colonnes: int, horizon_y: float) -> None:
+        """Dessine un objet dynamique entier dans le rendu 3D, en testant chaque colonne avec le tampon de profondeur
+
+        Une colonne plus proche que la case la plus proche de sa colonne est dessinée entièrement,
+        sinon seule la partie au dessus de cette case est dessinée.
+        La taille de l'objet à l'écran est quantifiée, pour réutiliser les textures redimensionnées du cache.
+
+        Args:
+            surface (pygame.Surface): surface du rendu 3D
+            objet (Raycast_Objet_Dynamique): objet à dessiner
+            distance_objet (float): distance de l'objet
+            colonne_debut (int): première colonne couverte par l'objet
+            nombre_colonnes (int): nombre de colonnes couvertes par l'objet
+            horizon_y (float): position Y de l'horizon
+        """
+
+        # Quantifier la taille de l'objet, en gardant son centre
+        hauteur_surface = surface.get_height()
+        objet_hauteur = self.__quantifier_taille_objet(self.taille_apparente(hauteur_surface * objet.hauteur(), distance_objet))
+        largeur_objet = self.__quantifier_taille_objet(nombre_colonnes)
+        colonne_debut = round(colonne_debut + (nombre_colonnes - largeur_objet) / 2.0)
+        nombre_colonnes = largeur_objet
+
+        # Calcul de la position de l'objet
+        objet_y = horizon_y - ((objet.z() - self.camera().z()) * (self.camera().distance_ecran() / distance_objet)) * hauteur_surface - objet_hauteur / 2.0
+
+        # Garder seulement la partie de l'objet dans l'écran
+        if objet_y < 0 or nombre_colonnes <= 0 or objet_hauteur <= 0: return
+        debut, fin = max(0, colonne_debut), min(surface.get_width(), colonne_debut + nombre_colonnes)
+        objet_y = int(objet_y)
+        hauteur_image = min(objet_hauteur, hauteur_surface - objet_y)
+        if debut >= fin or hauteur_image <= 0: return
+
+        # Préparer l'image de l'objet, avec x_image la colonne de l'image correspondant à "debut"
+        x_image = 0
+        if objet.texture() == 0:
+            # Préparer l'objet sans texture
+            image = pygame.Surface((fin - debut, hauteur_image))
+            image.fill(self.__couleur_brouillard((180, 180, 180), distance_objet))
+        else:
+            image = self.__texture_objet_dynamique(objet.texture(), nombre_colonnes, objet_hauteur)
+            if image != 0:
+                # Utiliser la texture entière redimensionnée du cache
+                x_image = debut - colonne_debut
+            else:
+                # Redimensionner seulement la partie visible de la texture, trop grande pour le cache
+                texture_surface = objet.texture().surface()
+                largeur_texture, hauteur_texture = texture_surface.get_size()
+                x_texture = min(largeur_texture - 1, floor(largeur_texture * (debut - colonne_debut) / nombre_colonnes))
+                largeur_source = max(1, min(largeur_texture, ceil(largeur_texture * (fin - colonne_debut) / nombre_colonnes)) - x_texture)
+                hauteur_source = max(1, min(hauteur_texture, ceil(hauteur_texture * hauteur_image / objet_hauteur)))
+                image = pygame.transform.scale(texture_surface.subsurface((x_texture, 0, largeur_source, hauteur_source)), (fin - debut, hauteur_image))
+            facteur = self.camera().facteur_brouillard(distance_objet)
+            if facteur > 0:
+                # Mélanger la partie visible de la texture avec la couleur d'arrière plan, sans modifier le cache
+                if x_image != 0 or image.get_size() != (fin - debut, hauteur_image):
+                    image = image.subsurface((x_image, 0, fin - debut, hauteur_image)).copy()
+                    x_image = 0
+                image.fill([round(255 * (1 - facteur))] * 3, special_flags=pygame.BLEND_RGB_MULT)
+                image.fill([round(couleur * facteur) for couleur in self.couleur_arriere_plan()[:3]], special_flags=pygame.BLEND_RGB_ADD)
+
+        # Tester chaque colonne avec le tampon de profondeur
+        tampons = self.camera().tampons_rendu()
+        profondeurs, hauts = tampons.profondeurs_colonnes(), tampons.hauts_colonnes()
+        limites = []
+        for colonne in range(debut, fin):
+            if distance_objet < profondeurs[colonne]: limites.append(hauteur_image)
+            else: limites.append(max(0, min(hauteur_image, hauts[colonne] - objet_y)))
+
+        # Dessiner les suites de colonnes ayant la même limite en une seule fois
+        i = 0
+        while i < len(limites):
+            j = i + 1
+            while j < len(limites) and limites[j] == limites[i]: j += 1
+            if limites[i] > 0: surface.blit(image, (debut + i, objet_y), (x_image + i, 0, j - i, limites[i]))
+            i = j
+    def __rendu_3d_objets_dynamiques(self, surface: pygame.Surface, horizon_y: float) -> None:
+        """Dessine les objets dynamiques dans le rendu 3D, du plus lointain au plus proche, après les cases
+
+        Args:
+            surface (pygame.Surface): surface du rendu 3D
+            horizon_y (float): position Y de l'horizon
+        """
+
+        # Projeter les objets visibles
+        cases_visibles = self.__cases_visibles_camera()
+        objets = []
+        for objet in self.objets_dynamiques():
+            if not self.__raycast_objet_dynamique_visible(objet, cases_visibles): continue
+            projection = self.__raycast_projection_objet_dynamique(objet)
+            if projection != 0: objets.append((projection, objet))
+        objets.sort(key=lambda objet: objet[0][0], reverse=True)
+
+        # Dessiner les objets
+        for (distance_objet, colonne_debut, nombre_colonnes), objet in objets:
+            self.__rendu_3d_objet_dynamique(surface, objet, distance_objet, colonne_debut, nombre_colonnes, horizon_y)
+    def __rendu_3d_classique(self, surface: pygame.Surface, horizon_y: float) -> None:
+        """Dessine les cases touchées par le raycast classique dans le rendu 3D, en remplissant le tampon de profondeur
+
+        Args:
+            surface (pygame.Surface): surface du rendu 3D
+            horizon_y (float): position Y de l'horizon
+        """
+
+        # Effectuer le raycast
+        raycasts = self.raycast_entier(min(self.nombre_rayons_camera(), surface.get_width()), self.nombre_processus(), surface.get_width())
+
+        # Dessiner chaque rayon, en lisant directement le tampon des collisions
+        tampon = raycasts.tampon()
+        cases, offsets_x = tampon.cases(), tampon.offsets_x()
+        distances, distances_sortie = tampon.distances(), tampon.distances_sortie()
+        tampons = self.camera().tampons_rendu()
+        profondeurs, hauts = tampons.profondeurs_colonnes(), tampons.hauts_colonnes()
         largeur_rayon = int(surface.get_width() / (raycasts.nombre_rayons()))
+        colonnes, indices = [], []
+        colonnes_2d, distances_2d = [], []
         rayon_actuel = 0
         for rayon in raycasts.rayons():
-            if len(rayon.collisions()) > 0:
-                # Calculer les valeur nécessaire à l'objet selon un rayon
-                for collision_actuelle in rayon.collisions()[::-1]:
-                    if collision_actuelle.case_touchee() != 0:
-                        # Faire le rendu d'une case
-                        objet_hauteur = self.taille_apparente(surface.get_height(), collision_actuelle.entree_distance())
-                        objet_y = self.y_pixel_collision(collision_actuelle, surface.get_height(), horizon_y) - objet_hauteur
-                        if objet_y < 0 : continue
-                        # Dessiner le toit si nécessaire
-                        if objet_y > horizon_y and collision_actuelle.case_sortie_distance() != -1:
-                            autre_cote_hauteur = self.taille_apparente(surface.get_height(), collision_actuelle.case_sortie_distance())
-                            autre_cote_y = self.y_pixel_collision_toit(collision_actuelle, surface.get_height(), horizon_y) - autre_cote_hauteur
-                            pygame.draw.rect(surface, (255, 0, 0), (rayon_actuel * largeur_rayon + collision_actuelle.offset_x(), autre_cote_y, 1, (objet_y - autre_cote_y) + 1))
-                        # Optimiser le traçage
-                        if objet_y + objet_hauteur > surface.get_height(): objet_hauteur += surface.get_height() - objet_y
-                        pygame.draw.rect(surface, (180, 0, 0), (rayon_actuel * largeur_rayon + collision_actuelle.offset_x(), objet_y, 1, objet_hauteur))
-                    elif collision_actuelle.objet_dynamique_touche() != 0:
-                        # Faire le rendu d'un objet dynamique
-                        objet = collision_actuelle.objet_dynamique_touche()
-                        objet_hauteur = self.taille_apparente(surface.get_height() * objet.hauteur(), collision_actuelle.entree_distance())
-                        objet_y = self.y_pixel_collision(collision_actuelle, surface.get_height(), horizon_y) - objet_hauteur / 2.0
-
-                        # Optimiser le traçage
-                        if objet_y < 0 : continue
-                        if objet_y + objet_hauteur > surface.get_height(): objet_hauteur += surface.get_height() - objet_y
-
-                        if objet.texture() == 0:
-                            # Tracer sans texture
-                            pygame.draw.rect(surface, (180, 180, 180), (rayon_actuel * largeur_rayon + collision_actuelle.offset_x(), objet_y, 1, objet_hauteur))
-                        else:
-                            # Tracer avec texture
-                            texture_surface = objet.texture().surface()
-                            texture_finale = objet.texture().surface().subsurface((texture_surface.get_width() * collision_actuelle.x_texture(), 0, 1, texture_surface.get_height()))
-                            texture_finale = pygame.transform.scale(texture_finale, (1, objet_hauteur))
-                            surface.blit(texture_finale, (rayon_actuel * largeur_rayon + collision_actuelle.offset_x(), objet_y, 1, objet_hauteur))
+            # Garder la colonne et la distance de la première collision du rayon, pour le rendu 2D
+            if len(rayon.indices_collisions()) > 0:
+                colonnes_2d.append(rayon_actuel * largeur_rayon + offsets_x[rayon.indices_collisions()[0]])
+                distances_2d.append(distances[rayon.indices_collisions()[0]])
+
+            # Dessiner les collisions de la plus lointaine à la plus proche, la plus proche restant dans le tampon de profondeur
+            for indice in reversed(rayon.indices_collisions()):
+                if cases[indice] == 0: continue
+                x_colonne = rayon_actuel * largeur_rayon + offsets_x[indice]
+                if numpy != 0:
+                    # Garder la collision pour la dessiner avec NumPy
+                    colonnes.append(x_colonne)
+                    indices.append(indice)
+                    continue
+                profondeurs[x_colonne] = distances[indice]
+                hauts[x_colonne] = self.__rendu_3d_case(surface, x_colonne, distances[indice], distances_sortie[indice], horizon_y)
             rayon_actuel += 1
+        self.__garder_rayons_2d(surface.get_width(), colonnes_2d, distances_2d)
+
+        # Dessiner toutes les collisions gardées en une fois
+        if numpy != 0 and len(indices) > 0:
+            indices = numpy.array(indices)
+            distances_entree = numpy.frombuffer(distances, dtype=numpy.float64)[indices]
+            distances_sortie = numpy.frombuffer(distances_sortie, dtype=numpy.float64)[indices]
+            self.__rendu_3d_cases_tableau(surface, numpy.array(colonnes), distances_entree, distances_sortie, horizon_y)
+    def __rendu_3d_plan(self, surface: pygame.Surface, texture: Texture, hauteur_plan: float, horizon_y: float) -> bool:
+        """Dessine un plan horizontal texturé (sol ou plafond) dans le rendu 3D, avec NumPy
+
+        La distance de chaque ligne de pixels est calculée une seule fois, comme pour le bas et le toit des cases,
+        puis la texture est lue pour toutes les colonnes de ces lignes en une seule opération.
+
+        Args:
+            surface (pygame.Surface): surface du rendu 3D
+            texture (Texture): texture du plan
+            hauteur_plan (float): hauteur du plan (0 pour le sol)
+            horizon_y (float): position Y de l'horizon
+
+        Returns:
+            bool: si le plan a été dessiné (il ne l'est pas sans texture, sans NumPy, ou si la caméra ne le voit pas)
+        """
+        camera = self.camera()
+        difference_z = hauteur_plan - camera.z()
+        if numpy == 0 or texture == 0 or texture.surface() == 0 or difference_z == 0: return False
+        largeur_surface, hauteur_surface = surface.get_size()
+
+        # Calculer la distance de chaque ligne du plan, comme "y_pixel_collision" à l'envers
+        if difference_z < 0: lignes = numpy.arange(max(0, floor(horizon_y)), hauteur_surface)
+        else: lignes = numpy.arange(0, max(0, min(hauteur_surface, ceil(horizon_y))))
+        ecarts = numpy.abs(lignes + 0.5 - horizon_y)
+        lignes_plan = (lignes + 0.5 - horizon_y) * difference_z < 0
+        distances = numpy.full(lignes.shape, inf)
+        distances[lignes_plan] = (abs(difference_z) * camera.distance_ecran() * hauteur_surface) / ecarts[lignes_plan]
+        if camera.distance_maximum() > 0: lignes_plan &= distances <= camera.distance_maximum()
+        lignes, distances = lignes[lignes_plan], distances[lignes_plan]
+        if len(lignes) == 0: return True
+        distances_planes = numpy.sqrt(numpy.maximum(0, distances * distances - camera.z() * camera.z()))
+
+        # Lire la texture (convertie au format du rendu, sans passer par l'affichage) au point touché par chaque pixel
+        pixels_texture = self.__pixels_textures.get(texture)
+        if pixels_texture is None:
+            pixels_texture = pygame.surfarray.map_array(surface, pygame.surfarray.array3d(texture.surface()))
+            self.__pixels_textures[texture] = pixels_texture
+        largeur_texture, hauteur_texture = pixels_texture.shape
+        x_directions, y_directions = camera.directions(largeur_surface)
+        x_points = camera.x() + numpy.asarray(x_directions[:largeur_surface])[:, None] * distances_planes[None, :]
+        y_points = camera.y() + numpy.asarray(y_directions[:largeur_surface])[:, None] * distances_planes[None, :]
+        x_texture = numpy.floor(x_points * largeur_texture).astype(numpy.intp) % largeur_texture
+        y_texture = numpy.floor(y_points * hauteur_texture).astype(numpy.intp) % hauteur_texture
+        couleurs = pixels_texture.ravel().take(x_texture * hauteur_texture + y_texture)
+
+        # Mélanger chaque composante avec la couleur d'arrière plan selon le brouillard
+        facteurs = self.__facteurs_brouillard(distances)
+        if facteurs.any():
+            facteurs = facteurs[None, :]
+            couleurs_brouillard = numpy.zeros(couleurs.shape, dtype=couleurs.dtype)
+            for decalage, composante in zip(surface.get_shifts()[:3], self.couleur_arriere_plan()[:3]):
+                composantes = (couleurs >> decalage) & 255
+                couleurs_brouillard |= (composantes * (1 - facteurs) + composante * facteurs).round().astype(couleurs.dtype) << decalage
+            couleurs = couleurs_brouillard
+
+        # Les lignes du plan se suivent, elles sont copiées en une seule fois
+        pixels = pygame.surfarray.pixels2d(surface)
+        pixels[:, lignes[0]:lignes[-1] + 1] = couleurs
+        del pixels
+        return True
+    def __rendu_3d_lot(self, surface: pygame.Surface, horizon_y: float) -> None:
+        """Dessine les cases touchées par le raycast par lot dans le rendu 3D, en remplissant le tampon de profondeur
+
+        Args:
+            surface (pygame.Surface): surface du rendu 3D
+            horizon_y (float): position Y de l'horizon
+        """
+
+        # Effectuer le raycast, dont les collisions de chaque colonne sont déjà rangées par couche, de la plus proche à la plus lointaine
+        with self.__verrou_raycast_lot(self.nombre_processus()):
+            raycasts = self.raycast_lot(surface.get_width(), self.nombre_processus())
+            nombre_couches = raycasts.nombre_couches()
+            if self.profondeur_maximum() > 0: nombre_couches = min(nombre_couches, self.profondeur_maximum())
+            distances = raycasts.distances()[:nombre_couches]
+            distances_sortie = raycasts.distances_sortie()[:nombre_couches]
+            touchees = numpy.isfinite(distances)
+
+            # Ranger les couches de la plus lointaine à la plus proche, les colonnes étant indépendantes entre elles
+            couches, colonnes = numpy.nonzero(touchees[::-1])
+            couches = nombre_couches - 1 - couches
+            distances_entree, distances_sortie = distances[couches, colonnes], distances_sortie[couches, colonnes]
+
+            # Garder la première collision d'une colonne sur "nombre_rayons", pour le rendu 2D
+            colonnes_2d = numpy.arange(0, surface.get_width(), ceil(surface.get_width() / max(1, min(self.nombre_rayons_camera(), surface.get_width()))))
+            distances_2d = raycasts.distances()[0, colonnes_2d]
+        self.__garder_rayons_2d(surface.get_width(), colonnes_2d.tolist(), distances_2d.tolist())
+
+        # Dessiner les couches
+        self.__rendu_3d_cases_tableau(surface, colonnes, distances_entree, distances_sortie, horizon_y)
 
-        return surface
-    
     # Supprime un objet dynamique
     def supprimer_objet_dynamique(self, objet_dynamique: Raycast_Objet_Dynamique) -> None:
         """Supprime un objet dynamique"""
@@ -1247,6 +2552,8 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
     def texture_bas_rendu_3D(self, longueur_jeu: int, hauteur_horizon: int) -> pygame.Surface:
         """Retourne la texture en bas d'un rendu 3D
 
+        La texture est une partie d'une surface gardée entre les frames, recréée seulement si elle est trop petite.
+
         Argument:
             longueur_jeu (int): longueur de l'écran de jeu en pixel
             hauteur_horizon (int): hauteur de l'horizon de jeu en pixel
@@ -1255,21 +2562,38 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
             pygame.Surface: texture en bas d'un rendu 3D
         """
 
-        # Créer la texture
-        longueur_jeu = longueur_jeu
-        texture = pygame.Surface((longueur_jeu, hauteur_horizon))
-        texture.fill((0, 0, 255))
+        # Créer la texture de la caméra si nécessaire
+        tampons = self.camera().tampons_rendu()
+        if tampons.texture_bas() == 0 or tampons.texture_bas().get_width() != longueur_jeu or tampons.texture_bas().get_height() < hauteur_horizon:
+            tampons.set_texture_bas(pygame.Surface((longueur_jeu, hauteur_horizon)))
+            tampons.texture_bas().fill((0, 0, 255))
 
-        return texture
+        return tampons.texture_bas().subsurface((0, 0, longueur_jeu, hauteur_horizon))
 
     # Getters et setters
+    def cache_objets_dynamiques(self) -> Cache_LRU:
+        """Retourne le cache des textures d'objets dynamiques redimensionnées (32 Mo par défaut)
+
+        Returns:
+            Cache_LRU: cache des textures d'objets dynamiques redimensionnées
+        """
+        return self.__cache_objets_dynamiques
     def camera(self) -> Raycast_Camera:
-        """Retourne la caméra utilisée dans le moteur Raycast
+        """Retourne la caméra utilisée dans le moteur Raycast (celle de l'instantané dans le thread d'un rendu d'instantané)
 
         Returns:
             Raycast_Camera: caméra utilisée dans le moteur Raycast
         """
+        instantane = getattr(self.__instantane_rendu, "instantane", 0)
+        if instantane != 0: return instantane.camera()
         return self.__camera
+    def collisions_transparentes_maximum(self) -> int:
+        """Retourne le nombre maximum de cases transparentes touchées par un rayon avant son arrêt
+
+        Returns:
+            int: nombre maximum de cases transparentes touchées par un rayon avant son arrêt
+        """
+        return self.__collisions_transparentes_maximum
     def couleur_arriere_plan(self) -> tuple:
         """Retourne la couleur d'arrière plan d'un rendu 3D
 
@@ -1284,6 +2608,13 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
             int: hauteur de la map
         """
         return self.__hauteur_map
+    def hauteur_plafond(self) -> float:
+        """Retourne la hauteur du plafond texturé
+
+        Returns:
+            float: hauteur du plafond texturé
+        """
+        return self.__hauteur_plafond
     def largeur_map(self) -> int:
         """Retourne la largeur de la map
 
@@ -1291,10 +2622,141 @@ class Raycast_Moteur(Raycast_Moteur_Structure):
             int: largeur de la map
         """
         return self.__largeur_map
+    def mode_raycast(self) -> str:
+        """Retourne le mode de raycast utilisé pour le rendu 3D
+
+        Returns:
+            str: mode de raycast utilisé pour le rendu 3D ("classique" ou "lot")
+        """
+        return self.__mode_raycast
+    def nombre_processus(self) -> int:
+        """Retourne le nombre de processus qui se partagent les colonnes de l'écran pendant le raycast
+
+        Returns:
+            int: nombre de processus qui se partagent les colonnes de l'écran (0 pour tout faire dans ce processus)
+        """
+        return self.__nombre_processus
+    def nombre_rayons(self) -> int:
+        """Retourne le nombre de rayons utilisés pour le rendu 3D en mode classique, par les caméras qui n'ont pas le leur
+
+        Returns:
+            int: nombre de rayons utilisés pour le rendu 3D en mode classique
+        """
+        return self.__nombre_rayons
+    def nombre_rayons_camera(self) -> int:
+        """Retourne le nombre de rayons utilisés pour le rendu 3D de la caméra (celle de l'instantané dans le thread d'un rendu d'instantané)
+
+        Returns:
+            int: nombre de rayons de la caméra, ou celui du moteur si la caméra n'en a pas
+        """
+        nombre_rayons = self.camera().nombre_rayons()
+        if nombre_rayons > 0: return nombre_rayons
+        return self.__nombre_rayons
     def objets_dynamiques(self) -> list:
-        """Retourne la liste d'objets dynamiques
+        """Retourne la liste d'objets dynamiques (celle de l'instantané dans le thread d'un rendu d'instantané)
 
         Returns:
             list: liste d'objets dynamiques
         """
-        return self.__objets_dynamiques
\ No newline at end of file
+        instantane = getattr(self.__instantane_rendu, "instantane", 0)
+        if instantane != 0: return instantane.objets_dynamiques()
+        return self.__objets_dynamiques
+    def profondeur_maximum(self) -> int:
+        """Retourne le nombre maximum de collisions gardées par colonne de l'écran
+
+        Returns:
+            int: nombre maximum de collisions gardées par colonne de l'écran (0 pour ne pas avoir de limite)
+        """
+        return self.__profondeur_maximum
+    def set_collisions_transparentes_maximum(self, nouveau_maximum: int) -> None:
+        """Change le nombre maximum de cases transparentes touchées par un rayon avant son arrêt
+
+        Args:
+            nouveau_maximum (int): nouveau nombre maximum de cases transparentes touchées par un rayon avant son arrêt
+        """
+        self.__collisions_transparentes_maximum = nouveau_maximum
+    def set_hauteur_plafond(self, nouvelle_hauteur_plafond: float) -> None:
+        """Change la hauteur du plafond texturé
+
+        Args:
+            nouvelle_hauteur_plafond (float): nouvelle hauteur du plafond texturé (une hauteur élevée donne un ciel)
+        """
+        self.__hauteur_plafond = nouvelle_hauteur_plafond
+    def set_mode_raycast(self, nouveau_mode: str) -> None:
+        """Change le mode de raycast utilisé pour le rendu 3D
+
+        Le mode "classique" envoie quelques rayons pour trouver les cases visibles, puis projette ces cases entières.
+        Le mode "lot" envoie un rayon par colonne de l'écran, tous en même temps avec NumPy.
+        Le PVS (voir "calculer_pvs" et "charger_pvs") n'est utilisé qu'en mode "classique" sans processus, où il remplace les rayons :
+        en mode "lot", chaque rayon s'arrête déjà à la première case opaque, et le PVS n'apporterait rien.
+
+        Args:
+            nouveau_mode (str): nouveau mode de raycast ("classique" ou "lot")
+        """
+        if nouveau_mode == "lot" and numpy == 0:
+            print("MLib Raycast moteur : le mode de raycast \"lot\" nécessite NumPy, qui n'est pas installé.")
+            return
+        self.__mode_raycast = nouveau_mode
+    def set_nombre_processus(self, nouveau_nombre_processus: int) -> None:
+        """Change le nombre de processus qui se partagent les colonnes de l'écran pendant le raycast
+
+        Chaque processus trace une bande de colonnes de l'écran, en partageant la map et les collisions par mémoire partagée.
+
+        Args:
+            nouveau_nombre_processus (int): nouveau nombre de processus (0 pour tout faire dans ce processus)
+        """
+        if nouveau_nombre_processus > 0 and numpy == 0:
+            print("MLib Raycast moteur : le raycast dans plusieurs processus nécessite NumPy, qui n'est pas installé.")
+            return
+        if nouveau_nombre_processus <= 0 and self.__raycast_lot_processus != 0:
+            self.__raycast_lot_processus.fermer()
+            self.__raycast_lot_processus = 0
+        self.__nombre_processus = nouveau_nombre_processus
+    def set_nombre_rayons(self, nouveau_nombre_rayons: int) -> None:
+        """Change le nombre de rayons utilisés pour le rendu 3D en mode classique, par les caméras qui n'ont pas le leur
+
+        Args:
+            nouveau_nombre_rayons (int): nouveau nombre de rayons utilisés pour le rendu 3D en mode classique
+        """
+        self.__nombre_rayons = nouveau_nombre_rayons
+    def set_profondeur_maximum(self, nouvelle_profondeur_maximum: int) -> None:
+        """Change le nombre maximum de collisions gardées par colonne de l'écran
+
+        Seules les collisions les plus proches sont gardées, les autres ne sont pas dessinées.
+
+        Args:
+            nouvelle_profondeur_maximum (int): nouveau nombre maximum de collisions gardées par colonne de l'écran (0 pour ne pas avoir de limite)
+        """
+        self.__profondeur_maximum = nouvelle_profondeur_maximum
+    def set_texture_plafond_par_nom(self, nom_texture: str) -> None:
+        """Change la texture du plafond par une texture d'un certain nom
+
+        Le plafond texturé nécessite NumPy.
+
+        Args:
+            nom_texture (str): nom de la nouvelle texture du plafond (ou "" pour ne pas avoir de plafond)
+        """
+        self.__texture_plafond = self.structure_plus().texture_nom(nom_texture)
+    def set_texture_sol_par_nom(self, nom_texture: str) -> None:
+        """Change la texture du sol par une texture d'un certain nom
+
+        Le sol texturé nécessite NumPy, sinon le sol reste uni.
+
+        Args:
+            nom_texture (str): nom de la nouvelle texture du sol (ou "" pour un sol uni)
+        """
+        self.__texture_sol = self.structure_plus().texture_nom(nom_texture)
+    def texture_plafond(self) -> Texture:
+        """Retourne la texture du plafond
+
+        Returns:
+            Texture: texture du plafond (ou 0 s'il n'y a pas de plafond)
+        """
+        return self.__texture_plafond
+    def texture_sol(self) -> Texture:
+        """Retourne la texture du sol
+
+        Returns:
+            Texture: texture du sol (ou 0 pour un sol uni)
+        """
+        return self.__texture_sol
\ No newline at end of file
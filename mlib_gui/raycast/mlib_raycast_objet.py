@@ -92,7 +92,7 @@ class Raycast_Moteur_Structure:
         """
 
         # Définition des attributs
-        self.__materiaux = []
+        self.__materiaux = {}
         self.__structure_plus = structure_plus
     
     # Retourne un matériel dans le moteur par l'id
@@ -105,12 +105,7 @@ class Raycast_Moteur_Structure:
         Returns:
             Raycast_Materiel: matériel recherché (ou 0 si il n'existe pas)
         """
-
-        # Naviguer parmi les matériaux
-        for materiel in self.__materiaux:
-            if materiel.id() == id:
-                return materiel
-        return 0
+        return self.__materiaux.get(id, 0)
     # Crée et retourne un nouveau matériel
     def nouveau_materiel(self, id: int) -> Raycast_Materiel:
         """Crée et retourne un nouveau matériel
@@ -125,7 +120,7 @@ class Raycast_Moteur_Structure:
         if self.materiel_par_id(id) == 0:
             # Créer le matériel
             nouveau_materiel = Raycast_Materiel(id)
-            self.__materiaux.append(nouveau_materiel)
+            self.__materiaux[id] = nouveau_materiel
             return nouveau_materiel
         else :
             print("MLib Raycast moteur : le matériel d'id \"" + str(id) + "\" que vous essayez de créer existe déjà.")
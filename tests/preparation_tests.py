@@ -0,0 +1,45 @@
+#******************
+#
+# preparation_tests.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier prépare l'import de MLib pour les tests, sans affichage.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import os
+import sys
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+dossier_mlib = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for dossier in ("", "mlib_gui", "mlib_gui/raycast", "mlib_math"): sys.path.append(os.path.join(dossier_mlib, dossier))
+from mlib import *
+
+def texte_map_bordee(largeur: int, hauteur: int, cases_pleines: set = set()) -> str:
+    """Retourne le texte d'une map entourée de murs
+
+    Args:
+        largeur (int): largeur de la map
+        hauteur (int): hauteur de la map
+        cases_pleines (set, optional): cases (x, y) pleines en plus des bords. Defaults to set().
+
+    Returns:
+        str: texte de la map, pour "generer_map_depuis_texte"
+    """
+    lignes = []
+    for y in range(hauteur):
+        lignes.append("_".join("1" if x in (0, largeur - 1) or y in (0, hauteur - 1) or (x, y) in cases_pleines else "0" for x in range(largeur)))
+    return str(largeur) + ";" + str(hauteur) + ";0;0;" + "-".join(lignes)
@@ -0,0 +1,114 @@
+#******************
+#
+# test_fenetre.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste que la fenêtre ne redessine que les zones des enfants modifiés, et son mode sans affichage.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import unittest
+from preparation_tests import *
+
+#******************
+#
+# Les tests des zones redessinées
+#
+#******************
+
+class Test_Fenetre_Zones(unittest.TestCase):
+    """Marque l'écran hors des enfants modifiés, et vérifie que "maj_rendu" n'y touche pas"""
+
+    # Prépare la fenêtre et ses enfants
+    def setUp(self) -> None:
+        """Prépare une fenêtre sans affichage avec deux enfants colorés"""
+        self.fenetre = Fenetre(200, 100, True)
+        self.gauche = self.fenetre.nouvel_enfant("gauche", "", 10, 10, 40, 40)
+        self.gauche.set_couleur_arriere_plan((255, 0, 0, 255))
+        self.droite = self.fenetre.nouvel_enfant("droite", "", 120, 10, 40, 40)
+        self.droite.set_couleur_arriere_plan((0, 0, 255, 255))
+        self.fenetre.maj_rendu()
+        self.ecran = self.fenetre.ecran()
+
+        # Marquer des pixels que seul un rendu complet effacerait
+        self.ecran.set_at((130, 20), (0, 255, 0))
+        self.ecran.set_at((190, 90), (0, 255, 0))
+
+    def test_rien_a_redessiner(self) -> None:
+        """Vérifie que rien n'est redessiné sans modification"""
+        self.fenetre.maj_rendu()
+        self.assertEqual(self.ecran.get_at((130, 20))[:3], (0, 255, 0))
+        self.assertEqual(self.ecran.get_at((190, 90))[:3], (0, 255, 0))
+
+    def test_enfant_modifie(self) -> None:
+        """Vérifie que seule la zone d'un enfant modifié est redessinée"""
+        self.gauche.set_couleur_arriere_plan((255, 255, 0, 255))
+        self.fenetre.maj_rendu()
+        self.assertEqual(self.ecran.get_at((20, 20))[:3], (255, 255, 0))
+        self.assertEqual(self.ecran.get_at((130, 20))[:3], (0, 255, 0))
+        self.assertEqual(self.ecran.get_at((190, 90))[:3], (0, 255, 0))
+
+    def test_enfant_deplace(self) -> None:
+        """Vérifie que l'ancienne et la nouvelle position d'un enfant déplacé sont redessinées"""
+        self.droite.set_x(140)
+        self.fenetre.maj_rendu()
+        self.assertEqual(self.ecran.get_at((125, 20))[:3], (255, 255, 255))
+        self.assertEqual(self.ecran.get_at((130, 20))[:3], (255, 255, 255))
+        self.assertEqual(self.ecran.get_at((170, 20))[:3], (0, 0, 255))
+        self.assertEqual(self.ecran.get_at((190, 90))[:3], (0, 255, 0))
+
+#******************
+#
+# Les tests du mode sans affichage
+#
+#******************
+
+class Test_Fenetre_Sans_Affichage(unittest.TestCase):
+    """Vérifie l'image NumPy et les touches simulées d'une fenêtre sans affichage"""
+
+    def test_image_numpy(self) -> None:
+        """Vérifie que "image_numpy" contient l'écran après "maj_rendu", de forme (hauteur, largeur, 3)"""
+        if numpy == 0: self.skipTest("l'image NumPy nécessite NumPy")
+        fenetre = Fenetre(200, 100, True)
+        enfant = fenetre.nouvel_enfant("enfant", "", 10, 20, 40, 30)
+        enfant.set_couleur_arriere_plan((255, 0, 0, 255))
+        fenetre.maj_rendu()
+        image = fenetre.image_numpy()
+        self.assertEqual(image.shape, (100, 200, 3))
+        self.assertTrue(numpy.array_equal(image, pygame.surfarray.array3d(fenetre.ecran()).transpose(1, 0, 2)))
+        self.assertEqual(tuple(image[20, 10]), (255, 0, 0))
+        self.assertEqual(tuple(image[10, 20]), (255, 255, 255))
+
+        # L'image suit les rendus suivants
+        enfant.set_couleur_arriere_plan((0, 0, 255, 255))
+        fenetre.maj_rendu()
+        self.assertEqual(tuple(image[20, 10]), (0, 0, 255))
+        self.assertTrue(numpy.array_equal(fenetre.image_numpy(), pygame.surfarray.array3d(fenetre.ecran()).transpose(1, 0, 2)))
+
+    def test_injecter_touche(self) -> None:
+        """Vérifie qu'une touche simulée est pressée jusqu'à son relâchement, même après la gestion des évènements"""
+        fenetre = Fenetre(200, 100, True)
+        self.assertFalse(fenetre.touche_pressee("z"))
+        fenetre.injecter_touche("z")
+        fenetre.maj_evenements()
+        self.assertTrue(fenetre.touche_pressee("z"))
+        self.assertFalse(fenetre.touche_pressee("q"))
+        fenetre.injecter_touche("z", False)
+        self.assertFalse(fenetre.touche_pressee("z"))
+
+if __name__ == "__main__":
+    unittest.main()
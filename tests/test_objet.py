@@ -0,0 +1,229 @@
+#******************
+#
+# test_objet.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste que la surface gardée d'un objet n'est recalculée que lorsqu'un setter change vraiment une valeur, et les caches des polices, des textes et des rotations des textures.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import unittest
+from preparation_tests import *
+
+#******************
+#
+# Les tests de la surface gardée des objets
+#
+#******************
+
+class Objet_Compteur(Objet):
+    """Objet qui compte ses rendus"""
+
+    def __init__(self, structure_plus: Structure_Plus, nom: str) -> None:
+        """Constructeur de "Objet_Compteur"
+
+        Args:
+            structure_plus (Structure_Plus): structure plus dans le software
+            nom (str): nom de l'objet
+        """
+        super().__init__(structure_plus, nom, 0, 0, 40, 30)
+        self.nombre_rendus = 0
+
+    def rendu(self, surface_objet: pygame.Surface) -> None:
+        """Compte le rendu, puis l'applique
+
+        Args:
+            surface_objet (pygame.Surface): Surface de l'objet
+        """
+        self.nombre_rendus += 1
+        super().rendu(surface_objet)
+
+class Test_Objet_Surface(unittest.TestCase):
+    """Vérifie quand la surface gardée d'un objet est recalculée"""
+
+    # Prépare l'objet et l'écran
+    def setUp(self) -> None:
+        """Prépare un objet qui compte ses rendus, et une surface où l'afficher"""
+        self.fenetre = Fenetre(100, 80, True)
+        self.objet = Objet_Compteur(self.fenetre, "objet")
+        self.ecran = pygame.Surface((100, 80))
+        self.ecran.fill((255, 255, 255))
+
+    # Affiche l'objet et retourne si son rendu a été recalculé
+    def recalcule(self) -> bool:
+        """Affiche l'objet sur l'écran
+
+        Returns:
+            bool: si le rendu de l'objet a été recalculé
+        """
+        nombre_rendus = self.objet.nombre_rendus
+        self.objet.maj_rendu(self.ecran)
+        return self.objet.nombre_rendus != nombre_rendus
+
+    def test_setters(self) -> None:
+        """Vérifie que seul un setter qui change une valeur utilisée par le rendu invalide la surface"""
+        self.assertTrue(self.recalcule())
+        self.assertFalse(self.recalcule())
+
+        # Les mêmes valeurs n'invalident pas la surface
+        self.objet.set_couleur_arriere_plan((255, 255, 255, 0))
+        self.objet.set_bordure_couleur(self.objet.bordure_couleur())
+        self.objet.set_bordure_largeur(self.objet.bordure_largeur())
+        self.objet.set_largeur(40)
+        self.objet.set_hauteur(30)
+        self.assertFalse(self.recalcule())
+
+        # Une nouvelle valeur invalide la surface, une seule fois
+        self.objet.set_couleur_arriere_plan((10, 20, 30, 255))
+        self.assertTrue(self.recalcule())
+        self.assertFalse(self.recalcule())
+        self.assertEqual(self.ecran.get_at((5, 5))[:3], (10, 20, 30))
+        self.objet.set_bordure_largeur_entier(2)
+        self.assertTrue(self.recalcule())
+        self.objet.set_largeur(50)
+        self.assertTrue(self.recalcule())
+
+        # Déplacer l'objet le redessine, sans recalculer sa surface
+        self.objet.set_a_redessiner(False)
+        self.objet.set_x(10)
+        self.assertTrue(self.objet.a_redessiner())
+        self.assertFalse(self.recalcule())
+
+    def test_cache_desactive(self) -> None:
+        """Vérifie que la surface est recalculée à chaque frame sans le cache de surface"""
+        self.objet.set_cache_surface(False)
+        self.assertTrue(self.recalcule())
+        self.assertTrue(self.recalcule())
+
+    def test_texte(self) -> None:
+        """Vérifie que la surface d'un texte n'est recalculée qu'à un changement de texte"""
+        texte = Texte(self.fenetre, "texte", 0, 0, 80, 30)
+        texte.set_police_taille(20)
+        texte.set_texte("abc")
+        texte.maj_rendu(self.ecran)
+        texte.set_a_redessiner(False)
+        surface = pygame.image.tobytes(self.ecran, "RGB")
+        texte.set_texte("abc")
+        self.assertFalse(texte.a_redessiner())
+        texte.set_texte("abd")
+        self.assertTrue(texte.a_redessiner())
+        texte.maj_rendu(self.ecran)
+        self.assertTrue(pygame.image.tobytes(self.ecran, "RGB") != surface)
+
+    def test_texture_rotation(self) -> None:
+        """Vérifie que la surface n'est recalculée que si la rotation arrondie de la texture change"""
+        self.fenetre.charger_texture_chemin_acces("ball", os.path.join(dossier_mlib, "assets/ball.png"))
+        self.objet.set_arriere_plan_texture_par_nom("ball")
+        self.objet.set_texture_rotation(10.2)
+        self.assertTrue(self.recalcule())
+        self.objet.set_texture_rotation(10.4)
+        self.assertFalse(self.recalcule())
+        self.objet.set_texture_rotation(10.6)
+        self.assertTrue(self.recalcule())
+
+#******************
+#
+# Les tests des caches des polices et des textes
+#
+#******************
+
+class Test_Texte_Cache(unittest.TestCase):
+    """Vérifie que les textes partagent leurs polices et les rendus de leurs textes"""
+
+    # Prépare la fenêtre et l'écran
+    def setUp(self) -> None:
+        """Prépare une fenêtre, et une surface où afficher les textes"""
+        self.fenetre = Fenetre(100, 80, True)
+        self.ecran = pygame.Surface((100, 80))
+
+    # Crée et affiche un texte
+    def texte(self, nom: str, texte: str) -> Texte:
+        """Crée un texte de taille 23, et l'affiche sur l'écran
+
+        Args:
+            nom (str): nom du texte
+            texte (str): texte affiché
+
+        Returns:
+            Texte: texte créé
+        """
+        objet = Texte(self.fenetre, nom, 0, 0, 80, 30)
+        objet.set_police_taille(23)
+        objet.set_texte(texte)
+        objet.maj_rendu(self.ecran)
+        return objet
+
+    def test_police_partagee(self) -> None:
+        """Vérifie que deux textes avec la même police utilisent un seul objet police"""
+        self.texte("premier", "abc")
+        cle = (pygame.font.match_font(pygame.font.get_default_font()), 23)
+        police = cache_polices.element(cle)
+        self.assertNotEqual(police, 0)
+        nombre_polices = cache_polices.nombre_elements()
+        self.texte("second", "xyz")
+        self.assertEqual(cache_polices.nombre_elements(), nombre_polices)
+        self.assertIs(cache_polices.element(cle), police)
+        self.assertIs(self.fenetre.police(pygame.font.get_default_font(), 23), police)
+
+    def test_cache_textes(self) -> None:
+        """Vérifie qu'un texte déjà rendu revient depuis le cache des textes"""
+        surface = self.fenetre.rendu_texte(pygame.font.get_default_font(), 23, "abc", (0, 0, 0))
+        self.assertIs(self.fenetre.rendu_texte(pygame.font.get_default_font(), 23, "abc", (0, 0, 0)), surface)
+        self.assertIsNot(self.fenetre.rendu_texte(pygame.font.get_default_font(), 23, "abc", (255, 0, 0)), surface)
+
+        # Un texte qui revient à une chaîne déjà rendue ne la rend pas à nouveau
+        texte = self.texte("texte", "abc")
+        nombre_textes = self.fenetre.cache_textes().nombre_elements()
+        texte.set_texte("abd")
+        texte.maj_rendu(self.ecran)
+        self.assertEqual(self.fenetre.cache_textes().nombre_elements(), nombre_textes + 1)
+        texte.set_texte("abc")
+        texte.maj_rendu(self.ecran)
+        self.assertEqual(self.fenetre.cache_textes().nombre_elements(), nombre_textes + 1)
+
+#******************
+#
+# Les tests du cache des rotations des textures
+#
+#******************
+
+class Test_Texture_Rotation(unittest.TestCase):
+    """Vérifie que les rotations d'une texture sont arrondies et gardées dans son cache"""
+
+    def test_surface_tournee(self) -> None:
+        """Vérifie que des rotations arrondies au même pas partagent une surface, et qu'un pas de 0 n'utilise pas le cache"""
+        self.fenetre = Fenetre(100, 80, True)
+        texture = self.fenetre.charger_texture_chemin_acces("ball", os.path.join(dossier_mlib, "assets/ball.png"))
+        self.assertIs(texture.surface_tournee(0.3), texture.surface())
+        surface = texture.surface_tournee(9.8)
+        self.assertIs(texture.surface_tournee(10.2), surface)
+        self.assertIs(texture.surface_tournee(370.1), surface)
+        self.assertIsNot(texture.surface_tournee(10.6), surface)
+        self.assertEqual(texture.cache_rotations().nombre_elements(), 2)
+
+        # Un plus grand pas arrondit plus de rotations ensemble
+        texture.set_pas_rotation(15)
+        self.assertEqual(texture.cache_rotations().nombre_elements(), 0)
+        self.assertIs(texture.surface_tournee(10), texture.surface_tournee(20))
+
+        # Sans pas, chaque rotation est calculée à nouveau
+        texture.set_pas_rotation(0)
+        self.assertIsNot(texture.surface_tournee(10.2), texture.surface_tournee(10.2))
+        self.assertEqual(texture.cache_rotations().nombre_elements(), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#******************
+#
+# test_raycast_blocs.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste que les rayons qui sautent les blocs vides de la map touchent les mêmes cases qu'un DDA case par case.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import random
+import unittest
+from preparation_tests import *
+
+#******************
+#
+# Les tests des blocs vides
+#
+#******************
+
+class Test_Raycast_Blocs(unittest.TestCase):
+    """Compare les collisions des rayons avec la pyramide des blocs vides, et sans (DDA case par case)"""
+
+    def collisions(self, moteur: Raycast_Moteur, poses: list) -> list:
+        """Retourne les collisions de chaque rayon, pour chaque pose de caméra
+
+        Args:
+            moteur (Raycast_Moteur): moteur utilisé
+            poses (list): poses (x, y, rotation y) de la caméra
+
+        Returns:
+            list: cases touchées et distances de chaque rayon
+        """
+        resultat = []
+        for x, y, rotation_y in poses:
+            camera = moteur.camera()
+            camera.set_x(x)
+            camera.set_y(y)
+            camera.set_rotation_y(rotation_y)
+            raycasts = moteur.raycast_entier(64, 0, 64)
+            cases, distances = raycasts.tampon().cases(), raycasts.tampon().distances()
+            resultat.append([[(cases[i].x(), cases[i].y(), distances[i]) for i in rayon.indices_collisions()] for rayon in raycasts.rayons()])
+        return resultat
+
+    def test_blocs_comme_dda(self) -> None:
+        """Vérifie que sauter les blocs vides ne change aucune collision, même après des modifications de la map"""
+        fenetre = Fenetre(64, 48, True)
+        moteur = fenetre.nouveau_raycast()
+        moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+
+        # Map de 64 * 48 cases presque vide (de grands blocs vides), avec des murets bas que les rayons traversent
+        aleatoire = random.Random(3)
+        moteur.generer_map_depuis_texte(texte_map_bordee(64, 48, set((aleatoire.randrange(1, 63), aleatoire.randrange(1, 47)) for i in range(30))))
+        for i in range(30): moteur.modifier_case(aleatoire.randrange(1, 63), aleatoire.randrange(1, 47), 1, 0.25)
+        moteur.modifier_case(10, 10, 0)
+        moteur.camera().set_z(0.5)
+        moteur.camera().set_largeur_ecran(64)
+        poses = [(aleatoire.uniform(1.1, 62.9), aleatoire.uniform(1.1, 46.9), aleatoire.uniform(0, 2 * pi)) for i in range(20)]
+        poses += [(32.5, 24.5, 0), (32.5, 24.5, pi / 2), (20.25, 30.75, pi / 4)]
+
+        avec_blocs = self.collisions(moteur, poses)
+        moteur._Raycast_Moteur__map_blocs = []
+        sans_blocs = self.collisions(moteur, poses)
+        self.assertEqual(avec_blocs, sans_blocs)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#******************
+#
+# test_raycast_brouillard.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste la distance maximum de rendu des caméras, et le brouillard qui y mène.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import unittest
+from preparation_tests import *
+
+#******************
+#
+# Les tests de la distance maximum et du brouillard
+#
+#******************
+
+class Test_Raycast_Brouillard(unittest.TestCase):
+    """Regarde un pilier à 4.5 cases de la caméra, avec différentes distances maximum et avec ou sans brouillard"""
+
+    # Prépare le moteur et sa caméra
+    def setUp(self) -> None:
+        """Prépare un moteur de raycast avec un pilier rouge devant la caméra"""
+        self.fenetre = Fenetre(100, 100, True)
+        self.moteur = self.fenetre.nouveau_raycast()
+        self.moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+        self.moteur.generer_map_depuis_texte(texte_map_bordee(12, 12, {(6, 5)}))
+        self.moteur.set_nombre_rayons(100)
+        self.camera = self.moteur.camera()
+        self.camera.set_x(1.5)
+        self.camera.set_y(5.5)
+        self.camera.set_z(0.5)
+        self.camera.set_rotation_y(0)
+        self.camera.set_largeur_ecran(100)
+
+    # Retourne les couleurs de la colonne au centre du rendu
+    def colonne_centre(self, distance_maximum: float, brouillard: bool) -> list:
+        """Retourne les couleurs de la colonne au centre du rendu 3D
+
+        Args:
+            distance_maximum (float): distance maximum de la caméra
+            brouillard (bool): si le brouillard est utilisé
+
+        Returns:
+            list: couleur (r, g, b) de chaque pixel de la colonne
+        """
+        self.camera.set_distance_maximum(distance_maximum)
+        self.camera.set_brouillard(brouillard)
+        self.camera.set_distance_brouillard(0)
+        surface = self.moteur.rendu_3d()
+        return [tuple(surface.get_at((50, y))[:3]) for y in range(surface.get_height())]
+
+    def comparer(self, mode_raycast: str) -> None:
+        """Vérifie qu'un mur au delà de la distance maximum n'est pas dessiné, et que le brouillard atteint la couleur d'arrière plan à cette distance
+
+        Args:
+            mode_raycast (str): mode de raycast testé
+        """
+        self.moteur.set_mode_raycast(mode_raycast)
+        arriere_plan = self.moteur.couleur_arriere_plan()
+        self.assertIn((180, 0, 0), self.colonne_centre(0, False))
+        self.assertIn((180, 0, 0), self.colonne_centre(6, False))
+
+        # Le pilier, et les bords de la map derrière lui, sont au delà de la distance maximum
+        colonne = self.colonne_centre(4, False)
+        self.assertNotIn((180, 0, 0), colonne)
+        self.assertEqual(colonne[45], arriere_plan)
+
+        # Le pilier, juste avant la distance maximum, a presque la couleur d'arrière plan avec le brouillard
+        self.assertEqual(self.colonne_centre(4.55, False)[45], (180, 0, 0))
+        couleur = self.colonne_centre(4.55, True)[45]
+        for composante, composante_arriere_plan in zip(couleur, arriere_plan): self.assertLessEqual(abs(composante - composante_arriere_plan), 2)
+
+        # A mi-distance, le pilier est à moitié mélangé avec la couleur d'arrière plan
+        couleur = self.colonne_centre(9.06, True)[45]
+        for composante, composante_mur, composante_arriere_plan in zip(couleur, (180, 0, 0), arriere_plan): self.assertLessEqual(abs(composante - (composante_mur + composante_arriere_plan) / 2), 2)
+
+    def test_facteur_brouillard(self) -> None:
+        """Vérifie que le brouillard augmente linéairement entre sa distance de début et la distance maximum"""
+        self.camera.set_distance_maximum(10)
+        self.camera.set_distance_brouillard(4)
+        self.assertEqual(self.camera.facteur_brouillard(7), 0)
+        self.camera.set_brouillard(True)
+        self.assertEqual(self.camera.facteur_brouillard(3), 0)
+        self.assertAlmostEqual(self.camera.facteur_brouillard(7), 0.5)
+        self.assertEqual(self.camera.facteur_brouillard(10), 1)
+        self.assertEqual(self.camera.facteur_brouillard(50), 1)
+
+    def test_brouillard_classique(self) -> None:
+        """Teste la distance maximum et le brouillard en mode classique"""
+        self.comparer("classique")
+
+    def test_brouillard_lot(self) -> None:
+        """Teste la distance maximum et le brouillard en mode par lot"""
+        if numpy == 0: self.skipTest("le mode par lot nécessite NumPy")
+        self.comparer("lot")
+
+if __name__ == "__main__":
+    unittest.main()
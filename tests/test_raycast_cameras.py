@@ -0,0 +1,144 @@
+#******************
+#
+# test_raycast_cameras.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste le rendu de plusieurs caméras d'un même moteur, chacune dans ses propres tampons.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import concurrent.futures
+import unittest
+from preparation_tests import *
+
+#******************
+#
+# Les tests des caméras multiples
+#
+#******************
+
+class Test_Raycast_Cameras(unittest.TestCase):
+    """Rend deux caméras d'un même moteur, et compare chaque image au rendu de la caméra principale à la même pose"""
+
+    # Prépare le moteur et les poses
+    def setUp(self) -> None:
+        """Prépare un moteur de raycast avec quelques piliers et une seconde caméra"""
+        self.fenetre = Fenetre(120, 80, True)
+        self.moteur = self.fenetre.nouveau_raycast()
+        self.moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+        self.moteur.generer_map_depuis_texte(texte_map_bordee(12, 12, {(3, 3), (8, 4), (5, 8)}))
+        self.moteur.set_nombre_rayons(120)
+        self.poses = [(2.5, 6.5, 0.3), (9.5, 9.5, 3.6)]
+        self.camera = self.moteur.nouvelle_camera(120)
+        self.placer(self.moteur.camera(), self.poses[0])
+        self.placer(self.camera, self.poses[1])
+
+    # Place une caméra à une pose
+    def placer(self, camera: Raycast_Camera, pose: tuple) -> None:
+        """Place une caméra à une pose
+
+        Args:
+            camera (Raycast_Camera): caméra à placer
+            pose (tuple): pose (x, y, rotation y) de la caméra
+        """
+        camera.set_x(pose[0])
+        camera.set_y(pose[1])
+        camera.set_z(0.5)
+        camera.set_rotation_y(pose[2])
+        camera.set_largeur_ecran(120)
+
+    # Retourne les rendus de référence
+    def references(self) -> list:
+        """Retourne le rendu de chaque pose avec une caméra principale seule, dans un autre moteur
+
+        Returns:
+            list: pixels du rendu de chaque pose
+        """
+        moteur = self.fenetre.nouveau_raycast()
+        moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+        moteur.generer_map_depuis_texte(texte_map_bordee(12, 12, {(3, 3), (8, 4), (5, 8)}))
+        moteur.set_nombre_rayons(120)
+        images = []
+        for pose in self.poses:
+            self.placer(moteur.camera(), pose)
+            images.append(pygame.image.tobytes(moteur.rendu_3d(), "RGB"))
+        return images
+
+    def comparer(self, mode_raycast: str) -> None:
+        """Vérifie que chaque caméra est rendue dans ses propres tampons, comme si elle était seule
+
+        Args:
+            mode_raycast (str): mode de raycast testé
+        """
+        self.moteur.set_mode_raycast(mode_raycast)
+        references = self.references()
+        self.assertTrue(references[0] != references[1])
+        self.assertIsNot(self.moteur.camera().tampons_rendu(), self.camera.tampons_rendu())
+
+        # Le rendu de la seconde caméra ne modifie pas celui de la caméra principale
+        principale = self.moteur.rendu_3d()
+        image_principale = pygame.image.tobytes(principale, "RGB")
+        seconde = self.moteur.rendu_3d_camera(self.camera)
+        self.assertIsNot(principale, seconde)
+        self.assertEqual(pygame.image.tobytes(principale, "RGB"), image_principale)
+        self.assertEqual(image_principale, references[0])
+        self.assertEqual(pygame.image.tobytes(seconde, "RGB"), references[1])
+
+        # Les deux caméras peuvent être rendues en même temps
+        with concurrent.futures.ThreadPoolExecutor(2) as executeur:
+            taches = [executeur.submit(self.moteur.rendu_3d_camera, camera) for camera in (0, self.camera)]
+            images = [pygame.image.tobytes(tache.result(), "RGB") for tache in taches]
+        self.assertEqual(images, references)
+
+    def test_cameras_classique(self) -> None:
+        """Rend deux caméras en mode classique"""
+        self.comparer("classique")
+
+    def test_cameras_lot(self) -> None:
+        """Rend deux caméras en mode par lot"""
+        if numpy == 0: self.skipTest("le mode par lot nécessite NumPy")
+        self.comparer("lot")
+
+    def test_resolution_dynamique_deux_vues(self) -> None:
+        """Vérifie que la résolution dynamique d'une vue ne change ni la largeur ni le nombre de rayons de l'autre vue du même moteur"""
+        references = self.references()
+        vue_lente = self.fenetre.nouvel_enfant("vue_lente", "raycast", 0, 0, 60, 80)
+        vue_lente.set_raycast_moteur(self.moteur)
+        vue_lente.set_budget_frame(1 / 60.0)
+        vue = self.fenetre.nouvel_enfant("vue", "raycast", 60, 0, 60, 80)
+        vue.set_raycast_moteur(self.moteur)
+        vue.set_camera(self.camera)
+        for i in range(10):
+            self.fenetre.set_delta_time(0.1)
+            self.fenetre.maj_rendu()
+
+        # Seule la caméra de la vue lente a baissé sa résolution
+        self.assertEqual(self.moteur.camera().largeur_ecran(), 96)
+        self.assertEqual(self.moteur.camera().nombre_rayons(), 96)
+        self.assertEqual(self.moteur.nombre_rayons(), 120)
+        self.assertEqual(self.camera.largeur_ecran(), 120)
+        self.assertEqual(self.camera.nombre_rayons(), 0)
+        self.assertEqual(pygame.image.tobytes(self.moteur.rendu_3d_camera(self.camera), "RGB"), references[1])
+
+        # Revenir à la résolution d'avant
+        vue_lente.set_budget_frame(0)
+        self.assertEqual(self.moteur.camera().largeur_ecran(), 120)
+        self.assertEqual(self.moteur.camera().nombre_rayons(), 0)
+        self.assertEqual(pygame.image.tobytes(self.moteur.rendu_3d(), "RGB"), references[0])
+
+if __name__ == "__main__":
+    unittest.main()
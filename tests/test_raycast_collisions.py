@@ -0,0 +1,76 @@
+#******************
+#
+# test_raycast_collisions.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste le tampon des collisions, réutilisé d'un raycast à l'autre.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import unittest
+from preparation_tests import *
+
+#******************
+#
+# Les tests du tampon des collisions
+#
+#******************
+
+class Test_Raycast_Tampon_Collisions(unittest.TestCase):
+    """Vérifie que le tampon des collisions s'agrandit et se réutilise sans perdre de données"""
+
+    def test_agrandissement(self) -> None:
+        """Vérifie que les collisions ajoutées au delà de la capacité sont gardées"""
+        tampon = Raycast_Tampon_Collisions(4)
+        for i in range(10): self.assertEqual(tampon.ajouter(0, 0, i, i, 0, i * 2.0, i + 1, 0, i * 2.0 + 1, 0.5), i)
+        self.assertEqual(tampon.nombre_collisions(), 10)
+        self.assertGreaterEqual(tampon.capacite(), 10)
+        self.assertEqual(list(tampon.distances()[:10]), [i * 2.0 for i in range(10)])
+        self.assertEqual(list(tampon.offsets_x()[:10]), list(range(10)))
+
+        # Vider le tampon garde ses tableaux
+        capacite = tampon.capacite()
+        tampon.vider()
+        self.assertEqual(tampon.nombre_collisions(), 0)
+        self.assertEqual(tampon.capacite(), capacite)
+        self.assertEqual(tampon.ajouter(0, 0, 0, 0, 0, 1, 0, 0, -1, 0), 0)
+
+    def test_reutilisation_entre_raycasts(self) -> None:
+        """Vérifie que deux raycasts de la même caméra utilisent le même tampon, et que les collisions lues le décrivent"""
+        fenetre = Fenetre(80, 60, True)
+        moteur = fenetre.nouveau_raycast()
+        moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+        moteur.generer_map_depuis_texte(texte_map_bordee(8, 8))
+        camera = moteur.camera()
+        camera.set_x(4.5)
+        camera.set_y(4.5)
+        camera.set_largeur_ecran(80)
+
+        premier = moteur.raycast_entier(80, 0, 80)
+        nombre_collisions = premier.tampon().nombre_collisions()
+        second = moteur.raycast_entier(80, 0, 80)
+        self.assertIs(premier.tampon(), second.tampon())
+        self.assertEqual(second.tampon().nombre_collisions(), nombre_collisions)
+
+        # Chaque colonne touche un mur du bord, vu au travers d'une vue sur le tampon
+        for rayon in second.rayons():
+            collision = rayon.collisions()[0]
+            self.assertIn(collision.case_touchee().x(), range(8))
+            self.assertEqual(collision.entree_distance(), second.tampon().distances()[collision.indice()])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#******************
+#
+# test_raycast_hors_ligne.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste le rendu 3D hors ligne, dans des processus sans fenêtre.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import unittest
+from preparation_tests import *
+
+# Map de 8 * 8 cases, entourée de murs
+texte_map = texte_map_bordee(8, 8)
+
+# Poses de caméra testées, qui regardent vers le sol
+poses = [(1.5 + i * 0.7, 2.5 + i * 0.3, 0.5, -0.4, i * 0.8) for i in range(6)]
+
+def preparer(moteur: Raycast_Moteur) -> None:
+    """Prépare un moteur de raycast avec un sol texturé (au niveau du module, pour être envoyée aux processus)
+
+    Args:
+        moteur (Raycast_Moteur): moteur à préparer
+    """
+    moteur.structure_plus().charger_texture_chemin_acces("rafale", os.path.join(dossier_mlib, "assets/rafale.png"))
+    moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+    moteur.set_texture_sol_par_nom("rafale")
+    moteur.camera().set_largeur_ecran(120)
+    moteur.set_nombre_rayons(120)
+
+#******************
+#
+# Les tests du rendu hors ligne
+#
+#******************
+
+class Test_Raycast_Hors_Ligne(unittest.TestCase):
+    """Compare le rendu hors ligne d'un sol texturé avec le rendu du même moteur dans ce processus"""
+
+    # Effectue le rendu des poses dans ce processus
+    def rendus_serie(self) -> list:
+        """Effectue le rendu 3D de chaque pose dans ce processus
+
+        Returns:
+            list: image (hauteur, largeur, 3) de chaque pose
+        """
+        fenetre = Fenetre(120, 80, True)
+        moteur = fenetre.nouveau_raycast()
+        preparer(moteur)
+        moteur.generer_map_depuis_texte(texte_map)
+        images = []
+        for x, y, z, rotation_x, rotation_y in poses:
+            camera = moteur.camera()
+            camera.set_x(x)
+            camera.set_y(y)
+            camera.set_z(z)
+            camera.set_rotation_x(rotation_x)
+            camera.set_rotation_y(rotation_y)
+            surface = moteur.rendu_3d()
+            images.append(numpy.frombuffer(pygame.image.tobytes(surface, "RGB"), dtype=numpy.uint8).reshape(surface.get_height(), surface.get_width(), 3))
+        return images
+
+    def test_sol_texture(self) -> None:
+        """Vérifie que le sol texturé est rendu hors ligne, identique au rendu dans ce processus"""
+        if numpy == 0: self.skipTest("le rendu hors ligne en tableaux nécessite NumPy")
+        hors_ligne = Raycast_Hors_Ligne(preparer, texte_map, 2)
+        try: images = list(hors_ligne.rendu(poses))
+        finally: hors_ligne.fermer()
+        self.assertEqual(len(images), len(poses))
+
+        # La moitié basse de l'image (le sol) doit contenir la texture, et pas une couleur unie
+        self.assertGreater(len(numpy.unique(images[0][len(images[0]) // 2:].reshape(-1, 3), axis=0)), 4)
+        for image, image_serie in zip(images, self.rendus_serie()): self.assertTrue((image == image_serie).all())
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
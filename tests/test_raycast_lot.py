@@ -0,0 +1,108 @@
+#******************
+#
+# test_raycast_lot.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste que le raycast par lot (NumPy) trouve les mêmes murs que le raycast classique.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import random
+import unittest
+from multiprocessing import shared_memory
+from preparation_tests import *
+from mlib_raycast_lot import memoires_partagees_ouvertes, ouvrir_memoires_partagees
+
+#******************
+#
+# Les tests du raycast par lot
+#
+#******************
+
+class Test_Raycast_Lot(unittest.TestCase):
+    """Compare le premier mur touché par chaque colonne, en raycast par lot et en raycast classique"""
+
+    def test_premier_mur(self) -> None:
+        """Vérifie que le raycast par lot touche le même premier mur, à la même distance, que le raycast classique"""
+        if numpy == 0: self.skipTest("le raycast par lot nécessite NumPy")
+        fenetre = Fenetre(160, 100, True)
+        moteur = fenetre.nouveau_raycast()
+        moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+        aleatoire = random.Random(2)
+        cases_pleines = set((x, y) for y in range(24) for x in range(24) if aleatoire.random() < 0.1)
+        moteur.generer_map_depuis_texte(texte_map_bordee(24, 24, cases_pleines))
+
+        camera = moteur.camera()
+        camera.set_largeur_ecran(160)
+        camera.set_z(0.5)
+        for i in range(10):
+            camera.set_x(aleatoire.uniform(1.1, 22.9))
+            camera.set_y(aleatoire.uniform(1.1, 22.9))
+            camera.set_rotation_y(aleatoire.uniform(0, 2 * pi))
+            if moteur.case(floor(camera.x()), floor(camera.y())).contenu() != 0: continue
+            lot = moteur.raycast_lot(160)
+            raycasts = moteur.raycast_entier(160, 0, 160)
+            tampon = raycasts.tampon()
+            for colonne, rayon in enumerate(raycasts.rayons()):
+                indice = rayon.indices_collisions()[0]
+                self.assertAlmostEqual(float(lot.distances()[0, colonne]), tampon.distances()[indice])
+                self.assertEqual((int(lot.x_cases()[0, colonne]), int(lot.y_cases()[0, colonne])), (tampon.cases()[indice].x(), tampon.cases()[indice].y()))
+
+    def test_processus(self) -> None:
+        """Vérifie que le rendu par bandes dans plusieurs processus est le même que dans ce processus, après un changement de map et de largeur"""
+        if numpy == 0: self.skipTest("le raycast dans plusieurs processus nécessite NumPy")
+        fenetre = Fenetre(120, 80, True)
+        moteur = fenetre.nouveau_raycast()
+        moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+        moteur.generer_map_depuis_texte(texte_map_bordee(12, 12, {(3, 3), (8, 4), (5, 8)}))
+        moteur.set_mode_raycast("lot")
+        camera = moteur.camera()
+        camera.set_x(2.5)
+        camera.set_y(6.5)
+        camera.set_z(0.5)
+        camera.set_rotation_y(0.3)
+
+        # Comparer chaque rendu avec un rendu dans ce processus
+        try:
+            for largeur, case in ((120, (3, 3)), (96, (6, 6))):
+                camera.set_largeur_ecran(largeur)
+                moteur.modifier_case(case[0], case[1], 1)
+                moteur.set_nombre_processus(0)
+                attendu = pygame.image.tobytes(moteur.rendu_3d(), "RGB")
+                moteur.set_nombre_processus(2)
+                self.assertEqual(pygame.image.tobytes(moteur.rendu_3d(), "RGB"), attendu)
+        finally:
+            moteur.set_nombre_processus(0)
+
+    def test_memoires_partagees(self) -> None:
+        """Vérifie que les mémoires partagées ouvertes par un processus secondaire sont fermées quand elles ne sont plus utilisées"""
+        memoires = [shared_memory.SharedMemory(create=True, size=64) for i in range(3)]
+        try:
+            ouvrir_memoires_partagees((memoires[0].name, memoires[1].name))
+            self.assertEqual(set(memoires_partagees_ouvertes), {memoires[0].name, memoires[1].name})
+            ouverte = memoires_partagees_ouvertes[memoires[1].name]
+            self.assertIs(ouvrir_memoires_partagees((memoires[2].name, memoires[1].name))[1], ouverte)
+            self.assertEqual(set(memoires_partagees_ouvertes), {memoires[1].name, memoires[2].name})
+            ouvrir_memoires_partagees(())
+            self.assertEqual(memoires_partagees_ouvertes, {})
+        finally:
+            for memoire in memoires:
+                memoire.close()
+                memoire.unlink()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#******************
+#
+# test_raycast_objets.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste que les objets dynamiques sont cachés par les murs plus proches, avec la profondeur de chaque colonne.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import unittest
+from preparation_tests import *
+
+#******************
+#
+# Les tests de la profondeur des objets dynamiques
+#
+#******************
+
+class Test_Raycast_Objets(unittest.TestCase):
+    """Compare des rendus 3D avec un objet dynamique devant ou derrière un pilier"""
+
+    # Prépare la map et la caméra
+    def setUp(self) -> None:
+        """Prépare un moteur de raycast avec un pilier devant la caméra"""
+        self.fenetre = Fenetre(120, 80, True)
+        self.fenetre.charger_texture_chemin_acces("ball", os.path.join(dossier_mlib, "assets/ball.png"))
+        self.moteur = self.fenetre.nouveau_raycast()
+        self.moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+        self.moteur.generer_map_depuis_texte(texte_map_bordee(12, 5, {(5, 2)}))
+        self.moteur.set_nombre_rayons(120)
+        camera = self.moteur.camera()
+        camera.set_x(2.5)
+        camera.set_y(2.5)
+        camera.set_z(0.5)
+        camera.set_rotation_y(0)
+        camera.set_largeur_ecran(120)
+
+    # Effectue le rendu avec un objet à une position X
+    def rendu(self, x_objet: float = -1) -> bytes:
+        """Effectue le rendu 3D, avec la balle à une position X devant la caméra
+
+        Args:
+            x_objet (float, optional): X de la balle (ou -1 pour ne pas avoir de balle). Defaults to -1.
+
+        Returns:
+            bytes: pixels du rendu
+        """
+        if x_objet >= 0:
+            objet = self.moteur.nouvel_objet_dynamique("balle")
+            objet.set_texture_par_nom("ball")
+            objet.set_x(x_objet)
+            objet.set_y(2.5)
+            objet.set_z(0.25)
+        image = pygame.image.tobytes(self.moteur.rendu_3d(), "RGB")
+        if x_objet >= 0: self.moteur.supprimer_objet_dynamique(objet)
+        return image
+
+    def comparer(self, mode_raycast: str) -> None:
+        """Vérifie que la balle est visible devant le pilier, et cachée derrière lui
+
+        Args:
+            mode_raycast (str): mode de raycast testé
+        """
+        self.moteur.set_mode_raycast(mode_raycast)
+        sans_objet = self.rendu()
+        self.assertNotEqual(self.rendu(4), sans_objet)
+        self.assertEqual(self.rendu(7), sans_objet)
+
+    def test_profondeur_classique(self) -> None:
+        """Compare les rendus avec un objet devant ou derrière un pilier, en mode classique"""
+        self.comparer("classique")
+
+    def test_profondeur_lot(self) -> None:
+        """Compare les rendus avec un objet devant ou derrière un pilier, en mode par lot"""
+        if numpy == 0: self.skipTest("le mode par lot nécessite NumPy")
+        self.comparer("lot")
+
+if __name__ == "__main__":
+    unittest.main()
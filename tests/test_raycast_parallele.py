@@ -0,0 +1,117 @@
+#******************
+#
+# test_raycast_parallele.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste le rendu 3D parallèle, qui affiche une frame de retard.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import unittest
+from preparation_tests import *
+
+#******************
+#
+# Les tests du rendu parallèle
+#
+#******************
+
+class Test_Raycast_Parallele(unittest.TestCase):
+    """Déplace la caméra et un objet dynamique dans deux vues identiques, l'une avec le rendu parallèle, et compare leurs images"""
+
+    # Crée une vue de raycast avec son moteur
+    def vue(self, nom: str, x: int) -> tuple:
+        """Crée une vue de raycast de 100 * 80 pixels avec son propre moteur, une map avec quelques piliers et un objet dynamique
+
+        Args:
+            nom (str): nom de la vue
+            x (int): position X de la vue dans la fenêtre
+
+        Returns:
+            tuple: vue et moteur créés
+        """
+        moteur = self.fenetre.nouveau_raycast()
+        moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+        moteur.generer_map_depuis_texte(texte_map_bordee(12, 12, {(3, 3), (8, 4), (5, 8)}))
+        moteur.set_mode_raycast(self.mode_raycast)
+        moteur.set_nombre_rayons(100)
+        moteur.camera().set_largeur_ecran(100)
+        moteur.camera().set_z(0.5)
+        objet = moteur.nouvel_objet_dynamique("balle")
+        objet.set_texture_par_nom("ball")
+        objet.set_z(0.25)
+        vue = self.fenetre.nouvel_enfant(nom, "raycast", x, 0, 100, 80)
+        vue.set_raycast_moteur(moteur)
+        return (vue, moteur)
+
+    # Place la caméra et l'objet dynamique d'un moteur pour une frame
+    def placer(self, moteur: Raycast_Moteur, frame: int) -> None:
+        """Place la caméra et l'objet dynamique d'un moteur selon le numéro de la frame
+
+        Args:
+            moteur (Raycast_Moteur): moteur à modifier
+            frame (int): numéro de la frame
+        """
+        camera = moteur.camera()
+        camera.set_x(2.5 + 0.6 * frame)
+        camera.set_y(6 - 0.2 * frame)
+        camera.set_rotation_y(0.4 * frame)
+        objet = moteur.objets_dynamiques()[0]
+        objet.set_x(camera.x() + 2 * cos(camera.rotation_y()))
+        objet.set_y(camera.y() + 2 * sin(camera.rotation_y()) + 0.1 * frame)
+
+    def comparer(self, mode_raycast: str) -> None:
+        """Vérifie que l'image de la frame k + 1 avec le rendu parallèle est celle de la frame k sans le rendu parallèle
+
+        Args:
+            mode_raycast (str): mode de raycast testé
+        """
+        self.mode_raycast = mode_raycast
+        self.fenetre = Fenetre(200, 80, True)
+        self.fenetre.charger_texture_chemin_acces("ball", os.path.join(dossier_mlib, "assets/ball.png"))
+        vue_sequentielle, moteur_sequentiel = self.vue("sequentielle", 0)
+        vue_parallele, moteur_parallele = self.vue("parallele", 100)
+        vue_parallele.set_rendu_parallele(True)
+
+        # Simuler les frames, en déplaçant la caméra et l'objet de la même manière dans les deux moteurs
+        sequentielles, paralleles = [], []
+        try:
+            for frame in range(8):
+                self.placer(moteur_sequentiel, frame)
+                self.placer(moteur_parallele, frame)
+                self.fenetre.maj_rendu()
+                sequentielles.append(pygame.image.tobytes(self.fenetre.ecran().subsurface((0, 0, 100, 80)), "RGB"))
+                paralleles.append(pygame.image.tobytes(self.fenetre.ecran().subsurface((100, 0, 100, 80)), "RGB"))
+        finally:
+            vue_parallele.set_rendu_parallele(False)
+
+        # La première frame est rendue sans retard, puis chaque frame affiche l'état de la précédente
+        self.assertEqual(len(set(sequentielles)), len(sequentielles))
+        self.assertEqual(paralleles[0], sequentielles[0])
+        for frame in range(1, len(paralleles)): self.assertEqual(paralleles[frame], sequentielles[frame - 1], "la frame " + str(frame) + " n'affiche pas la frame précédente")
+
+    def test_parallele_classique(self) -> None:
+        """Compare les images avec et sans rendu parallèle, en mode classique"""
+        self.comparer("classique")
+
+    def test_parallele_lot(self) -> None:
+        """Compare les images avec et sans rendu parallèle, en mode par lot"""
+        if numpy == 0: self.skipTest("le mode par lot nécessite NumPy")
+        self.comparer("lot")
+
+if __name__ == "__main__":
+    unittest.main()
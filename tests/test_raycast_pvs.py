@@ -0,0 +1,175 @@
+#******************
+#
+# test_raycast_pvs.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste que le PVS (ensemble potentiellement visible) ne change pas le rendu 3D.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import random
+import tempfile
+import unittest
+from preparation_tests import *
+
+#******************
+#
+# Les tests du PVS
+#
+#******************
+
+class Test_Raycast_PVS(unittest.TestCase):
+    """Compare des rendus 3D avec et sans PVS, sur une map avec des piliers éparpillés, des pièces et des objets dynamiques"""
+
+    # Prépare la map et les poses de caméra
+    def setUp(self) -> None:
+        """Prépare le moteur de raycast, sa map et les poses de caméra testées"""
+        if numpy == 0: self.skipTest("le PVS nécessite NumPy")
+        self.fenetre = Fenetre(160, 100, True)
+        self.fenetre.charger_texture_chemin_acces("ball", os.path.join(dossier_mlib, "assets/ball.png"))
+        self.moteur = self.fenetre.nouveau_raycast()
+        self.moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+
+        # Générer une map de 40 * 40 cases, avec des murs de pièces percés de portes et des piliers éparpillés
+        aleatoire = random.Random(1)
+        taille = 40
+        lignes = [["0"] * taille for i in range(taille)]
+        for y in range(taille):
+            for x in range(taille):
+                bord = x in (0, taille - 1) or y in (0, taille - 1)
+                mur_piece = (x == 20 and y % 9 != 4) or (y == 13 and x % 7 != 3)
+                if bord or mur_piece or aleatoire.random() < 0.06: lignes[y][x] = "1"
+        self.moteur.generer_map_depuis_texte("0;0;0;0;" + "-".join("_".join(ligne) for ligne in lignes))
+        cases_vides = [(x + 0.5, y + 0.5) for y in range(taille) for x in range(taille) if lignes[y][x] == "0"]
+
+        # Placer des objets dynamiques dans des cases vides
+        for i, (x, y) in enumerate(aleatoire.sample(cases_vides, 80)):
+            objet = self.moteur.nouvel_objet_dynamique("objet_" + str(i))
+            objet.set_texture_par_nom("ball")
+            objet.set_x(x)
+            objet.set_y(y)
+            objet.set_z(0.25)
+
+        # Choisir les poses de caméra
+        self.poses = []
+        for x, y in aleatoire.sample(cases_vides, 40):
+            self.poses.append((x + aleatoire.uniform(-0.45, 0.45), y + aleatoire.uniform(-0.45, 0.45), aleatoire.uniform(0, 2 * pi)))
+
+    # Effectue le rendu de toutes les poses
+    def rendus(self) -> list:
+        """Effectue le rendu 3D de chaque pose de caméra
+
+        Returns:
+            list: pixels du rendu de chaque pose
+        """
+        images = []
+        for x, y, rotation_y in self.poses:
+            camera = self.moteur.camera()
+            camera.set_x(x)
+            camera.set_y(y)
+            camera.set_z(0.5)
+            camera.set_rotation_y(rotation_y)
+            self.fenetre.maj_evenements()
+            images.append(pygame.image.tobytes(self.moteur.rendu_3d(), "RGB"))
+        return images
+
+    # Compare les rendus avec et sans PVS
+    def comparer_rendus(self, mode_raycast: str) -> None:
+        """Vérifie que le PVS ne change aucun pixel des rendus, par case ou par blocs de cases, et qu'il retire bien des cases
+
+        Args:
+            mode_raycast (str): mode de raycast testé
+        """
+        self.moteur.set_mode_raycast(mode_raycast)
+        self.moteur.set_nombre_rayons(160)
+        self.moteur.camera().set_largeur_ecran(160)
+        sans_pvs = self.rendus()
+        for taille_bloc in (1, 4):
+            self.moteur.calculer_pvs(1, taille_bloc)
+            avec_pvs = self.rendus()
+            for i in range(len(self.poses)): self.assertEqual(sans_pvs[i], avec_pvs[i], "la pose " + str(self.poses[i]) + " change avec le PVS par blocs de " + str(taille_bloc) + " cases")
+
+        # Le PVS doit réellement limiter les cases visibles (les murs des pièces cachent une partie de la map)
+        x, y, rotation_y = self.poses[0]
+        self.assertLess(len(self.moteur.cases_visibles(x, y)), 40 * 40)
+
+    def test_pvs_classique(self) -> None:
+        """Compare les rendus avec et sans PVS, en mode classique"""
+        self.comparer_rendus("classique")
+
+    def test_pvs_lot(self) -> None:
+        """Compare les rendus avec et sans PVS, en mode par lot"""
+        self.comparer_rendus("lot")
+
+    def test_pvs_fichier(self) -> None:
+        """Vérifie que le PVS d'une map chargée depuis un fichier est gardé à côté d'elle, et recalculé quand la map change"""
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin_map = os.path.join(dossier, "map.txt")
+            with open(chemin_map, "w") as fichier: fichier.write(texte_map_bordee(12, 10, {(4, 4), (6, 2)}))
+            self.moteur.generer_map_depuis_texte_chemin_acces(chemin_map, True)
+            self.assertTrue(os.path.exists(chemin_map + ".pvs.npz"))
+            visibles = self.moteur.cases_visibles(2.5, 2.5).tolist()
+
+            # Un autre moteur lit le fichier sans le réécrire
+            os.utime(chemin_map + ".pvs.npz", (0, 0))
+            moteur = self.fenetre.nouveau_raycast()
+            moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+            moteur.generer_map_depuis_texte_chemin_acces(chemin_map, True)
+            self.assertEqual(os.path.getmtime(chemin_map + ".pvs.npz"), 0)
+            self.assertEqual(moteur.cases_visibles(2.5, 2.5).tolist(), visibles)
+
+            # Une map modifiée a un nouveau PVS
+            with open(chemin_map, "w") as fichier: fichier.write(texte_map_bordee(12, 10, {(4, 4), (6, 2), (3, 2)}))
+            moteur.generer_map_depuis_texte_chemin_acces(chemin_map, True)
+            self.assertNotEqual(os.path.getmtime(chemin_map + ".pvs.npz"), 0)
+
+class Test_Raycast_PVS_Transparent(unittest.TestCase):
+    """Vérifie que le PVS respecte le nombre maximum de cases transparentes touchées par un rayon"""
+
+    def test_collisions_transparentes_maximum(self) -> None:
+        """Vérifie qu'aucune colonne ne garde plus de cases transparentes que le maximum, avec le PVS"""
+        if numpy == 0: self.skipTest("le PVS nécessite NumPy")
+        fenetre = Fenetre(80, 60, True)
+        moteur = fenetre.nouveau_raycast()
+        moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+
+        # Générer une map de 16 * 16 cases, avec des murets bas tous les deux rangs
+        taille = 16
+        moteur.generer_map_depuis_texte("0;0;0;0;" + "-".join("_".join("1" if x in (0, taille - 1) or y in (0, taille - 1) else "0" for x in range(taille)) for y in range(taille)))
+        for y in range(3, taille - 1, 2):
+            for x in range(1, taille - 1): moteur.modifier_case(x, y, 1, 0.25)
+        moteur.set_collisions_transparentes_maximum(2)
+        moteur.calculer_pvs()
+
+        # Regarder à travers les murets, depuis une caméra plus haute qu'eux
+        camera = moteur.camera()
+        camera.set_x(8.5)
+        camera.set_y(1.5)
+        camera.set_z(0.5)
+        camera.set_rotation_y(pi / 2)
+        camera.set_largeur_ecran(80)
+        self.assertGreater(len(moteur.cases_visibles(8.5, 1.5)), 0)
+        raycasts = moteur.raycast_entier(80, 0, 80)
+        cases, offsets_x = raycasts.tampon().cases(), raycasts.tampon().offsets_x()
+        for rayon in raycasts.rayons():
+            transparentes = {}
+            for indice in rayon.indices_collisions():
+                if cases[indice].hauteur() < camera.z(): transparentes[offsets_x[indice]] = transparentes.get(offsets_x[indice], 0) + 1
+            self.assertLessEqual(max(transparentes.values(), default=0), 2)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
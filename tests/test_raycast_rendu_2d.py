@@ -0,0 +1,93 @@
+#******************
+#
+# test_raycast_rendu_2d.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste que la couche gardée des cases du rendu 2D suit les modifications de la map.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import unittest
+from preparation_tests import *
+
+#******************
+#
+# Les tests du rendu 2D
+#
+#******************
+
+class Test_Raycast_Rendu_2D(unittest.TestCase):
+    """Compare le rendu 2D d'un moteur dont la map est modifiée avec celui d'un moteur chargé directement avec la map modifiée"""
+
+    # Crée un moteur avec une map
+    def moteur(self, cases_pleines: set) -> Raycast_Moteur:
+        """Crée un moteur de raycast avec une map de 10 * 8 cases, et sa caméra au centre
+
+        Args:
+            cases_pleines (set): cases (x, y) pleines en plus des bords
+
+        Returns:
+            Raycast_Moteur: moteur créé
+        """
+        moteur = self.fenetre.nouveau_raycast()
+        moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+        moteur.nouveau_materiel(2).set_couleur_2d((0, 0, 180))
+        moteur.generer_map_depuis_texte(texte_map_bordee(10, 8, cases_pleines))
+        moteur.camera().set_x(5.5)
+        moteur.camera().set_y(4.5)
+        moteur.camera().set_largeur_ecran(40)
+        moteur.set_nombre_rayons(40)
+        return moteur
+
+    def test_modifier_case(self) -> None:
+        """Vérifie que la couche des cases est redessinée après "modifier_case", et seulement dans ce cas"""
+        self.fenetre = Fenetre(200, 160, True)
+        moteur = self.moteur({(3, 3)})
+        avant = pygame.image.tobytes(moteur.rendu_2d(), "RGB")
+        self.assertEqual(pygame.image.tobytes(moteur.rendu_2d(), "RGB"), avant)
+
+        # Vider une case et en remplir une autre
+        moteur.modifier_case(3, 3, 0)
+        moteur.modifier_case(7, 5, 1)
+        surface = moteur.rendu_2d()
+        self.assertEqual(surface.get_at((3 * 20 + 10, surface.get_height() - 3 * 20 + 10))[:3], (0, 0, 0))
+        self.assertEqual(surface.get_at((7 * 20 + 10, surface.get_height() - 5 * 20 + 10))[:3], (180, 0, 0))
+        self.assertEqual(pygame.image.tobytes(surface, "RGB"), pygame.image.tobytes(self.moteur({(7, 5)}).rendu_2d(), "RGB"))
+
+    def test_couleur_materiel(self) -> None:
+        """Vérifie que la couche des cases est redessinée quand la couleur 2D d'un matériel change"""
+        self.fenetre = Fenetre(200, 160, True)
+        moteur = self.moteur({(3, 3)})
+        moteur.rendu_2d()
+        moteur.materiel_par_id(1).set_couleur_2d((0, 180, 0))
+        surface = moteur.rendu_2d()
+        self.assertEqual(surface.get_at((3 * 20 + 10, surface.get_height() - 3 * 20 + 10))[:3], (0, 180, 0))
+
+    def test_rayons_camera_deplacee(self) -> None:
+        """Vérifie que les rayons gardés d'un rendu 3D ne sont plus utilisés quand la caméra a bougé depuis ce rendu"""
+        self.fenetre = Fenetre(200, 160, True)
+        moteur = self.moteur({(3, 3), (7, 5)})
+        moteur.rendu_3d()
+        moteur.camera().set_x(3.5)
+        moteur.camera().set_rotation_y(2)
+        attendu = self.moteur({(3, 3), (7, 5)})
+        attendu.camera().set_x(3.5)
+        attendu.camera().set_rotation_y(2)
+        self.assertEqual(pygame.image.tobytes(moteur.rendu_2d(), "RGB"), pygame.image.tobytes(attendu.rendu_2d(), "RGB"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#******************
+#
+# test_raycast_resolution.py
+#
+#******************
+# Presentation :
+#
+# MLib Super est la dernière version du problej "MLib".
+# Elle est réalisé pour le projet "Trophées NSI", pour faciliter la création de Software.
+#
+# Ce fichier teste la résolution dynamique du rendu 3D de Raycast_Fenetre.
+#
+#******************
+#
+# License (GPL V3.0) :
+#
+# Copyright (C) 2024 par Mattéo.
+# This file is part of MLib Super.
+# MLib Super is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+# MLib Super is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with MLib Super. If not, see <https:#www.gnu.org/licenses/>.
+#
+
+import unittest
+from preparation_tests import *
+
+#******************
+#
+# Les tests de la résolution dynamique
+#
+#******************
+
+class Test_Raycast_Resolution(unittest.TestCase):
+    """Simule des frames lentes puis rapides, et vérifie la largeur du rendu 3D et le nombre de rayons"""
+
+    # Prépare la fenêtre et sa vue de raycast
+    def setUp(self) -> None:
+        """Prépare une fenêtre avec une vue de raycast de 320 pixels de large"""
+        self.fenetre = Fenetre(320, 200, True)
+        self.moteur = self.fenetre.nouveau_raycast()
+        self.moteur.nouveau_materiel(1).set_couleur_2d((180, 0, 0))
+        self.moteur.generer_map_depuis_texte(texte_map_bordee(8, 8))
+        self.moteur.camera().set_x(4.5)
+        self.moteur.camera().set_y(4.5)
+        self.moteur.camera().set_largeur_ecran(320)
+        self.moteur.set_nombre_rayons(160)
+        self.vue = self.fenetre.nouvel_enfant("vue", "raycast", 0, 0, 320, 200)
+        self.vue.set_raycast_moteur(self.moteur)
+        self.vue.set_budget_frame(1 / 60.0)
+
+    # Simule des frames d'une certaine durée
+    def frames(self, duree: float, nombre: int = 10) -> None:
+        """Simule des frames d'une certaine durée
+
+        Args:
+            duree (float): durée de chaque frame en secondes
+            nombre (int, optional): nombre de frames. Defaults to 10.
+        """
+        for i in range(nombre):
+            self.fenetre.set_delta_time(duree)
+            self.fenetre.maj_rendu()
+
+    def test_resolution_dynamique(self) -> None:
+        """Vérifie que la résolution baisse au dessus du budget, remonte en dessous, et revient au maximum à la désactivation"""
+        camera = self.moteur.camera()
+
+        # Des frames trop lentes baissent la largeur de 20% (arrondie à 16 pixels), et le nombre de rayons autant
+        self.frames(0.1)
+        self.assertEqual(camera.largeur_ecran(), 256)
+        self.assertEqual(camera.nombre_rayons(), 128)
+        self.frames(0.1)
+        self.assertEqual(camera.largeur_ecran(), 208)
+
+        # Des frames dans le budget ne changent rien
+        self.frames(0.9 / 60.0)
+        self.assertEqual(camera.largeur_ecran(), 208)
+
+        # Des frames rapides remontent la largeur, sans dépasser celle de l'activation
+        self.frames(0.001, 30)
+        self.assertEqual(camera.largeur_ecran(), 320)
+        self.assertEqual(camera.nombre_rayons(), 160)
+
+        # La largeur ne descend pas sous le minimum, et revient au maximum à la désactivation
+        self.vue.set_largeur_ecran_minimum(160)
+        self.frames(0.1, 100)
+        self.assertEqual(camera.largeur_ecran(), 160)
+        self.vue.set_budget_frame(0)
+        self.assertEqual(camera.largeur_ecran(), 320)
+        self.assertEqual(camera.nombre_rayons(), 0)
+        self.assertEqual(self.moteur.nombre_rayons(), 160)
+
+if __name__ == "__main__":
+    unittest.main()